@@ -1,6 +1,6 @@
 import time
 import pygame
-from queue import PriorityQueue
+from slidingPuzzle import solvePuzzle, validateBoard
 
 # Define constants
 WIDTH = 200
@@ -15,73 +15,16 @@ GRAY = (128, 128, 128)
 # Define the goal state
 GOAL_STATE = [[1, 2], [3, 0]]
 
-# Define the heuristic function
-
-
-def heuristic(state):
-    distance = 0
-    for i in range(2):
-        for j in range(2):
-            if state[i][j] != 0:
-                x, y = divmod(state[i][j]-1, 2)
-                distance += abs(x-i) + abs(y-j)
-    return distance
-
-# Define the node class
-
-
-class Node:
-    def __init__(self, state, g=0, parent=None):
-        self.state = state
-        self.g = g
-        self.h = heuristic(state)
-        self.parent = parent
-
-    def f(self):
-        return self.g + self.h
-
-# Define the possible moves
-
-
-def moves(state):
-    i, j = next((i, j) for i in range(2) for j in range(2) if state[i][j] == 0)
-    for di, dj in ((0, 1), (1, 0), (0, -1), (-1, 0)):
-        if 0 <= i+di < 2 and 0 <= j+dj < 2:
-            new_state = [row[:] for row in state]
-            new_state[i][j], new_state[i+di][j +
-                                             dj] = new_state[i+di][j+dj], new_state[i][j]
-            yield new_state
-
-# Define the A* search algorithm
-
-
-def a_star(start):
-    queue = PriorityQueue()
-    queue.put((start.f(), start))
-    visited = set()
-    while not queue.empty():
-        f, node = queue.get()
-        if node.state == GOAL_STATE:
-            path = []
-            while node.parent:
-                path.append(node.state)
-                node = node.parent
-            path.append(start.state)
-            return path[::-1]
-        visited.add(tuple(map(tuple, node.state)))
-        for move in moves(node.state):
-            if tuple(map(tuple, move)) not in visited:
-                child = Node(move, node.g+1, node)
-                queue.put((child.f(), child))
-
-# Define the puzzle solver function
+# Define the puzzle solver function, the search is done by the shared engine in slidingPuzzle.py
 
 
 def solve_puzzle(start_state):
+    # Reject malformed boards and boards of another size, unsolvable ones return None without searching
+    validateBoard(start_state)
+    if len(start_state) != 2 or len(start_state[0]) != 2:
+        raise ValueError("The board must have 2 rows and 2 columns")
     # Solve the puzzle
-    start = Node(start_state)
-    path = a_star(start)
-    return path
+    return solvePuzzle(start_state, mode='astar')
 
 
 # Initialize Pygame
@@ -127,6 +70,12 @@ def main():
     # Solve the puzzle
     path = solve_puzzle(start_state)
 
+    # Check if a solution was found
+    if path:
+        print("Solution found!")
+    else:
+        print("No solution found.")
+        path = [start_state]
     # Animate the path
     for state in path:
         screen.fill(WHITE)
@@ -134,11 +83,6 @@ def main():
         pygame.display.flip()
         time.sleep(1)  # Wait for 1 seconds before moving to the next step
         clock.tick(FPS)
-    # Check if a solution was found
-    if path:
-        print("Solution found!")
-    else:
-        print("No solution found.")
     # Wait for the user to close the window
     while True:
         for event in pygame.event.get():
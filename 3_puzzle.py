@@ -9,7 +9,7 @@ The objective of the game is to rearrange the tiles from their initial scrambled
 '''
 import time
 import pygame
-from queue import PriorityQueue
+from slidingPuzzle import solvePuzzle, validateBoard
 
 # Constants for visual presentation of the game.
 WIDTH = 600
@@ -25,144 +25,20 @@ GREEN = (69, 139, 116)
 GOAL_STATE = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
 
 
-def heuristicManhattan(state):
-    '''
-    This function computes the Manhattan distance heuristicManhattan for the given state.
-    It takes a 2D list representing the puzzle state as input and returns an integer representing the heuristic cost. 
-    The time complexity of this function is O(n^2) where n is the size of the puzzle state.
-    The space complexity of this function is O(1).
-    '''
-    distance = 0  # This variable will be used to keep track of the Manhattan distance heuristic of the given puzzle state.
-    # These nested loops iterate over each element of the 2D list state, from state[0][0] to state[2][2]
-    for i in range(3):
-        for j in range(3):
-            if state[i][j] != 0:  # This code block checks if the current element of the 2D list state is not equal to zero. If the element is not equal to zero, it means that the current tile is not the empty tile, and we need to compute its Manhattan distance heuristic.
-                # Index represents the position of the tile in a flattened representation of the puzzle state.
-                index = state[i][j] - 1
-                goalRow = index // 3  # Goal row of the tile
-                goalCol = index % 3  # Goal column of the tile
-                # This line calculates the Manhattan distance between the current tile's current position and its goal position using the row and column indices calculated in the previous line.
-                # The Manhattan distance is the absolute difference between the row indices plus the absolute difference between the column indices.
-                distance += abs(goalRow - i) + abs(goalCol - j)
-    return distance  # Total Manhattan distance heuristic for the puzzle state
-
-
-class Node:
-    '''
-    This class represents a node in the search tree.
-    '''
-
-    def __init__(self, state, g=0, parent=None):
-        '''
-        The __init__ method is the constructor for the Node class. It takes three parameters: state, g, and parent. 
-        The state parameter represents the current state of the problem being solved, typically represented as a 2D list in this context. 
-        The g parameter represents the cost to reach the current state, 
-        and the parent parameter is a reference to the parent node in the search tree. 
-        If this node is the root node, then the parent parameter should be set to None.
-        The time complexity is O(1), and the space complexity is O(n^2)
-        '''
-        self.state = state  # current state
-        self.g = g  # cost to reach current state
-        self.h = heuristicManhattan(state)  # estimated cost
-        self.parent = parent  # parent node
-
-    def f(self):
-        '''
-        The f method returns the sum of g and h, where h is the estimated cost to reach the goal state using the heuristic function. 
-        This is the cost function used by the search algorithm to determine which nodes to explore first.
-        The time complexity is O(1), and the space complexity is O(1)
-        '''
-        return self.g + self.h
-
-    def __lt__(self, another):
-        '''
-        The compare method is used to define the comparison operator for Node objects. With this objects using the < operator.
-        It returns True if the f value of this node is less than the f value of the another node. 
-        This is used to maintain a priority queue of nodes to explore, where nodes with lower f values are explored first. 
-        The time complexity is O(1), and the space complexity is O(1)
-        '''
-        return self.f() < another.f()
-
-
-def moves(state):
-    '''
-    This function generates all possible moves that can be made from a given state in the 8-Puzzle Problem. 
-    It takes a 2D list representing the puzzle state as input and returns a list of all possible successor states.
-    Time complexity is still O(n^2). Space complexity is O(n^2) because the function creates a new 3x3 matrix for each possible move.
-    '''
-    i = None
-    j = None
-    # In nested loop the program fins the row i row i and column j of the empty cell represented by 0 in the puzzle.
-    for i in range(3):
-        for j in range(3):
-            if state[i][j] == 0:
-                break
-        if state[i][j] == 0:
-            break
-    # This line initializes an empty list called possibleMoves to store the new states that can be reached by moving the empty cell in different directions.
-    possibleMoves = []
-    # This line iterates over each pair (di, dj) in the tuple ((0, 1), (1, 0), (0, -1), (-1, 0)). Each pair represents a direction in which the empty cell can be moved: right, down, left, or up.
-    for di, dj in ((0, 1), (1, 0), (0, -1), (-1, 0)):
-        # This line checks if the empty cell can be moved in the direction represented by the current pair (di, dj) without going out of bounds. It checks that the new row i+di and column j+dj are both between 0 and 2, which are the valid indices of the puzzle.
-        if 0 <= i+di < 3 and 0 <= j+dj < 3:
-            # This loop creates a new copy of the state list that copies each row.
-            new_state = []
-            for row in state:
-                new_row = []
-                for element in row:
-                    new_row.append(element)
-                new_state.append(new_row)
-            # This line swaps the values of the empty cell (at index (i, j)) with the value of the cell in the direction represented by the current pair (di, dj) (at index (i+di, j+dj)). This creates a new state that is the result of moving the empty cell in the given direction.
-            new_state[i][j], new_state[i+di][j + dj] = new_state[i+di][j+dj], new_state[i][j]
-            # This line appends the new state (i.e., the result of moving the empty cell in the given direction) to the list of possibleMoves.
-            possibleMoves.append(new_state)
-    # Finally, the function returns the list of possibleMoves, which contains all the new states that can be reached by moving the empty cell in different directions.
-    return possibleMoves
-
-
-def a_star(start):
-    '''
-    This function implements the A* search algorithm.
-    It takes a start node as input and returns the path from the start state to the goal state if a solution is found, otherwise returns None.
-    The function uses a priority queue to keep track of the frontier and a set to keep track of the visited nodes.
-    The time complexity of this function is O(b^d) where b is the branching factor (which is at most 4 here), d is the maximum depth of the search tree, 
-    and d can be up to the maximum number of moves required to solve the puzzle from the start state.
-    The space complexity of this function is also O(b^d) to store the frontier and the visited nodes.
-    '''
-    queue = PriorityQueue()  # These lines initialize a priority queue, queue, which is used to keep track of the nodes on the frontier.
-    queue.put((start.f(), start)) # The start node is added to the queue with its f-score as the priority value.
-    visited = set() # The visited set is used to keep track of the nodes that have already been visited.
-    # This is the main loop of the algorithm. It continues until the queue is empty, meaning that there are no more nodes to explore. 
-    while not queue.empty():
-        f, node = queue.get() # The node with the lowest f-score is removed from the queue and assigned to the node variable.
-        if node.state == GOAL_STATE:  # If the current node is the goal state, a solution has been found.
-            path = [] #
-            while node.parent: # The function constructs a path from the start state to the goal state by tracing back through the parent nodes of each node in the path. 
-                path.append(node.state) 
-                node = node.parent
-            path.append(start.state)
-            return path[::-1] # The path is returned in reverse order, starting from the start state.
-        # If the current node is not the goal state, the function adds the state of the node to the visited set.
-        visited.add(tuple(map(tuple, node.state)))
-        # The function generates all possible moves from the current state using the moves function, and for each move, it creates a new child node.
-        for move in moves(node.state):
-            if tuple(map(tuple, move)) not in visited: #If the state of the child node has not already been visited
-                child = Node(move, node.g+1, node) # assigning move (state), cost to reach the child node from the start node, and node as parent node
-                queue.put((child.f(), child)) # the child node is added to the priority queue with its f-score as the priority value
-
-
 def solve_puzzle(start_state):
     '''
-    This function solves the puzzle from the given start state using the A* search algorithm.
+    This function solves the puzzle from the given start state with the A* search of the shared sliding-puzzle engine (slidingPuzzle.py),
+    which keeps the packed states, neighbour tables and Manhattan distance tables of the 3x3 shape.
     It takes a 2D list representing the start state as input and returns the path from the start state to the goal state if a solution is found, otherwise returns None.
-    This function creates a Node object from the given start_state and passes it to a_star() to solve the puzzle.
-    The time and space complexity of this function is the same as the a_star function.
+    A malformed start_state raises a ValueError, and an unsolvable one returns None right away without searching.
+    The time and space complexity of this function is the same as the aStarSearch function of the engine.
     The time complexity of this function is O(b^d).
     The space complexity of this function is O(b^d).
     '''
-    start = Node(start_state)  # This line creates a Node object from the given start_state by calling the Node class constructor with start_state as the state parameter. The g and parent parameters are not specified, so they default to 0 and None respectively.
-    path = a_star(start)  # The path variable is assigned the result of this function call.
-    return path # This line returns the path variable, which contains either the optimal path from the start state to the goal state or None if a solution is not found.
+    validateBoard(start_state)  # This line raises a ValueError if the start_state is not a board with each number from 0 to N*M-1 exactly once.
+    if len(start_state) != 3 or len(start_state[0]) != 3:  # This solver only handles the 3x3 board.
+        raise ValueError("The board must have 3 rows and 3 columns")
+    return solvePuzzle(start_state, mode='astar') # The path contains either the optimal path from the start state to the goal state or None if a solution is not found.
 
 
 # Initialize Pygame
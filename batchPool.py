@@ -0,0 +1,41 @@
+'''
+This module has the input and scheduling parts shared by the batch solvers puzzleBatch.py and sudokuBatch.py:
+the input lines are grouped into chunks, and the chunks are solved by a process pool with only a few of them in flight,
+so a file of millions of puzzles is read as the results are consumed and never sits in memory.
+'''
+
+from collections import deque
+
+
+def readChunks(lines, chunkSize):
+    '''
+    This function groups the numbered non-empty lines that are not comments into lists of chunkSize (line number, line) pairs.
+    Time complexity: O(n) Linear in the number of lines.
+    Space complexity: O(c) for one chunk.
+    '''
+    chunk = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if line and not line.startswith('#'):
+            chunk.append((number, line))
+            if len(chunk) == chunkSize:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def solveChunks(executor, function, chunks, workers, *args):
+    '''
+    This function submits function(chunk, *args) for every chunk to a concurrent.futures executor and yields the items of the lists it returns, in input order.
+    At most 4 chunks per worker are submitted ahead of the results, the next chunk is only read once the oldest one is done.
+    Time complexity: O(k) for k chunks, plus the work of the function.
+    Space complexity: O(w * c) for the chunks in flight.
+    '''
+    pending = deque() # Futures of the submitted chunks, in input order
+    for chunk in chunks:
+        pending.append(executor.submit(function, chunk, *args))
+        if len(pending) >= 4 * workers: # Wait for the oldest chunk before reading more input
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
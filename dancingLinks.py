@@ -0,0 +1,254 @@
+'''
+This module solves Sudoku puzzles as exact cover problems with Knuth's Algorithm X and Dancing Links.
+An exact cover problem is a 0/1 matrix in which a set of rows must be chosen so that every column has a 1 in exactly one chosen row.
+For Sudoku the rows are the 729 placements (a digit in a cell) and the 324 columns are the constraints: each cell has one digit,
+and each row, column and box has each digit once. The matrix is stored as circular doubly linked lists of its 1s, one list per row and per column,
+so covering a column (removing it and every row that uses it) and uncovering it again only relink a few nodes.
+The links are kept in flat lists of ints indexed by node number instead of one object per node, which is both smaller and faster in Python.
+The search always branches on the column with the fewest rows left, so its performance does not depend on how the puzzle was made,
+and it can count the solutions up to a limit, which tells whether a puzzle has a unique solution.
+Usage: python dancingLinks.py
+'''
+
+from typing import List
+
+from sudokuSolver import ALL_DIGITS, BOX_OF, COL_OF, ROW_OF, UNITS_OF, boardToCells, cellsToBoard
+
+# Number of columns of the Sudoku matrix: 81 cells, then 81 (row, digit), 81 (column, digit) and 81 (box, digit) constraints.
+SUDOKU_COLUMNS = 324
+
+
+class DancingLinks:
+    '''
+    This class is an exact cover matrix in Dancing Links form, searched with Algorithm X.
+    Node 0 is the root, nodes 1 to columns are the column headers and the other nodes are the 1s of the matrix.
+    left, right, up and down are the links of every node, column the header of every node and rowOf the name of the row of every node (-1 for the headers).
+    '''
+
+    def __init__(self, columns: int, rows: List[List[int]], names: List[int] = None):
+        '''
+        The __init__ method builds the links of a matrix with the given number of columns, rows being the list of the columns of the 1s of every row.
+        names are the numbers the rows are known by in the solutions, their index in rows if not given.
+        Time Complexity: O(c + m) for c columns and m 1s.
+        Space Complexity: O(c + m)
+        '''
+        self.left = [column - 1 for column in range(columns + 1)]
+        self.right = [column + 1 for column in range(columns + 1)]
+        self.left[0], self.right[columns] = columns, 0 # The headers are a circular list through the root
+        self.up = list(range(columns + 1))
+        self.down = list(range(columns + 1))
+        self.column = list(range(columns + 1))
+        self.rowOf = [-1] * (columns + 1)
+        self.size = [0] * (columns + 1) # Number of 1s left in each column
+        self.updates = 0 # Links changed by cover, Knuth's measure of the work of the search
+        for number, row in enumerate(rows):
+            first = len(self.column)
+            for column in row:
+                node = len(self.column)
+                self.column.append(column + 1)
+                self.rowOf.append(number if names is None else names[number])
+                self.up.append(self.up[column + 1]) # Added at the bottom of the column
+                self.down.append(column + 1)
+                self.down[self.up[column + 1]] = node
+                self.up[column + 1] = node
+                self.left.append(node - 1 if node > first else node)
+                self.right.append(first)
+                self.right[self.left[node]] = node
+                self.left[first] = node
+                self.size[column + 1] += 1
+
+    def cover(self, column):
+        '''
+        This method removes a column from the header list and every row that has a 1 in it from the other columns.
+        Time Complexity: O(k) for the k nodes of those rows.
+        Space Complexity: O(1)
+        '''
+        left, right, up, down, columnOf, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[column]] = right[column]
+        left[right[column]] = left[column]
+        i = down[column]
+        while i != column:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[columnOf[j]] -= 1
+                self.updates += 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, column):
+        '''
+        This method undoes cover(column), relinking the nodes in the reverse order.
+        Time Complexity: O(k) for the k nodes of the rows of the column.
+        Space Complexity: O(1)
+        '''
+        left, right, up, down, columnOf, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[column]
+        while i != column:
+            j = left[i]
+            while j != i:
+                size[columnOf[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[column]] = column
+        left[right[column]] = column
+
+    def select(self, row):
+        '''
+        This method puts the row with the given name in the solution before the search, covering all its columns. It returns False if one of them is already covered,
+        which means that the row conflicts with a row selected before and the matrix has no solution anymore.
+        Time Complexity: O(k) for the nodes covered.
+        Space Complexity: O(1)
+        '''
+        node = self.rowOf.index(row)
+        j = node
+        while True:
+            column = self.column[j]
+            if self.right[self.left[column]] != column: # Not in the header list anymore
+                return False
+            self.cover(column)
+            j = self.right[j]
+            if j == node:
+                return True
+
+    def search(self, limit=1):
+        '''
+        This method runs Algorithm X and returns the list of the solutions found, at most limit of them, each a list of row names.
+        It always branches on the column with the fewest 1s left, and a column with none is a dead end. The matrix is left as it was.
+        Time Complexity: O(b^d) Exponential at worst, for d rows in a solution.
+        Space Complexity: O(d) for the recursion and the partial solution, plus the solutions.
+        '''
+        right, down, columnOf, size, rowOf = self.right, self.down, self.column, self.size, self.rowOf
+        solutions = []
+        partial = []
+
+        def recurse():
+            if right[0] == 0: # Every column is covered: the partial solution is a solution
+                solutions.append(list(partial))
+                return
+            best, column = size[right[0]] + 1, right[0]
+            j = right[0]
+            while j:
+                if size[j] < best:
+                    best, column = size[j], j
+                    if best <= 1: # Cannot do better than a forced move
+                        break
+                j = right[j]
+            if not best:
+                return
+            self.cover(column)
+            r = down[column]
+            while r != column and len(solutions) < limit:
+                partial.append(rowOf[r])
+                j = right[r]
+                while j != r:
+                    self.cover(columnOf[j])
+                    j = right[j]
+                recurse()
+                j = self.left[r]
+                while j != r:
+                    self.uncover(columnOf[j])
+                    j = self.left[j]
+                partial.pop()
+                r = down[r]
+            self.uncover(column)
+
+        recurse()
+        return solutions
+
+
+def sudokuMatrix(cells: List[int]) -> DancingLinks:
+    '''
+    This function returns the exact cover matrix of a flat Sudoku board with the givens already selected.
+    The row named cell*9 + digit-1 places the digit in the cell, only the placements allowed by the givens are added.
+    It raises a ValueError if a digit is given twice in a row, column or box.
+    Time Complexity: O(n^2 * 9) for the 729 placements at most.
+    Space Complexity: O(n^2 * 9)
+    '''
+    missing = [ALL_DIGITS] * 27 # Digits not given in each unit
+    for cell, digit in enumerate(cells):
+        if digit:
+            bit = 1 << (digit - 1)
+            if any(not missing[unit] & bit for unit in UNITS_OF[cell]):
+                raise ValueError("The digit %d is given twice in the row, column or box of cell (%d, %d)" % (digit, ROW_OF[cell], COL_OF[cell]))
+            for unit in UNITS_OF[cell]:
+                missing[unit] &= ~bit
+    rows = []
+    names = [] # Placement of every row of the matrix
+    for cell, digit in enumerate(cells):
+        row, col, box = UNITS_OF[cell]
+        allowed = 1 << (digit - 1) if digit else missing[row] & missing[col] & missing[box]
+        for d in range(9):
+            if allowed >> d & 1:
+                names.append(cell * 9 + d)
+                rows.append([cell, 81 + ROW_OF[cell] * 9 + d, 162 + COL_OF[cell] * 9 + d, 243 + BOX_OF[cell] * 9 + d])
+    matrix = DancingLinks(SUDOKU_COLUMNS, rows, names)
+    for cell, digit in enumerate(cells): # The givens are in every solution
+        if digit:
+            matrix.select(cell * 9 + digit - 1)
+    return matrix
+
+
+def solveCells(cells: List[int], limit=1) -> List[List[int]]:
+    '''
+    This function returns the solutions of a flat Sudoku board, at most limit of them, each a flat list of 81 digits.
+    Time Complexity: O(b^d) Exponential at worst.
+    Space Complexity: O(n^2 * 9) for the matrix.
+    '''
+    solutions = []
+    for placements in sudokuMatrix(cells).search(limit):
+        solution = list(cells)
+        for placement in placements:
+            cell, d = divmod(placement, 9)
+            solution[cell] = d + 1
+        solutions.append(solution)
+    return solutions
+
+
+def countSolutions(board: List[List[str]], limit=2) -> int:
+    '''
+    This function returns the number of solutions of a Sudoku board of strings, counting at most limit of them.
+    With the default limit of 2 it tells whether the solution is unique (1), not unique (2) or missing (0).
+    Time Complexity: O(b^d) Exponential at worst.
+    Space Complexity: O(n^2 * 9)
+    '''
+    return len(solveCells(boardToCells(board), limit))
+
+
+def solveBoard(board: List[List[str]]) -> bool:
+    '''
+    This function solves a Sudoku board of strings in place and returns True, or returns False if it has no solution.
+    Time Complexity: O(b^d) Exponential at worst.
+    Space Complexity: O(n^2 * 9)
+    '''
+    solutions = solveCells(boardToCells(board))
+    if not solutions:
+        return False
+    for i, row in enumerate(cellsToBoard(solutions[0])):
+        board[i][:] = row
+    return True
+
+
+def main():
+    '''
+    This function solves a hard puzzle with Dancing Links, prints the solution and the number of links changed, and counts the solutions of a puzzle with a missing given.
+    Time Complexity: O(b^d) Exponential at worst.
+    Space Complexity: O(n^2 * 9)
+    '''
+    puzzle = "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......"
+    board = [list(puzzle[i * 9:(i + 1) * 9]) for i in range(9)]
+    matrix = sudokuMatrix(boardToCells(board))
+    print("Solutions:", len(matrix.search(limit=2)), "after", matrix.updates, "link updates")
+    board[0][0] = '.' # Without this given the puzzle has several solutions
+    print("Solutions without the first given (at most 10 counted):", countSolutions(board, limit=10))
+    board[0][0] = '4'
+    solveBoard(board)
+    for row in board:
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+'''
+This module builds and loads the complete distance table of a small sliding puzzle, the 8-Puzzle (3x3) has only 181,440 reachable states.
+A breadth-first search from the goal state stores the optimal number of moves of every state in a byte array indexed by the rank (Lehmer code) of the permutation
+of its tiles. The table is saved to a file once and memory-mapped afterwards, so solving a start state is a walk down the table with no search:
+from each state, move to the neighbour whose distance is one less.
+The table has s! entries for s cells, so it is only built in memory up to MAX_CELLS cells (3x3, 2x4, 4x2, 2x3, 3x2, 2x2).
+The table files of larger boards can be built on disk with externalSearch.buildTableFile, and are loaded the same way once they exist.
+Usage: python distanceTable.py [ROWS COLS]
+'''
+
+import mmap
+import os
+import sys
+import time
+
+from patternDatabase import DATABASE_DIRECTORY
+from slidingPuzzle import getShape, permutationCount, rankPositions
+
+# Value of the states that cannot be reached from the goal state (the unsolvable half of the permutations).
+UNREACHABLE = 255
+
+# Largest number of cells of a board whose table is built by buildDistanceTable, 9! bytes.
+MAX_CELLS = 9
+
+
+def tablePath(shape, directory=DATABASE_DIRECTORY):
+    '''
+    This function returns the file name of the distance table of a shape, for example pdb/3x3.dist.
+    Time complexity: O(1) Constant.
+    Space complexity: O(1) Constant.
+    '''
+    return os.path.join(directory, '%dx%d.dist' % (shape.rows, shape.cols))
+
+
+def rankState(shape, state):
+    '''
+    This function returns the rank of a packed state: the Lehmer code of its tiles read in row-major order, a number from 0 to s!-1.
+    Time complexity: O(s) Linear.
+    Space complexity: O(s) Linear.
+    '''
+    bits, mask = shape.bits, shape.mask
+    return rankPositions([(state >> (bits * cell)) & mask for cell in range(shape.size)], shape.size)
+
+
+def buildDistanceTable(shape):
+    '''
+    This function runs a breadth-first search from the goal state and returns a bytearray with the optimal distance of every state, indexed by rankState.
+    It raises a ValueError for a board of more than MAX_CELLS cells.
+    Time complexity: O(s! * s) for the reachable states and their ranks.
+    Space complexity: O(s!) for the table and the largest layer.
+    '''
+    if shape.size > MAX_CELLS:
+        raise ValueError("The distance table of a %dx%d board is too large to build in memory, build it with externalSearch.buildTableFile"
+                         % (shape.rows, shape.cols))
+    bits, mask, neighbours = shape.bits, shape.mask, shape.neighbours
+    table = bytearray([UNREACHABLE]) * permutationCount(shape.size, shape.size)
+    table[rankState(shape, shape.goal)] = 0
+    layer = [(shape.goal, shape.goalBlank)] # The states at distance d and the cells of their empty tile
+    d = 0
+    while layer:
+        nextLayer = []
+        for state, blank in layer:
+            for cell in neighbours[blank]:
+                tile = (state >> (bits * cell)) & mask
+                child = state ^ (tile << (bits * cell)) ^ (tile << (bits * blank))
+                rank = rankState(shape, child)
+                if table[rank] == UNREACHABLE: # First time this state is reached: it is in the next layer
+                    table[rank] = d + 1
+                    nextLayer.append((child, cell))
+        layer = nextLayer
+        d += 1
+    return table
+
+
+# Tables loaded so far, so each file is only mapped once per process.
+_loaded = {}
+
+
+def loadDistanceTable(shape, directory=DATABASE_DIRECTORY):
+    '''
+    This function returns the memory-mapped distance table of a shape, building and saving it the first time.
+    It raises a ValueError if the file does not exist and the board has more than MAX_CELLS cells, see buildDistanceTable.
+    Time complexity: O(1) Constant once the file exists.
+    Space complexity: O(1) Constant, the table is shared pages of the mapped file.
+    '''
+    key = (shape.rows, shape.cols, directory)
+    if key not in _loaded:
+        path = tablePath(shape, directory)
+        if not os.path.exists(path):
+            table = buildDistanceTable(shape)
+            os.makedirs(directory, exist_ok=True)
+            with open(path + '.%d.tmp' % os.getpid(), 'wb') as file: # Written to a temporary file first, so a reader never maps a half-written table
+                file.write(table)
+            os.replace(path + '.%d.tmp' % os.getpid(), path)
+        with open(path, 'rb') as file:
+            _loaded[key] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return _loaded[key]
+
+
+def tableSearch(shape, start, table):
+    '''
+    This function returns the optimal move string from the start state to the goal state by walking down the distance table,
+    or None if the start state cannot reach the goal state.
+    Time complexity: O(d*s) where d is the distance of the start state, for the ranks of the neighbours.
+    Space complexity: O(d) for the returned moves.
+    '''
+    bits, mask, neighbours = shape.bits, shape.mask, shape.neighbours
+    d = table[rankState(shape, start)]
+    if d == UNREACHABLE:
+        return None
+    path = [] # Cells of the empty tile after each move
+    state, blank = start, shape.findBlank(start)
+    while d > 0:
+        for cell in neighbours[blank]:
+            tile = (state >> (bits * cell)) & mask
+            child = state ^ (tile << (bits * cell)) ^ (tile << (bits * blank))
+            if table[rankState(shape, child)] == d - 1: # One of the neighbours is always one move closer to the goal
+                break
+        path.append(cell)
+        state, blank, d = child, cell, d - 1
+    return shape.moveString(shape.findBlank(start), path)
+
+
+def main():
+    '''
+    The main function builds the distance table of the shape given on the command line (3x3 by default) and prints the number of states at each distance.
+    Time complexity: O(s! * s)
+    Space complexity: O(s!)
+    '''
+    rows, cols = (int(sys.argv[1]), int(sys.argv[2])) if len(sys.argv) == 3 else (3, 3)
+    shape = getShape(rows, cols)
+    begin = time.time()
+    table = loadDistanceTable(shape)
+    print("Loaded", tablePath(shape), "in %.2f seconds" % (time.time() - begin))
+    counts = {}
+    for distance in table[:]: # Slicing the mapped file gives bytes, whose items are integers
+        counts[distance] = counts.get(distance, 0) + 1
+    for distance in sorted(counts):
+        if distance != UNREACHABLE:
+            print("Distance", distance, ":", counts[distance], "states")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+'''
+This module enumerates the whole state space of a sliding puzzle with a breadth-first search that keeps its layers on disk, so the RAM it needs is bounded
+whatever the number of states. Each layer (the states at one distance from the goal state) is a file of packed states as unsigned 64-bit integers, sorted.
+A layer is expanded by streaming its file: the children are gathered in a buffer of at most memoryStates states, which is sorted and written as a run
+whenever it is full. The runs are then merged into the next layer, and duplicates are dropped during the merge: the same state in several runs,
+and the states of the layer itself and of the layer before it, which are merged in as well (in an undirected graph every neighbour of a layer
+is in the layer before, the layer itself or the next one). So only the last two layers are ever needed on disk, and nothing is ever looked up.
+Every file is read and written in blocks of BLOCK_STATES states. Optionally the distance of every state is written into a distance table file
+(see distanceTable.py) through a memory map, so the tables of boards too large for distanceTable.buildDistanceTable can be built as well.
+Usage: python externalSearch.py [ROWS COLS] [--directory DIR] [--memory 4000000] [--table] [--keep]
+'''
+
+import argparse
+import heapq
+import mmap
+import os
+import time
+from array import array
+
+from slidingPuzzle import getShape, permutationCount
+
+# Number of states read or written at a time.
+BLOCK_STATES = 1 << 16
+
+# Bytes of the buffer of an open layer or run file.
+FILE_BUFFER = 1 << 20
+
+
+def readStates(path):
+    '''
+    This function is a generator of the packed states of a file, read in blocks of BLOCK_STATES states.
+    Time complexity: O(n) Linear in the number of states.
+    Space complexity: O(BLOCK_STATES)
+    '''
+    with open(path, 'rb', buffering=FILE_BUFFER) as file:
+        while True:
+            block = array('Q')
+            try:
+                block.fromfile(file, BLOCK_STATES)
+            except EOFError: # The last block is shorter, fromfile still keeps what it read
+                pass
+            yield from block
+            if len(block) < BLOCK_STATES:
+                return
+
+
+class StateWriter:
+    '''
+    This class writes packed states to a file in blocks of BLOCK_STATES states, and counts them.
+    '''
+
+    def __init__(self, path):
+        '''
+        The __init__ method creates the file.
+        Time complexity: O(1) Constant.
+        Space complexity: O(BLOCK_STATES)
+        '''
+        self.file = open(path, 'wb', buffering=FILE_BUFFER)
+        self.block = array('Q')
+        self.count = 0
+
+    def write(self, state):
+        '''
+        This method adds a state to the file.
+        Time complexity: O(1) Constant amortized.
+        Space complexity: O(1) Constant.
+        '''
+        self.block.append(state)
+        if len(self.block) == BLOCK_STATES:
+            self.block.tofile(self.file)
+            self.count += len(self.block)
+            self.block = array('Q')
+
+    def close(self):
+        '''
+        This method writes the last block and closes the file.
+        Time complexity: O(BLOCK_STATES)
+        Space complexity: O(1) Constant.
+        '''
+        self.block.tofile(self.file)
+        self.count += len(self.block)
+        self.file.close()
+
+
+def writeRun(path, buffer):
+    '''
+    This function writes a buffer of packed states to a file, sorted. The duplicates are kept, mergeLayer drops them while it streams the runs,
+    so no set is built: the only copy is the sorted list, about 40 bytes per state while it exists, next to the 8 bytes per state of the buffer.
+    Time complexity: O(m log m) for m states.
+    Space complexity: O(m) for the sorted copy.
+    '''
+    with open(path, 'wb', buffering=FILE_BUFFER) as file:
+        array('Q', sorted(buffer)).tofile(file)
+
+
+def expandLayer(shape, layerPath, directory, memoryStates):
+    '''
+    This function streams the states of a layer file, generates all their children and writes them as sorted runs of at most memoryStates states.
+    It returns the list of the file names of the runs.
+    Time complexity: O(n * (s + log m)) for n states in the layer, the empty tile is found in O(s) for each state.
+    Space complexity: O(m) for the buffer of memoryStates states.
+    '''
+    bits, mask, neighbours, findBlank = shape.bits, shape.mask, shape.neighbours, shape.findBlank
+    runs = []
+    buffer = array('Q')
+    for state in readStates(layerPath):
+        blank = findBlank(state)
+        for cell in neighbours[blank]:
+            tile = (state >> (bits * cell)) & mask
+            buffer.append(state ^ (tile << (bits * cell)) ^ (tile << (bits * blank)))
+        if len(buffer) >= memoryStates:
+            runs.append(os.path.join(directory, 'run%04d.bin' % len(runs)))
+            writeRun(runs[-1], buffer)
+            buffer = array('Q')
+    if buffer:
+        runs.append(os.path.join(directory, 'run%04d.bin' % len(runs)))
+        writeRun(runs[-1], buffer)
+    return runs
+
+
+def mergeLayer(runs, excludedPaths, outputPath):
+    '''
+    This function merges sorted run files into a new layer file, keeping each state once and dropping the states of the excluded layer files
+    (the current layer and the one before it). The excluded files are merged alongside, so a state is dropped without any lookup.
+    It returns the StateWriter of the new layer, with its count of states.
+    Time complexity: O(n log r) for n states in r runs and excluded files.
+    Space complexity: O(r * BLOCK_STATES) for one block of every file.
+    '''
+    excluded = heapq.merge(*(readStates(path) for path in excludedPaths))
+    nextExcluded = next(excluded, None)
+    writer = StateWriter(outputPath)
+    previous = None
+    for state in heapq.merge(*(readStates(path) for path in runs)):
+        if state == previous: # The same state from another parent
+            continue
+        previous = state
+        while nextExcluded is not None and nextExcluded < state:
+            nextExcluded = next(excluded, None)
+        if state != nextExcluded: # Not already at a smaller distance
+            writer.write(state)
+    writer.close()
+    return writer
+
+
+def externalBreadthFirstSearch(shape, directory, memoryStates=4000000, table=None, keepLayers=False, report=None):
+    '''
+    This function enumerates every state reachable from the goal state of a shape, layer by layer in files of the given directory,
+    and returns the list of the number of states at each distance. Only memoryStates children are kept in memory at a time.
+    If table is a writable buffer of permutationCount(s, s) bytes (a memory map of a distance table file), the distance of every state is written into it,
+    at the index of distanceTable.rankState. The layer files are removed as soon as they are not needed, unless keepLayers is True
+    (they are then left as layer000.bin, layer001.bin, ...). If report is given it is called with (distance, states) after each layer.
+    It raises a ValueError for a shape whose packed states do not fit in 64 bits.
+    Time complexity: O(S * (s + log r)) for S reachable states, plus O(S * s) to rank them for the table.
+    Space complexity: O(m + r * BLOCK_STATES) of RAM, O(S) of disk.
+    '''
+    if shape.bits * shape.size > 64:
+        raise ValueError("The states of a %dx%d board do not fit in 64 bits" % (shape.rows, shape.cols))
+    if table is not None:
+        from distanceTable import rankState # Imported here because distanceTable.py is only needed for the table
+    os.makedirs(directory, exist_ok=True)
+
+    def layerPath(d):
+        '''
+        This function returns the file name of the layer at distance d.
+        '''
+        return os.path.join(directory, 'layer%03d.bin' % d)
+
+    writer = StateWriter(layerPath(0))
+    writer.write(shape.goal)
+    writer.close()
+    counts = [1]
+    while counts[-1]:
+        d = len(counts) - 1
+        if table is not None:
+            for state in readStates(layerPath(d)):
+                table[rankState(shape, state)] = d
+        if report is not None:
+            report(d, counts[-1])
+        runs = expandLayer(shape, layerPath(d), directory, memoryStates)
+        counts.append(mergeLayer(runs, [layerPath(d - 1), layerPath(d)] if d else [layerPath(d)], layerPath(d + 1)).count)
+        for path in runs:
+            os.remove(path)
+        if d and not keepLayers:
+            os.remove(layerPath(d - 1)) # Never needed again: the next layer only has to be checked against layers d and d+1
+    os.remove(layerPath(len(counts) - 1)) # The empty last layer
+    if not keepLayers:
+        os.remove(layerPath(len(counts) - 2))
+    return counts[:-1]
+
+
+def buildTableFile(shape, path, directory, memoryStates=4000000, report=None):
+    '''
+    This function builds the distance table file of a shape (see distanceTable.py) with externalBreadthFirstSearch, writing it through a memory map
+    so the table itself is never held in RAM. The file is written under a temporary name and renamed at the end, like distanceTable.loadDistanceTable does.
+    It returns the list of the number of states at each distance.
+    Time complexity: O(S * s) for S reachable states.
+    Space complexity: O(m + r * BLOCK_STATES) of RAM, O(s!) of disk for the table.
+    '''
+    from distanceTable import UNREACHABLE # Imported here because distanceTable.py is only needed for the table
+    size = permutationCount(shape.size, shape.size)
+    temporary = path + '.%d.tmp' % os.getpid()
+    with open(temporary, 'wb') as file:
+        chunk = bytes([UNREACHABLE]) * min(size, 1 << 24)
+        for start in range(0, size, len(chunk)):
+            file.write(chunk[:size - start])
+    with open(temporary, 'r+b') as file:
+        table = mmap.mmap(file.fileno(), size)
+        try:
+            counts = externalBreadthFirstSearch(shape, directory, memoryStates, table, report=report)
+            table.flush()
+        finally:
+            table.close()
+    os.replace(temporary, path)
+    return counts
+
+
+def main():
+    '''
+    The main function enumerates the state space of the shape given on the command line (3x3 if none is given) and prints the number of states at each distance.
+    Time complexity: O(S * s)
+    Space complexity: O(m) of RAM, O(S) of disk.
+    '''
+    parser = argparse.ArgumentParser(description='Enumerate the states of a sliding puzzle with a breadth-first search on disk.')
+    parser.add_argument('rows', nargs='?', type=int, default=3)
+    parser.add_argument('cols', nargs='?', type=int, default=3)
+    parser.add_argument('--directory', default='layers', help='directory of the layer files')
+    parser.add_argument('--memory', type=int, default=4000000, help='children kept in memory before a sorted run is written')
+    parser.add_argument('--table', action='store_true', help='also write the distance table file of the shape, see distanceTable.py')
+    parser.add_argument('--keep', action='store_true', help='keep the layer files')
+    args = parser.parse_args()
+
+    shape = getShape(args.rows, args.cols)
+    begin = time.time()
+
+    def report(d, states):
+        '''
+        This function prints the size of each layer as soon as it is known.
+        '''
+        print("Distance %d: %d states (%.1f seconds)" % (d, states, time.time() - begin), flush=True)
+
+    if args.table:
+        from distanceTable import tablePath
+        path = tablePath(shape)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        counts = buildTableFile(shape, path, args.directory, args.memory, report)
+        print("Table written to", path)
+    else:
+        counts = externalBreadthFirstSearch(shape, args.directory, args.memory, keepLayers=args.keep, report=report)
+    print("%d states, largest distance %d, in %.1f seconds" % (sum(counts), len(counts) - 1, time.time() - begin))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+'''
+This module implements hash-distributed A* (HDA*), a parallel A* search for the sliding puzzles of slidingPuzzle.py that uses every core of the machine.
+Each worker process owns the states whose hash falls on it, with its own open list and seen dictionary, so no state is ever shared between workers.
+A worker expands the nodes of its open list and sends each child to the owner of the child, in batches to keep the number of messages low.
+The cost of the best solution found so far (the incumbent) is shared by all workers, and nodes whose f is not below it are pruned.
+The search is over when every worker has no node left with f below the incumbent and no batch is on its way. The main process detects this with probe waves:
+every worker reports whether it is idle and how many nodes it has sent and received, and two waves in a row with every worker idle,
+as many nodes received as sent, and the same totals mean nothing can change anymore. The incumbent is then the optimal cost.
+The path is traced back from the goal by asking the owner of each state for the move that reached it.
+Usage: python parallelAStar.py [TILES ...] [--workers 16] [--heuristic pdb]
+'''
+
+import argparse
+import math
+import multiprocessing
+import os
+import queue as queues
+import time
+
+from slidingPuzzle import (MOVES, BucketQueue, Node, SearchStats, getShape, isSolvable, makeHeuristic, printBoard,
+                           PuzzlePath, validateBoard)
+
+# Number of children gathered for one worker before they are sent as one batch.
+BATCH_SIZE = 256
+
+# Number of nodes a worker expands between two looks at its inbox.
+EXPANSIONS_PER_CHECK = 256
+
+# Seconds between two probe waves of the main process.
+PROBE_INTERVAL = 0.002
+
+# Odd 64-bit constant of the multiplicative hash that spreads the states over the workers.
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def owner(state, workers):
+    '''
+    This function returns the index of the worker that owns a packed state. The state is mixed by a multiplicative hash first,
+    since its low bits only depend on the tile of the first cell.
+    Time complexity: O(1) Constant.
+    Space complexity: O(1) Constant.
+    '''
+    return (((state * HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> 32) % workers
+
+
+def worker(index, rows, cols, heuristicName, inboxes, outbox, incumbent, incumbentLock):
+    '''
+    This function is the loop of one worker process. It owns the states s with owner(s) == index.
+    inboxes are the message queues of all the workers, outbox is the queue of the replies to the main process,
+    and incumbent is the shared cost of the best solution found so far, changed under incumbentLock.
+    Messages are ('nodes', batch) with batch a list of (state, blank, g, h, move), ('probe', wave), ('query', state) and ('stop',).
+    Time complexity: O(b^d / w) on average for w workers.
+    Space complexity: O(b^d / w) for the states owned by the worker.
+    '''
+    shape = getShape(rows, cols)
+    heuristic = makeHeuristic(shape, heuristicName)
+    bits, mask, goal = shape.bits, shape.mask, shape.goal
+    neighbours, moves, update = shape.neighbours, shape.moves, heuristic.update
+    workers = len(inboxes)
+    inbox = inboxes[index]
+    queue = BucketQueue()
+    seen = {} # g<<2|move of the cheapest path found so far to each owned state
+    batches = [[] for _ in range(workers)] # Children waiting to be sent to each worker
+    sent = received = 0 # Nodes sent to and received from the other workers, for the termination test
+    expanded = generated = 0 # Counters for the stats
+    best = incumbent.value # Local copy of the incumbent, read again at every look at the inbox
+
+    def receive(state, blank, g, h, move):
+        '''
+        This function adds a node to the open list if it is the cheapest path found to its state and it can still beat the incumbent.
+        '''
+        if g < (seen.get(state, (g + 1) << 2) >> 2):
+            seen[state] = g << 2 | move
+            if g + h < best:
+                queue.push(g + h, g, Node(state, blank, g, h))
+
+    def flush():
+        '''
+        This function sends every waiting batch to its worker.
+        '''
+        nonlocal sent
+        for target, batch in enumerate(batches):
+            if batch:
+                inboxes[target].put(('nodes', batch))
+                sent += len(batch)
+                batches[target] = []
+
+    while True:
+        idle = queue.lowestF() >= best # Nothing left that could beat the incumbent
+        if idle:
+            flush() # Never wait with children that were not sent
+        try:
+            message = inbox.get() if idle else inbox.get_nowait()
+        except queues.Empty:
+            message = None
+        while message is not None:
+            kind = message[0]
+            if kind == 'nodes':
+                received += len(message[1])
+                for node in message[1]:
+                    receive(*node)
+            elif kind == 'probe':
+                flush()
+                best = incumbent.value
+                outbox.put(('status', message[1], index, queue.lowestF() >= best, sent, received))
+            elif kind == 'query':
+                outbox.put(('answer', seen.get(message[1])))
+            else: # 'stop'
+                outbox.put(('stats', index, expanded, generated))
+                return
+            try:
+                message = inbox.get_nowait()
+            except queues.Empty:
+                message = None
+        best = incumbent.value
+
+        for _ in range(EXPANSIONS_PER_CHECK):
+            if not len(queue) or queue.lowestF() >= best:
+                break
+            node = queue.pop()
+            if node.g > seen[node.state] >> 2 or node.g + node.h >= best: # Stale entry, or it cannot beat the incumbent anymore
+                continue
+            if node.state == goal: # A solution, keep it if it is the best one of all the workers
+                with incumbentLock:
+                    if node.g < incumbent.value:
+                        incumbent.value = node.g
+                    best = incumbent.value
+                continue
+            expanded += 1
+            state, blank, g = node.state, node.blank, node.g + 1
+            for cell, move in zip(neighbours[blank], moves[blank]):
+                generated += 1
+                tile = (state >> (bits * cell)) & mask
+                child = state ^ (tile << (bits * cell)) ^ (tile << (bits * blank))
+                h = update(node.h, state, child, tile, cell, blank)
+                if g + h >= best:
+                    continue
+                target = owner(child, workers)
+                if target == index: # Owned here, no message needed
+                    receive(child, cell, g, h, move)
+                else:
+                    batches[target].append((child, cell, g, h, move))
+                    if len(batches[target]) >= BATCH_SIZE:
+                        inboxes[target].put(('nodes', batches[target]))
+                        sent += len(batches[target])
+                        batches[target] = []
+
+
+def parallelAStarSearch(shape, start, heuristic='manhattan', workers=None, stats=None):
+    '''
+    This function runs HDA* with the given number of worker processes (the number of CPUs if it is None) and the heuristic with the given name (see makeHeuristic).
+    It returns the optimal move string from the packed start state to the goal state, or None if the start state is not solvable (see isSolvable).
+    If a SearchStats object is given, the numbers of expanded and generated nodes of all the workers are added to it.
+    Time complexity: O(b^d / w) on average for w workers, plus one round trip per move of the solution to trace the path.
+    Space complexity: O(b^d) in total, spread over the workers.
+    '''
+    if start == shape.goal:
+        return ''
+    if not isSolvable(shape.unpack(start)): # The workers would run out of nodes without ever finding the goal
+        return None
+    workers = workers or os.cpu_count() or 1
+    heuristicObject = makeHeuristic(shape, heuristic) # Build missing pattern databases once here, instead of in every worker at the same time
+    context = multiprocessing.get_context()
+    inboxes = [context.Queue() for _ in range(workers)]
+    outbox = context.Queue()
+    incumbent = context.Value('l', 1 << 62, lock=False) # Read without a lock, only changed under incumbentLock
+    incumbentLock = context.Lock()
+    processes = [context.Process(target=worker, args=(index, shape.rows, shape.cols, heuristic, inboxes, outbox, incumbent, incumbentLock), daemon=True)
+                 for index in range(workers)]
+    for process in processes:
+        process.start()
+
+    try:
+        root = heuristicObject.estimate(start)
+        inboxes[owner(start, workers)].put(('nodes', [(start, shape.findBlank(start), 0, root, 0)])) # The main process sends the root node
+        # Probe waves until two waves in a row find every worker idle with the same totals and as many nodes received as sent (the root counts as sent).
+        previous = None
+        wave = 0
+        while True:
+            time.sleep(PROBE_INTERVAL)
+            wave += 1
+            for inbox in inboxes:
+                inbox.put(('probe', wave))
+            idle, sent, received = True, 1, 0
+            for _ in range(workers):
+                _, _, _, workerIdle, workerSent, workerReceived = outbox.get()
+                idle = idle and workerIdle
+                sent += workerSent
+                received += workerReceived
+            totals = (sent, received)
+            if idle and sent == received and totals == previous:
+                break
+            previous = totals if idle and sent == received else None
+
+        # Trace the path back from the goal, asking the owner of each state for the move that reached it.
+        path = []
+        state, blank = shape.goal, shape.goalBlank
+        while state != start:
+            inboxes[owner(state, workers)].put(('query', state))
+            move = outbox.get()[1] & 3
+            path.append(MOVES[move])
+            cell = blank - shape.offsets[move] # The cell the empty tile came from
+            state = shape.slide(state, blank, cell)
+            blank = cell
+
+        for inbox in inboxes:
+            inbox.put(('stop',))
+        for _ in range(workers):
+            _, _, workerExpanded, workerGenerated = outbox.get()
+            if stats is not None:
+                stats.add(workerExpanded, workerGenerated)
+    finally:
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+    return ''.join(reversed(path))
+
+
+def main():
+    '''
+    The main function solves the board given on the command line (the 15-Puzzle instance of slidingPuzzle.py if none is given) with HDA*
+    and prints the solution, the time and the number of expanded nodes.
+    Time complexity: O(b^d / w)
+    Space complexity: O(b^d)
+    '''
+    parser = argparse.ArgumentParser(description='Solve a sliding puzzle with hash-distributed parallel A*.')
+    parser.add_argument('tiles', nargs='*', type=int, help='tiles of a square board in row-major order, 0 for the empty tile')
+    parser.add_argument('--workers', type=int, help='number of worker processes, the number of CPUs if not given')
+    parser.add_argument('--heuristic', default='manhattan', choices=['manhattan', 'linear', 'walking', 'pdb'])
+    args = parser.parse_args()
+
+    tiles = args.tiles or [5, 15, 8, 7, 1, 0, 2, 3, 4, 9, 11, 14, 13, 6, 10, 12]
+    side = math.isqrt(len(tiles))
+    board = [tiles[i * side:(i + 1) * side] for i in range(side)]
+    validateBoard(board)
+    if not isSolvable(board):
+        print("No solution found!")
+        return
+    shape = getShape(side, side)
+    stats = SearchStats()
+    begin = time.time()
+    moves = parallelAStarSearch(shape, shape.pack(board), args.heuristic, args.workers, stats)
+    elapsed = time.time() - begin
+    for state in PuzzlePath(shape, shape.pack(board), moves):
+        printBoard(state)
+        print("*********")
+    print("Number of moves:", len(moves), moves)
+    print("Expanded %d nodes in %.2f seconds" % (stats.expanded, elapsed))
+
+
+if __name__ == '__main__':
+    main()
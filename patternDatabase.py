@@ -0,0 +1,269 @@
+'''
+This module builds and loads additive pattern databases, a heuristic for the sliding puzzles of slidingPuzzle.py that is much stronger than the Manhattan distance.
+A pattern is a group of tiles. Its database stores, for every placement of the pattern tiles, the minimum number of moves of pattern tiles needed to bring them to their goal cells
+(moves of the other tiles are free). The patterns of a partition are disjoint, so the values of all patterns can be added and the sum is still admissible.
+Each database is built once by a breadth-first search backwards from the goal and saved to a file. The number of pattern moves is at least the Manhattan distance
+of the pattern tiles and has the same parity, so each entry stores (moves - Manhattan distance) / 2, capped at 15, in 4 bits (two entries per byte).
+The files are loaded with mmap, so several solver processes on the same machine share the same pages of memory.
+Usage: python patternDatabase.py ROWS COLS [--patterns 1,2,5,6,9,13 3,4,7,8,11,12 10,14,15]
+'''
+
+import argparse
+import mmap
+import os
+import time
+
+from slidingPuzzle import getShape, permutationCount, rankPositions, unrankPositions
+
+# Directory of the pattern database files.
+DATABASE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdb')
+
+# The default partition of the tiles of each board shape.
+PARTITIONS = {
+    (3, 3): ((1, 2, 3, 4, 5, 6, 7, 8),), # A single pattern with every tile: the exact distance
+    (4, 4): ((1, 2, 5, 6, 9), (3, 4, 7, 8, 12), (10, 11, 13, 14, 15)), # 5-5-5
+    (5, 5): ((1, 2, 6, 7), (3, 4, 8, 9), (5, 10, 14, 15), (11, 12, 16, 17), (13, 18, 19, 20), (21, 22, 23, 24)),
+}
+
+# Largest number of cells of a shape without a partition in PARTITIONS that gets a single pattern with every tile.
+SINGLE_PATTERN_CELLS = 9
+
+# Number of tiles of each pattern of the partition derived for the larger shapes without one in PARTITIONS.
+PATTERN_TILES = 4
+
+# Largest value stored in a 4-bit entry.
+MAX_ENTRY = 15
+
+# Value of the states not reached yet by the breadth-first search.
+UNSEEN = 255
+
+
+def defaultPartition(shape):
+    '''
+    This function returns the default partition of the tiles of a shape: the one in PARTITIONS if there is one,
+    a single pattern with every tile for a board of up to SINGLE_PATTERN_CELLS cells, and otherwise consecutive groups of PATTERN_TILES tiles.
+    Time complexity: O(s) Linear.
+    Space complexity: O(s) Linear.
+    '''
+    if (shape.rows, shape.cols) in PARTITIONS:
+        return PARTITIONS[(shape.rows, shape.cols)]
+    tiles = tuple(range(1, shape.size))
+    if shape.size <= SINGLE_PATTERN_CELLS:
+        return (tiles,)
+    return tuple(tiles[i:i + PATTERN_TILES] for i in range(0, len(tiles), PATTERN_TILES))
+
+
+def databasePath(shape, pattern, directory=DATABASE_DIRECTORY):
+    '''
+    This function returns the file name of the database of a pattern, for example pdb/4x4-1-2-5-6-9.pdb.
+    Time complexity: O(k) Linear in the number of pattern tiles.
+    Space complexity: O(k) Linear.
+    '''
+    return os.path.join(directory, '%dx%d-%s.pdb' % (shape.rows, shape.cols, '-'.join(str(tile) for tile in pattern)))
+
+
+def buildPattern(shape, pattern):
+    '''
+    This function builds the database of one pattern and returns it as a bytearray of 4-bit entries indexed by the rank of the cells of the pattern tiles.
+    The search runs backwards from the goal over abstract states (cells of the pattern tiles, cell of the empty tile), stored as rank*size+blank in a byte array.
+    It goes layer by layer: moving a pattern tile costs 1 and puts the new state in the next layer, moving any other tile is free and keeps the state in the current layer.
+    The first layer that reaches a placement of the pattern tiles (with any cell of the empty tile) is its number of pattern moves.
+    Time complexity: O(P*s*k) where P = s!/(s-k)! is the number of placements of the k pattern tiles on the s cells.
+    Space complexity: O(P*s) for the byte array of the abstract states.
+    '''
+    size, k = shape.size, len(pattern)
+    neighbours = shape.neighbours
+    count = permutationCount(size, k) # Number of placements of the pattern tiles
+    distance = bytearray([UNSEEN]) * (count * size) # Distance of each abstract state
+    moves = bytearray([UNSEEN]) * count # Distance of each placement, the minimum over the cells of the empty tile
+
+    start = rankPositions([tile - 1 for tile in pattern], size) * size + shape.goalBlank # The goal state
+    distance[start] = 0
+    layer = [start]
+    d = 0
+    while layer:
+        stack = [index for index in layer if distance[index] == d] # Skip the states that were reached with a free move in the previous layer
+        nextLayer = []
+        while stack:
+            index = stack.pop()
+            rank, blank = divmod(index, size)
+            if moves[rank] == UNSEEN: # Layers are explored in increasing distance, so the first one is the minimum
+                moves[rank] = d
+            positions = unrankPositions(rank, k, size)
+            for cell in neighbours[blank]:
+                if cell in positions: # A pattern tile slides into the empty cell: cost 1
+                    moved = positions[:]
+                    moved[positions.index(cell)] = blank
+                    child = rankPositions(moved, size) * size + cell
+                    if distance[child] == UNSEEN:
+                        distance[child] = d + 1
+                        nextLayer.append(child)
+                else: # Another tile slides into the empty cell: free
+                    child = index - blank + cell
+                    if distance[child] > d:
+                        distance[child] = d
+                        stack.append(child)
+        layer = nextLayer
+        d += 1
+
+    # Store every placement as the number of moves above the Manhattan distance of the pattern tiles, divided by 2.
+    table = bytearray((count + 1) // 2)
+    manhattan = shape.manhattan
+    for rank in range(count):
+        if moves[rank] == UNSEEN: # Placements that cannot be reached (for example with the wrong parity) stay 0
+            continue
+        positions = unrankPositions(rank, k, size)
+        excess = (moves[rank] - sum(manhattan[tile * size + cell] for tile, cell in zip(pattern, positions))) // 2
+        table[rank >> 1] |= min(excess, MAX_ENTRY) << ((rank & 1) * 4)
+    return table
+
+
+def buildPatternDatabase(shape, patterns=None, directory=DATABASE_DIRECTORY):
+    '''
+    This function builds the database of each pattern of a partition (the default partition of the shape if patterns is None) and writes it to its file.
+    Time complexity: O(P*s*k) for each pattern, see buildPattern.
+    Space complexity: O(P*s) for the largest pattern.
+    '''
+    if patterns is None:
+        patterns = defaultPartition(shape)
+    os.makedirs(directory, exist_ok=True)
+    for pattern in patterns:
+        table = buildPattern(shape, pattern)
+        path = databasePath(shape, pattern, directory)
+        with open(path + '.%d.tmp' % os.getpid(), 'wb') as file: # Written to a temporary file first, so a reader never maps a half-written database
+            file.write(table)
+        os.replace(path + '.%d.tmp' % os.getpid(), path)
+
+
+class PatternDatabaseHeuristic:
+    '''
+    This class is the additive pattern database heuristic, with the same estimate and update methods as slidingPuzzle.ManhattanHeuristic.
+    The heuristic is the Manhattan distance of every tile plus twice the stored entry of every pattern.
+    '''
+
+    def __init__(self, shape, patterns, tables):
+        '''
+        The __init__ method takes the PuzzleShape, the partition of the tiles and the memory-mapped table of each pattern.
+        patternOf[tile] is the index of the pattern of the tile (-1 for the empty tile and for tiles in no pattern),
+        and slotOf[tile] is the index of the tile in its pattern.
+        Time complexity: O(s) Linear.
+        Space complexity: O(s) Linear.
+        '''
+        self.shape = shape
+        self.size = shape.size
+        self.mask = shape.mask
+        self.moveDelta = shape.moveDelta
+        self.patterns = patterns
+        self.tables = tables
+        self.shifts = [shape.bits * cell for cell in range(shape.size)] # Bit offset of each cell
+        self.patternOf = [-1] * shape.size
+        self.slotOf = [0] * shape.size
+        for index, pattern in enumerate(patterns):
+            for slot, tile in enumerate(pattern):
+                self.patternOf[tile] = index
+                self.slotOf[tile] = slot
+
+    def positions(self, state, index):
+        '''
+        This method returns the cells of the tiles of the pattern with the given index in a packed state.
+        Time complexity: O(s) Linear.
+        Space complexity: O(k) Linear in the number of pattern tiles.
+        '''
+        positions = [0] * len(self.patterns[index])
+        patternOf, slotOf, mask = self.patternOf, self.slotOf, self.mask
+        for cell, shift in enumerate(self.shifts):
+            tile = (state >> shift) & mask
+            if patternOf[tile] == index:
+                positions[slotOf[tile]] = cell
+        return positions
+
+    def entry(self, index, positions):
+        '''
+        This method reads the 4-bit entry of a placement of the pattern with the given index.
+        Time complexity: O(k) Linear, for the rank.
+        Space complexity: O(1) Constant.
+        '''
+        rank = rankPositions(positions, self.size)
+        return (self.tables[index][rank >> 1] >> ((rank & 1) * 4)) & MAX_ENTRY
+
+    def estimate(self, state):
+        '''
+        This method returns the heuristic of a packed state: its Manhattan distance plus twice the entries of all the patterns.
+        Time complexity: O(p*s) where p is the number of patterns.
+        Space complexity: O(s) Linear.
+        '''
+        h = self.shape.heuristicManhattan(state)
+        for index in range(len(self.patterns)):
+            h += 2 * self.entry(index, self.positions(state, index))
+        return h
+
+    def update(self, h, state, child, tile, fromCell, toCell):
+        '''
+        This method returns the heuristic of child. Only the pattern of the tile that slides changes,
+        so only its entry is read again, for the placement before and after the move.
+        Time complexity: O(s) Linear, to find the cells of the pattern tiles.
+        Space complexity: O(k) Linear.
+        '''
+        h += self.moveDelta[(tile * self.size + fromCell) * self.size + toCell]
+        index = self.patternOf[tile]
+        if index < 0:
+            return h
+        positions = self.positions(state, index)
+        before = self.entry(index, positions)
+        positions[self.slotOf[tile]] = toCell
+        return h + 2 * (self.entry(index, positions) - before)
+
+
+# Databases loaded so far, so each file is only mapped once per process.
+_loaded = {}
+
+
+def loadPatternDatabase(shape, patterns=None, directory=DATABASE_DIRECTORY):
+    '''
+    This function returns the PatternDatabaseHeuristic of a shape (with its default partition if patterns is None).
+    The files are memory-mapped read-only; the ones that do not exist yet are built first.
+    Time complexity: O(1) Constant once the files exist.
+    Space complexity: O(1) Constant, the tables are shared pages of the mapped files.
+    '''
+    if patterns is None:
+        patterns = defaultPartition(shape)
+    patterns = tuple(tuple(pattern) for pattern in patterns)
+    key = (shape.rows, shape.cols, patterns, directory)
+    if key not in _loaded:
+        tables = []
+        for pattern in patterns:
+            path = databasePath(shape, pattern, directory)
+            if not os.path.exists(path):
+                buildPatternDatabase(shape, [pattern], directory)
+            with open(path, 'rb') as file:
+                tables.append(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)) # The mapping stays valid after the file is closed
+        _loaded[key] = PatternDatabaseHeuristic(shape, patterns, tables)
+    return _loaded[key]
+
+
+def main():
+    '''
+    The main function builds the pattern databases of the board shape given on the command line.
+    Time complexity: O(P*s*k) for each pattern.
+    Space complexity: O(P*s) for the largest pattern.
+    '''
+    parser = argparse.ArgumentParser(description='Build the pattern databases of a sliding puzzle.')
+    parser.add_argument('rows', type=int)
+    parser.add_argument('cols', type=int)
+    parser.add_argument('--patterns', nargs='+', help='comma separated tiles of each pattern, the default partition of the shape if not given')
+    parser.add_argument('--directory', default=DATABASE_DIRECTORY)
+    args = parser.parse_args()
+
+    shape = getShape(args.rows, args.cols)
+    if args.patterns:
+        patterns = [tuple(int(tile) for tile in pattern.split(',')) for pattern in args.patterns]
+    else:
+        patterns = defaultPartition(shape)
+    for pattern in patterns:
+        begin = time.time()
+        buildPatternDatabase(shape, [pattern], args.directory)
+        print("Built", databasePath(shape, pattern, args.directory), "in %.1f seconds" % (time.time() - begin))
+
+
+if __name__ == '__main__':
+    main()
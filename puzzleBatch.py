@@ -0,0 +1,166 @@
+'''
+This module solves many sliding puzzles at once, spread over a pool of worker processes.
+The start states are read from a file (or the standard input), one per line: the tiles in row-major order separated by spaces or commas, 0 for the empty tile.
+Blank lines and lines starting with # are skipped. Without --rows and --cols every board must be square.
+Each worker loads the heuristic tables of the board shape once when it starts, then solves chunks of lines.
+The results are written to the standard output as one JSON object per line, in the order of the input, as soon as they are ready:
+{"line": 3, "seconds": 0.004, "length": 22, "moves": "LURD...", "tiles": [8, 5, ...], "expanded": 812, "generated": 2243, ...}
+where moves are the moves of the empty tile (see slidingPuzzle.MOVES), tiles are the tiles that slide, in order, and the rest are the counters of SearchStats.asDict. Unsolvable boards have "unsolvable": true and malformed lines have an "error" message.
+A summary is written to the standard error at the end.
+Usage: python puzzleBatch.py [FILE] [--rows 4 --cols 4] [--mode idastar] [--heuristic pdb] [--workers 8] [--chunk 16] [--max-nodes 2000000] [--mode anytime --time-limit 0.5] [--cache pdb/solutions.sqlite]
+'''
+
+import argparse
+import json
+import math
+import multiprocessing.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from batchPool import readChunks, solveChunks
+from slidingPuzzle import SearchStats, getShape, makeHeuristic, solvePuzzle
+
+# Settings of the worker process, set once by initWorker.
+_settings = {}
+
+
+def parseBoard(line, rows=None, cols=None):
+    '''
+    This function parses a line of tiles separated by spaces or commas into a 2D list of the given shape (square if rows and cols are None).
+    It raises a ValueError if the line cannot be read as a board of that shape.
+    Time complexity: O(s) Linear in the number of cells.
+    Space complexity: O(s) Linear.
+    '''
+    tiles = [int(value) for value in line.replace(',', ' ').split()]
+    if rows is None or cols is None:
+        rows = cols = math.isqrt(len(tiles))
+    if rows * cols != len(tiles):
+        raise ValueError("Expected %d tiles, found %d" % (rows * cols, len(tiles)))
+    return [tiles[i * cols:(i + 1) * cols] for i in range(rows)]
+
+
+def loadTables(rows, cols, mode, heuristic):
+    '''
+    This function loads the tables used to solve boards of a shape: the distance table for the table mode, the heuristic otherwise.
+    Time complexity: O(1) Constant once the tables exist on disk.
+    Space complexity: O(1) Constant, the tables are memory-mapped.
+    '''
+    if rows is not None and cols is not None:
+        shape = getShape(rows, cols)
+        if mode == 'table':
+            from distanceTable import loadDistanceTable
+            loadDistanceTable(shape)
+        else:
+            makeHeuristic(shape, heuristic)
+
+
+def initWorker(rows, cols, mode, heuristic, maxNodes, timeLimit, cachePath=None):
+    '''
+    This function runs once in every worker process. It keeps the settings and maps the tables of the shape,
+    so they are ready when the first puzzle arrives. The cache of the worker is closed when the worker exits, which writes the times of use it still holds.
+    Time complexity: O(1) Constant, the tables were built by solveBatch.
+    Space complexity: O(1) Constant, the tables are memory-mapped.
+    '''
+    _settings.update(rows=rows, cols=cols, mode=mode, heuristic=heuristic, maxNodes=maxNodes, timeLimit=timeLimit)
+    if cachePath is not None: # Each worker opens its own connection to the shared cache file
+        from puzzleCache import PuzzleCache
+        _settings['cache'] = PuzzleCache(cachePath)
+        multiprocessing.util.Finalize(_settings['cache'], _settings['cache'].close, exitpriority=10) # Worker processes skip atexit, but run these
+    loadTables(rows, cols, mode, heuristic)
+
+
+def solveLine(number, line):
+    '''
+    This function solves the board on one input line and returns its result as a dictionary.
+    Time complexity: O(b^d), the same as the search.
+    Space complexity: O(b^d) for A*, O(d) for IDA*.
+    '''
+    result = {'line': number}
+    try:
+        board = parseBoard(line, _settings['rows'], _settings['cols'])
+        stats = SearchStats()
+        begin = time.perf_counter()
+        if 'cache' in _settings:
+            path = _settings['cache'].solve(board, _settings['mode'], _settings['heuristic'], stats, _settings['maxNodes'], _settings['timeLimit'])
+        else:
+            path = solvePuzzle(board, _settings['mode'], _settings['heuristic'], stats, _settings['maxNodes'], _settings['timeLimit'])
+        result['seconds'] = round(time.perf_counter() - begin, 6)
+    except ValueError as error:
+        result['error'] = str(error)
+        return result
+    if path is None:
+        result['unsolvable'] = True
+    else:
+        result['length'] = len(path.moves)
+        result['moves'] = path.moves
+        result['tiles'] = path.tiles()
+    result.update(stats.asDict())
+    return result
+
+
+def solveChunk(chunk):
+    '''
+    This function solves a list of (line number, line) pairs in a worker process and returns the list of their results.
+    Time complexity: O(c * b^d) for c lines.
+    Space complexity: O(c) for the results, plus the search.
+    '''
+    return [solveLine(number, line) for number, line in chunk]
+
+
+def solveBatch(lines, rows=None, cols=None, mode='astar', heuristic='manhattan', workers=None, chunkSize=16, maxNodes=None, timeLimit=None, cachePath=None):
+    '''
+    This function solves the boards of an iterable of lines across a pool of worker processes and yields their results in input order.
+    maxNodes bounds the memory of each A* search, see slidingPuzzle.aStarSearch, and timeLimit is the time of each search of the anytime mode.
+    With a cachePath the solutions go through the puzzleCache.PuzzleCache in that file.
+    Only a few chunks per worker are submitted ahead of the results, so the input is read as it is consumed and huge files never sit in memory.
+    Time complexity: O(n * b^d / w) for n boards and w workers.
+    Space complexity: O(w * c) for the chunks in flight.
+    '''
+    workers = workers or os.cpu_count() or 1
+    loadTables(rows, cols, mode, heuristic) # Build missing tables once here, instead of in every worker at the same time
+    with ProcessPoolExecutor(workers, initializer=initWorker, initargs=(rows, cols, mode, heuristic, maxNodes, timeLimit, cachePath)) as executor:
+        yield from solveChunks(executor, solveChunk, readChunks(lines, chunkSize), workers)
+
+
+def main():
+    '''
+    The main function reads the command line, solves the boards of the input file and writes one JSON result per line.
+    Time complexity: O(n * b^d / w)
+    Space complexity: O(w * c)
+    '''
+    parser = argparse.ArgumentParser(description='Solve many sliding puzzles in parallel.')
+    parser.add_argument('file', nargs='?', help='file with one start state per line, the standard input if not given')
+    parser.add_argument('--rows', type=int)
+    parser.add_argument('--cols', type=int)
+    parser.add_argument('--mode', default='astar', choices=['astar', 'idastar', 'bidirectional', 'anytime', 'table'])
+    parser.add_argument('--heuristic', default='manhattan', choices=['manhattan', 'linear', 'walking', 'pdb'])
+    parser.add_argument('--workers', type=int, help='number of worker processes, the number of CPUs if not given')
+    parser.add_argument('--chunk', type=int, default=16, help='number of boards sent to a worker at a time')
+    parser.add_argument('--max-nodes', type=int, help='states A* may keep in memory before it switches to IDA*, no limit if not given')
+    parser.add_argument('--cache', help='file of the solution cache, no cache if not given')
+    parser.add_argument('--time-limit', type=float, help='seconds for each board in the anytime mode, the best solution found by then is written')
+    args = parser.parse_args()
+
+    lines = open(args.file) if args.file else sys.stdin
+    begin = time.time()
+    solved = unsolvable = errors = 0
+    for result in solveBatch(lines, args.rows, args.cols, args.mode, args.heuristic, args.workers, args.chunk, args.max_nodes, args.time_limit, args.cache):
+        print(json.dumps(result))
+        if 'error' in result:
+            errors += 1
+        elif 'unsolvable' in result:
+            unsolvable += 1
+        else:
+            solved += 1
+    if args.file:
+        lines.close()
+    elapsed = time.time() - begin
+    total = solved + unsolvable + errors
+    print("Solved %d, unsolvable %d, errors %d in %.2f seconds (%.1f boards per second)"
+          % (solved, unsolvable, errors, elapsed, total / elapsed if elapsed else 0.0), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,425 @@
+'''
+This module benchmarks the sliding-puzzle solvers of slidingPuzzle.py on fixed sets of instances, so two versions of the code can be compared on the same work.
+The instance sets are:
+  eight   8-Puzzle (3x3) boards at every optimal distance from 0 to 31, the same number at each distance, drawn with a seed from the distance table of distanceTable.py.
+  korf    Korf's 100 15-Puzzle (4x4) instances of KORF_INSTANCES, or the instances of a file given with --korf (see loadKorf for the format).
+  random  random solvable boards of any shape, drawn with a seed by puzzleGenerator.py, uniformly or with a given optimal solution length.
+Each instance is solved in a fresh process, started with spawn rather than fork so it shares nothing with the benchmark process. The memory high-water mark
+of the process is then the memory of that instance alone (plus the interpreter and the tables, the same for every instance), and a --timeout can stop it.
+The report is one JSON document: the settings, one entry per instance (time, nodes, nodes per second, memory, solution length and the counters of SearchStats)
+and a summary. With --baseline the report is compared with a report saved before, every regression is written to the standard error
+and the exit status is 1 if there is any.
+Usage: python puzzleBenchmark.py eight [--per-distance 2] [--mode idastar] [--heuristic linear] [--output report.json] [--baseline baseline.json] [--tolerance 0.25]
+       python puzzleBenchmark.py korf [--korf korf100.txt] --mode idastar --heuristic pdb --timeout 60
+       python puzzleBenchmark.py random --rows 3 --cols 4 --count 20 --seed 7 [--depth 30]
+'''
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import time
+
+from puzzleGenerator import generateBoards, ranksAtDepth
+from slidingPuzzle import SearchStats, getShape, solvePuzzle, unrankPositions
+
+# Largest optimal distance of the 8-Puzzle.
+EIGHT_DIAMETER = 31
+
+# Differences below this many seconds are never reported as regressions, they are within the noise of the timer and the scheduler.
+MIN_SECONDS = 0.05
+
+# Korf's 100 15-Puzzle instances ("Depth-first iterative-deepening: an optimal admissible tree search", 1985), the tiles in row-major order
+# for the goal state of the paper, with the empty tile first (see korfBoard). Their optimal solutions are 41 to 66 moves long.
+KORF_INSTANCES = (
+    (14, 13, 15, 7, 11, 12, 9, 5, 6, 0, 2, 1, 4, 8, 10, 3),
+    (13, 5, 4, 10, 9, 12, 8, 14, 2, 3, 7, 1, 0, 15, 11, 6),
+    (14, 7, 8, 2, 13, 11, 10, 4, 9, 12, 5, 0, 3, 6, 1, 15),
+    (5, 12, 10, 7, 15, 11, 14, 0, 8, 2, 1, 13, 3, 4, 9, 6),
+    (4, 7, 14, 13, 10, 3, 9, 12, 11, 5, 6, 15, 1, 2, 8, 0),
+    (14, 7, 1, 9, 12, 3, 6, 15, 8, 11, 2, 5, 10, 0, 4, 13),
+    (2, 11, 15, 5, 13, 4, 6, 7, 12, 8, 10, 1, 9, 3, 14, 0),
+    (12, 11, 15, 3, 8, 0, 4, 2, 6, 13, 9, 5, 14, 1, 10, 7),
+    (3, 14, 9, 11, 5, 4, 8, 2, 13, 12, 6, 7, 10, 1, 15, 0),
+    (13, 11, 8, 9, 0, 15, 7, 10, 4, 3, 6, 14, 5, 12, 2, 1),
+    (5, 9, 13, 14, 6, 3, 7, 12, 10, 8, 4, 0, 15, 2, 11, 1),
+    (14, 1, 9, 6, 4, 8, 12, 5, 7, 2, 3, 0, 10, 11, 13, 15),
+    (3, 6, 5, 2, 10, 0, 15, 14, 1, 4, 13, 12, 9, 8, 11, 7),
+    (7, 6, 8, 1, 11, 5, 14, 10, 3, 4, 9, 13, 15, 2, 0, 12),
+    (13, 11, 4, 12, 1, 8, 9, 15, 6, 5, 14, 2, 7, 3, 10, 0),
+    (1, 3, 2, 5, 10, 9, 15, 6, 8, 14, 13, 11, 12, 4, 7, 0),
+    (15, 14, 0, 4, 11, 1, 6, 13, 7, 5, 8, 9, 3, 2, 10, 12),
+    (6, 0, 14, 12, 1, 15, 9, 10, 11, 4, 7, 2, 8, 3, 5, 13),
+    (7, 11, 8, 3, 14, 0, 6, 15, 1, 4, 13, 9, 5, 12, 2, 10),
+    (6, 12, 11, 3, 13, 7, 9, 15, 2, 14, 8, 10, 4, 1, 5, 0),
+    (12, 8, 14, 6, 11, 4, 7, 0, 5, 1, 10, 15, 3, 13, 9, 2),
+    (14, 3, 9, 1, 15, 8, 4, 5, 11, 7, 10, 13, 0, 2, 12, 6),
+    (10, 9, 3, 11, 0, 13, 2, 14, 5, 6, 4, 7, 8, 15, 1, 12),
+    (7, 3, 14, 13, 4, 1, 10, 8, 5, 12, 9, 11, 2, 15, 6, 0),
+    (11, 4, 2, 7, 1, 0, 10, 15, 6, 9, 14, 8, 3, 13, 5, 12),
+    (5, 7, 3, 12, 15, 13, 14, 8, 0, 10, 9, 6, 1, 4, 2, 11),
+    (14, 1, 8, 15, 2, 6, 0, 3, 9, 12, 10, 13, 4, 7, 5, 11),
+    (13, 14, 6, 12, 4, 5, 1, 0, 9, 3, 10, 2, 15, 11, 8, 7),
+    (9, 8, 0, 2, 15, 1, 4, 14, 3, 10, 7, 5, 11, 13, 6, 12),
+    (12, 15, 2, 6, 1, 14, 4, 8, 5, 3, 7, 0, 10, 13, 9, 11),
+    (12, 8, 15, 13, 1, 0, 5, 4, 6, 3, 2, 11, 9, 7, 14, 10),
+    (14, 10, 9, 4, 13, 6, 5, 8, 2, 12, 7, 0, 1, 3, 11, 15),
+    (14, 3, 5, 15, 11, 6, 13, 9, 0, 10, 2, 12, 4, 1, 7, 8),
+    (6, 11, 7, 8, 13, 2, 5, 4, 1, 10, 3, 9, 14, 0, 12, 15),
+    (1, 6, 12, 14, 3, 2, 15, 8, 4, 5, 13, 9, 0, 7, 11, 10),
+    (12, 6, 0, 4, 7, 3, 15, 1, 13, 9, 8, 11, 2, 14, 5, 10),
+    (8, 1, 7, 12, 11, 0, 10, 5, 9, 15, 6, 13, 14, 2, 3, 4),
+    (7, 15, 8, 2, 13, 6, 3, 12, 11, 0, 4, 10, 9, 5, 1, 14),
+    (9, 0, 4, 10, 1, 14, 15, 3, 12, 6, 5, 7, 11, 13, 8, 2),
+    (11, 5, 1, 14, 4, 12, 10, 0, 2, 7, 13, 3, 9, 15, 6, 8),
+    (8, 13, 10, 9, 11, 3, 15, 6, 0, 1, 2, 14, 12, 5, 4, 7),
+    (4, 5, 7, 2, 9, 14, 12, 13, 0, 3, 6, 11, 8, 1, 15, 10),
+    (11, 15, 14, 13, 1, 9, 10, 4, 3, 6, 2, 12, 7, 5, 8, 0),
+    (12, 9, 0, 6, 8, 3, 5, 14, 2, 4, 11, 7, 10, 1, 15, 13),
+    (3, 14, 9, 7, 12, 15, 0, 4, 1, 8, 5, 6, 11, 10, 2, 13),
+    (8, 4, 6, 1, 14, 12, 2, 15, 13, 10, 9, 5, 3, 7, 0, 11),
+    (6, 10, 1, 14, 15, 8, 3, 5, 13, 0, 2, 7, 4, 9, 11, 12),
+    (8, 11, 4, 6, 7, 3, 10, 9, 2, 12, 15, 13, 0, 1, 5, 14),
+    (10, 0, 2, 4, 5, 1, 6, 12, 11, 13, 9, 7, 15, 3, 14, 8),
+    (12, 5, 13, 11, 2, 10, 0, 9, 7, 8, 4, 3, 14, 6, 15, 1),
+    (10, 2, 8, 4, 15, 0, 1, 14, 11, 13, 3, 6, 9, 7, 5, 12),
+    (10, 8, 0, 12, 3, 7, 6, 2, 1, 14, 4, 11, 15, 13, 9, 5),
+    (14, 9, 12, 13, 15, 4, 8, 10, 0, 2, 1, 7, 3, 11, 5, 6),
+    (12, 11, 0, 8, 10, 2, 13, 15, 5, 4, 7, 3, 6, 9, 14, 1),
+    (13, 8, 14, 3, 9, 1, 0, 7, 15, 5, 4, 10, 12, 2, 6, 11),
+    (3, 15, 2, 5, 11, 6, 4, 7, 12, 9, 1, 0, 13, 14, 10, 8),
+    (5, 11, 6, 9, 4, 13, 12, 0, 8, 2, 15, 10, 1, 7, 3, 14),
+    (5, 0, 15, 8, 4, 6, 1, 14, 10, 11, 3, 9, 7, 12, 2, 13),
+    (15, 14, 6, 7, 10, 1, 0, 11, 12, 8, 4, 9, 2, 5, 13, 3),
+    (11, 14, 13, 1, 2, 3, 12, 4, 15, 7, 9, 5, 10, 6, 8, 0),
+    (6, 13, 3, 2, 11, 9, 5, 10, 1, 7, 12, 14, 8, 4, 0, 15),
+    (4, 6, 12, 0, 14, 2, 9, 13, 11, 8, 3, 15, 7, 10, 1, 5),
+    (8, 10, 9, 11, 14, 1, 7, 15, 13, 4, 0, 12, 6, 2, 5, 3),
+    (5, 2, 14, 0, 7, 8, 6, 3, 11, 12, 13, 15, 4, 10, 9, 1),
+    (7, 8, 3, 2, 10, 12, 4, 6, 11, 13, 5, 15, 0, 1, 9, 14),
+    (11, 6, 14, 12, 3, 5, 1, 15, 8, 0, 10, 13, 9, 7, 4, 2),
+    (7, 1, 2, 4, 8, 3, 6, 11, 10, 15, 0, 5, 14, 12, 13, 9),
+    (7, 3, 1, 13, 12, 10, 5, 2, 8, 0, 6, 11, 14, 15, 4, 9),
+    (6, 0, 5, 15, 1, 14, 4, 9, 2, 13, 8, 10, 11, 12, 7, 3),
+    (15, 1, 3, 12, 4, 0, 6, 5, 2, 8, 14, 9, 13, 10, 7, 11),
+    (5, 7, 0, 11, 12, 1, 9, 10, 15, 6, 2, 3, 8, 4, 13, 14),
+    (12, 15, 11, 10, 4, 5, 14, 0, 13, 7, 1, 2, 9, 8, 3, 6),
+    (6, 14, 10, 5, 15, 8, 7, 1, 3, 4, 2, 0, 12, 9, 11, 13),
+    (14, 13, 4, 11, 15, 8, 6, 9, 0, 7, 3, 1, 2, 10, 12, 5),
+    (14, 4, 0, 10, 6, 5, 1, 3, 9, 2, 13, 15, 12, 7, 8, 11),
+    (15, 10, 8, 3, 0, 6, 9, 5, 1, 14, 13, 11, 7, 2, 12, 4),
+    (0, 13, 2, 4, 12, 14, 6, 9, 15, 1, 10, 3, 11, 5, 8, 7),
+    (3, 14, 13, 6, 4, 15, 8, 9, 5, 12, 10, 0, 2, 7, 1, 11),
+    (0, 1, 9, 7, 11, 13, 5, 3, 14, 12, 4, 2, 8, 6, 10, 15),
+    (11, 0, 15, 8, 13, 12, 3, 5, 10, 1, 4, 6, 14, 9, 7, 2),
+    (13, 0, 9, 12, 11, 6, 3, 5, 15, 8, 1, 10, 4, 14, 2, 7),
+    (14, 10, 2, 1, 13, 9, 8, 11, 7, 3, 6, 12, 15, 5, 4, 0),
+    (12, 3, 9, 1, 4, 5, 10, 2, 6, 11, 15, 0, 14, 7, 13, 8),
+    (15, 8, 10, 7, 0, 12, 14, 1, 5, 9, 6, 3, 13, 11, 4, 2),
+    (4, 7, 13, 10, 1, 2, 9, 6, 12, 8, 14, 5, 3, 0, 11, 15),
+    (6, 0, 5, 10, 11, 12, 9, 2, 1, 7, 4, 3, 14, 8, 13, 15),
+    (9, 5, 11, 10, 13, 0, 2, 1, 8, 6, 14, 12, 4, 7, 3, 15),
+    (15, 2, 12, 11, 14, 13, 9, 5, 1, 3, 8, 7, 0, 10, 6, 4),
+    (11, 1, 7, 4, 10, 13, 3, 8, 9, 14, 0, 15, 6, 5, 2, 12),
+    (5, 4, 7, 1, 11, 12, 14, 15, 10, 13, 8, 6, 2, 0, 9, 3),
+    (9, 7, 5, 2, 14, 15, 12, 10, 11, 3, 6, 1, 8, 13, 0, 4),
+    (3, 2, 7, 9, 0, 15, 12, 4, 6, 11, 5, 14, 8, 13, 10, 1),
+    (13, 9, 14, 6, 12, 8, 1, 2, 3, 4, 0, 7, 5, 10, 11, 15),
+    (5, 7, 11, 8, 0, 14, 9, 13, 10, 12, 3, 15, 6, 1, 4, 2),
+    (4, 3, 6, 13, 7, 15, 9, 0, 10, 5, 8, 11, 2, 12, 1, 14),
+    (1, 7, 15, 14, 2, 6, 4, 9, 12, 11, 13, 3, 0, 8, 5, 10),
+    (9, 14, 5, 7, 8, 15, 1, 2, 10, 4, 13, 6, 12, 0, 11, 3),
+    (0, 11, 3, 12, 5, 2, 1, 9, 8, 10, 14, 15, 7, 4, 13, 6),
+    (7, 15, 4, 0, 10, 9, 2, 5, 12, 11, 13, 6, 1, 3, 14, 8),
+    (11, 4, 0, 8, 6, 10, 5, 13, 12, 7, 14, 3, 1, 2, 9, 15),
+)
+
+
+def eightInstances(perDistance=2, seed=0):
+    '''
+    This function returns perDistance 8-Puzzle boards at each optimal distance from 0 to 31 as (name, board) pairs, drawn with the given seed.
+    Distances with fewer boards (there is 1 at distance 0 and 2 at distance 31) give all of them.
+    Time complexity: O(9!) to scan the distance table.
+    Space complexity: O(9!) for the ranks of the states, grouped by distance.
+    '''
+    shape = getShape(3, 3)
+    generator = random.Random(seed)
+    instances = []
+    for d in range(EIGHT_DIAMETER + 1):
+        group = ranksAtDepth(shape, d)
+        for index, rank in enumerate(sorted(generator.sample(group, min(perDistance, len(group))))):
+            tiles = unrankPositions(rank, shape.size, shape.size) # The rank of a state is the rank of its tiles in row-major order
+            instances.append(('d%02d-%d' % (d, index), [tiles[i * 3:(i + 1) * 3] for i in range(3)]))
+    return instances
+
+
+def korfBoard(tiles):
+    '''
+    This function converts a 15-Puzzle board written for the goal state of Korf's paper (the empty tile first, then 1 to 15) into a board for the goal state
+    of this repository (1 to 15, then the empty tile): the board is rotated by 180 degrees and every tile v becomes 16-v.
+    Rotating the goal state 0, 1, ..., 15 gives 15, ..., 1, 0 and the renumbering turns it into 1, ..., 15, 0, while the moves are only mirrored,
+    so the optimal solution length is the same.
+    Time complexity: O(s) Linear.
+    Space complexity: O(s) Linear.
+    '''
+    tiles = [16 - value if value else 0 for value in reversed(tiles)]
+    return [tiles[i * 4:(i + 1) * 4] for i in range(4)]
+
+
+def korfInstances():
+    '''
+    This function returns Korf's 100 15-Puzzle instances of KORF_INSTANCES as (name, board) pairs, converted with korfBoard.
+    Time complexity: O(n) Linear in the number of instances.
+    Space complexity: O(n) Linear.
+    '''
+    return [('korf%03d' % number, korfBoard(tiles)) for number, tiles in enumerate(KORF_INSTANCES, 1)]
+
+
+def loadKorf(path):
+    '''
+    This function reads 15-Puzzle instances in the format of Korf's paper from a text file, to use instead of KORF_INSTANCES, and returns them as (name, board) pairs.
+    Each line holds an optional instance number followed by the 16 tiles in row-major order, for the goal state with the empty tile first as in Korf's paper
+    (the instances are converted with korfBoard). Any further numbers on a line, like the heuristic, length and nodes columns of the paper, are ignored.
+    Blank lines and lines starting with # are skipped. It raises a ValueError for a line with fewer than 16 numbers.
+    Time complexity: O(n) Linear in the size of the file.
+    Space complexity: O(n) Linear.
+    '''
+    instances = []
+    with open(path) as file:
+        for lineNumber, line in enumerate(file, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            values = [int(value) for value in line.replace(',', ' ').split()]
+            if len(values) < 16:
+                raise ValueError("Line %d of %s: expected 16 tiles, found %d numbers" % (lineNumber, path, len(values)))
+            number, tiles = (values[0], values[1:17]) if len(values) > 16 else (len(instances) + 1, values)
+            instances.append(('korf%03d' % number, korfBoard(tiles)))
+    return instances
+
+
+def randomInstances(rows, cols, count, seed=0, depth=None):
+    '''
+    This function returns count random solvable boards of the given shape as (name, board) pairs, drawn with the given seed by puzzleGenerator.generateBoards:
+    uniformly random ones, or ones with an optimal solution of depth moves.
+    Time complexity: O(count * s^2) without a depth, see generateBoards with one.
+    Space complexity: O(count * s).
+    '''
+    return [('random%03d' % index, board) for index, board in enumerate(generateBoards(rows, cols, count, depth, seed))]
+
+
+def peakMemory():
+    '''
+    This function returns the memory high-water mark of the process in KiB. On Linux it is VmHWM of /proc/self/status, the peak of the memory of the process
+    since its program was started: ru_maxrss, used elsewhere, also keeps the peak of the process it was started from, across fork and exec.
+    It returns 0 where neither is available.
+    Time complexity: O(1) Constant.
+    Space complexity: O(1) Constant.
+    '''
+    try:
+        with open('/proc/self/status') as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource # Only on Unix
+    except ImportError:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def runInstance(board, mode, heuristic, maxNodes, timeLimit):
+    '''
+    This function solves one board in a worker process and returns its entry of the report.
+    The tables of the board shape are loaded before the clock starts, since the spawned process does not have them yet.
+    Time complexity: O(b^d), the same as the search.
+    Space complexity: O(b^d) for A*, O(d) for IDA*.
+    '''
+    from puzzleBatch import loadTables # Imported here because only the benchmark needs the tables before the search
+    loadTables(len(board), len(board[0]), mode, heuristic)
+    stats = SearchStats()
+    begin = time.perf_counter()
+    path = solvePuzzle(board, mode, heuristic, stats, maxNodes, timeLimit)
+    seconds = time.perf_counter() - begin
+    stats.addPhase('total', seconds)
+    stats.memory = peakMemory() # Instead of ru_maxrss, which still has the peak of the benchmark process
+    entry = {'seconds': round(seconds, 6), 'length': None if path is None else len(path.moves),
+             'nodesPerSecond': round(stats.expanded / seconds) if seconds else 0}
+    entry.update(stats.asDict())
+    return entry
+
+
+def instanceProcess(connection, board, mode, heuristic, maxNodes, timeLimit):
+    '''
+    This function is the target of the process of one instance: it sends ('entry', the entry of runInstance) through the connection,
+    or ('error', the message) if the search raises any exception, so a failing instance only fails its own entry.
+    Time complexity: O(b^d), the same as the search.
+    Space complexity: O(b^d) for A*, O(d) for IDA*.
+    '''
+    try:
+        connection.send(('entry', runInstance(board, mode, heuristic, maxNodes, timeLimit)))
+    except Exception as error:
+        connection.send(('error', str(error) or type(error).__name__))
+    finally:
+        connection.close()
+
+
+def runBenchmark(instances, mode='astar', heuristic='manhattan', maxNodes=None, timeLimit=None, timeout=None):
+    '''
+    This function solves every (name, board) instance in a fresh process and yields the entries of the report, in order.
+    The processes are not daemonic, unlike the workers of a multiprocessing pool, so the mode 'parallel' can start its own worker processes in them.
+    An instance that takes more than timeout seconds is stopped and has "timeout": true, and one whose search raises an exception, or whose process dies,
+    has an "error" message.
+    Time complexity: O(n * b^d) for n instances.
+    Space complexity: O(b^d) in the worker process for one instance at a time.
+    '''
+    from puzzleBatch import loadTables # Imported here because only the benchmark needs the tables before the workers start
+    if instances:
+        loadTables(len(instances[0][1]), len(instances[0][1][0]), mode, heuristic) # Built once here, not timed in the first instance
+    context = multiprocessing.get_context('spawn') # A forked process would start with the memory high-water mark of this one
+    for name, board in instances:
+        entry = {'name': name, 'board': [value for row in board for value in row]}
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=instanceProcess, args=(sender, board, mode, heuristic, maxNodes, timeLimit))
+        process.start()
+        sender.close() # Only the process writes to the pipe, so its end of the pipe reads EOF if the process dies
+        try:
+            if receiver.poll(timeout):
+                kind, value = receiver.recv()
+                if kind == 'entry':
+                    entry.update(value)
+                else:
+                    entry['error'] = value
+            else:
+                entry['timeout'] = True
+        except EOFError:
+            process.join()
+            entry['error'] = "The process of the instance exited with code %s" % process.exitcode
+        finally:
+            if process.is_alive(): # Timed out, or interrupted: terminating the process is the only way to stop the search
+                process.terminate()
+            process.join()
+            receiver.close()
+        yield entry
+
+
+def summarize(entries):
+    '''
+    This function returns the summary of the entries of a report: the number of instances solved, timed out and failed,
+    and the total time, nodes and nodes per second, and the largest memory, of the searches that finished.
+    Time complexity: O(n) Linear in the number of entries.
+    Space complexity: O(1) Constant.
+    '''
+    finished = [entry for entry in entries if 'seconds' in entry]
+    seconds = sum(entry['seconds'] for entry in finished)
+    expanded = sum(entry['expanded'] for entry in finished)
+    return {'instances': len(entries), 'solved': sum(entry['length'] is not None for entry in finished), 'timeouts': sum('timeout' in entry for entry in entries),
+            'errors': sum('error' in entry for entry in entries), 'seconds': round(seconds, 6), 'expanded': expanded,
+            'generated': sum(entry['generated'] for entry in finished), 'nodesPerSecond': round(expanded / seconds) if seconds else 0,
+            'memory': max((entry['memory'] for entry in finished), default=0)}
+
+
+def compareReports(report, baseline, tolerance=0.25):
+    '''
+    This function compares a report with a baseline report of the same instances and returns the list of regressions, as messages.
+    An instance regresses when its solution length changes, when it stops being solved, or when its time, expanded nodes or memory grow by more than
+    the tolerance (a fraction, 0.25 is 25%). Time differences under MIN_SECONDS are ignored, so the total time of the instances compared is checked too,
+    as small instances only show a slowdown in sum. Instances missing from the baseline, or with another board there, are not compared.
+    Time complexity: O(n) Linear in the number of instances.
+    Space complexity: O(n) Linear.
+    '''
+    regressions = []
+    for key in ('set', 'mode', 'heuristic'):
+        if report['settings'].get(key) != baseline['settings'].get(key):
+            regressions.append("Settings differ: %s is %r, %r in the baseline" % (key, report['settings'].get(key), baseline['settings'].get(key)))
+    before = {entry['name']: entry for entry in baseline['instances']}
+    seconds = oldSeconds = 0.0 # Total time of the instances solved in both reports
+    for entry in report['instances']:
+        old = before.get(entry['name'])
+        if old is None or old['board'] != entry['board'] or 'seconds' not in old:
+            continue
+        if 'seconds' not in entry:
+            regressions.append("%s: %s, solved in %.3f seconds in the baseline" % (entry['name'], 'timed out' if 'timeout' in entry else entry.get('error'), old['seconds']))
+            continue
+        seconds += entry['seconds']
+        oldSeconds += old['seconds']
+        if entry['length'] != old['length']:
+            regressions.append("%s: solution length %s, %s in the baseline" % (entry['name'], entry['length'], old['length']))
+        if entry['seconds'] > old['seconds'] * (1 + tolerance) and entry['seconds'] - old['seconds'] > MIN_SECONDS:
+            regressions.append("%s: %.3f seconds, %.3f in the baseline" % (entry['name'], entry['seconds'], old['seconds']))
+        for key in ('expanded', 'memory'):
+            if entry[key] > old[key] * (1 + tolerance):
+                regressions.append("%s: %s %d, %d in the baseline" % (entry['name'], key, entry[key], old[key]))
+    if seconds > oldSeconds * (1 + tolerance) and seconds - oldSeconds > MIN_SECONDS:
+        regressions.append("Total: %.3f seconds, %.3f in the baseline" % (seconds, oldSeconds))
+    return regressions
+
+
+def main():
+    '''
+    The main function reads the command line, runs the benchmark, writes the report and compares it with the baseline if one is given.
+    Time complexity: O(n * b^d)
+    Space complexity: O(n + b^d)
+    '''
+    parser = argparse.ArgumentParser(description='Benchmark the sliding-puzzle solvers on fixed sets of instances.')
+    parser.add_argument('set', choices=['eight', 'korf', 'random'], help='instance set')
+    parser.add_argument('--mode', default='astar', choices=['astar', 'idastar', 'bidirectional', 'anytime', 'parallel', 'table'])
+    parser.add_argument('--heuristic', default='manhattan', choices=['manhattan', 'linear', 'walking', 'pdb'])
+    parser.add_argument('--max-nodes', type=int, help='states A* may keep in memory before it switches to IDA*, no limit if not given')
+    parser.add_argument('--time-limit', type=float, help='seconds for each board in the anytime mode')
+    parser.add_argument('--timeout', type=float, help='seconds after which an instance is stopped, no limit if not given')
+    parser.add_argument('--per-distance', type=int, default=2, help='boards at each distance of the eight set')
+    parser.add_argument('--korf', help="file of instances for the korf set, Korf's 100 instances if not given")
+    parser.add_argument('--rows', type=int, default=3, help='rows of the boards of the random set')
+    parser.add_argument('--cols', type=int, default=3, help='columns of the boards of the random set')
+    parser.add_argument('--count', type=int, default=20, help='boards of the random set')
+    parser.add_argument('--depth', type=int, help='optimal solution length of the boards of the random set, any length if not given')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the eight and random sets')
+    parser.add_argument('--output', help='file of the report, the standard output if not given')
+    parser.add_argument('--baseline', help='report to compare with, regressions make the exit status 1')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='growth of time, nodes or memory over the baseline reported as a regression')
+    args = parser.parse_args()
+
+    if args.set == 'eight':
+        instances = eightInstances(args.per_distance, args.seed)
+    elif args.set == 'korf':
+        instances = korfInstances() if args.korf is None else loadKorf(args.korf)
+    else:
+        instances = randomInstances(args.rows, args.cols, args.count, args.seed, args.depth)
+
+    settings = {'set': args.set, 'mode': args.mode, 'heuristic': args.heuristic, 'maxNodes': args.max_nodes, 'timeLimit': args.time_limit,
+                'timeout': args.timeout, 'seed': args.seed, 'depth': args.depth, 'python': sys.version.split()[0]}
+    entries = []
+    for entry in runBenchmark(instances, args.mode, args.heuristic, args.max_nodes, args.time_limit, args.timeout):
+        entries.append(entry)
+        if 'seconds' in entry:
+            outcome = "no solution" if entry['length'] is None else "%d moves" % entry['length']
+            outcome += " in %.3f seconds, %d nodes/s" % (entry['seconds'], entry['nodesPerSecond'])
+        else:
+            outcome = 'timed out' if 'timeout' in entry else entry['error']
+        print("%s: %s" % (entry['name'], outcome), file=sys.stderr)
+    report = {'settings': settings, 'instances': entries, 'summary': summarize(entries)}
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=1)
+    else:
+        print(json.dumps(report, indent=1))
+    summary = report['summary']
+    print("Solved %d of %d in %.2f seconds (%d nodes/s, peak memory %d KiB)"
+          % (summary['solved'], summary['instances'], summary['seconds'], summary['nodesPerSecond'], summary['memory']), file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compareReports(report, json.load(file), args.tolerance)
+        for message in regressions:
+            print("Regression:", message, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("No regression against", args.baseline, file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+'''
+This module keeps the optimal solutions of the sliding puzzles already solved, so a repeated board never runs a search again.
+Boards are first put in a canonical form. Transposing a board (swapping rows and columns) and renumbering its tiles so that the transposed goal state
+is the goal state again turns an N x M board into an M x N board with the same solutions, with the moves right/down and left/up swapped.
+The canonical form is the smaller of the two, so a board and its transpose share one entry.
+Solutions are move strings stored in an SQLite file, with the most recently used ones also kept in memory.
+The file keeps at most a given number of solutions: past it, the least recently used ones are removed.
+Usage: python puzzleCache.py [FILE]
+'''
+
+import os
+import sqlite3
+import sys
+import time
+from collections import OrderedDict
+
+from patternDatabase import DATABASE_DIRECTORY
+from slidingPuzzle import PuzzlePath, getShape, isSolvable, printBoard, solvePuzzle, validateBoard
+
+# Default file of the cache.
+CACHE_PATH = os.path.join(DATABASE_DIRECTORY, 'solutions.sqlite')
+
+# The moves of a board written as the moves of its transpose: right and down, left and up are swapped.
+TRANSPOSE_MOVES = str.maketrans('RDLU', 'DRUL')
+
+# Search modes whose solutions are optimal and can be stored. The anytime mode may stop with a longer solution.
+OPTIMAL_MODES = ('astar', 'idastar', 'bidirectional', 'parallel', 'table')
+
+# Number of entries used since the last write of their time before the times are written to the file, in one transaction.
+TOUCH_BATCH = 1000
+
+
+def transposeBoard(board):
+    '''
+    This function returns the transpose of a board given as a 2D list, with every tile renumbered as the tile of the transposed goal state
+    on the cell where the tile is in the goal state. The goal state of an N x M board becomes the goal state of the M x N board.
+    Time complexity: O(s) Linear in the number of cells.
+    Space complexity: O(s) Linear.
+    '''
+    rows, cols = len(board), len(board[0])
+    transposed = [[0] * rows for _ in range(cols)]
+    for i in range(rows):
+        for j in range(cols):
+            tile = board[i][j]
+            if tile:
+                goalRow, goalCol = divmod(tile - 1, cols)
+                tile = goalCol * rows + goalRow + 1 # The tile on the transposed goal cell
+            transposed[j][i] = tile
+    return transposed
+
+
+def canonicalForm(board):
+    '''
+    This function returns (key, transposed) for a board given as a 2D list: key names the canonical form of the board in the cache,
+    and transposed is True when the canonical form is the transpose, so its moves must be translated with TRANSPOSE_MOVES.
+    Time complexity: O(s) Linear.
+    Space complexity: O(s) Linear.
+    '''
+    keys = []
+    for candidate in (board, transposeBoard(board)):
+        shape = getShape(len(candidate), len(candidate[0]))
+        keys.append('%dx%d:%x' % (shape.rows, shape.cols, shape.pack(candidate)))
+    transposed = (len(board[0]), len(board)) < (len(board), len(board[0])) or (len(board) == len(board[0]) and keys[1] < keys[0])
+    return keys[transposed], transposed
+
+
+class PuzzleCache:
+    '''
+    This class is the cache of solutions: an SQLite file with a table from canonical key to move string and the last time each entry was used,
+    and an in-memory LRU of the entries used most recently in front of it.
+    The times of use are kept in memory and written TOUCH_BATCH at a time (and by close), and the number of entries of the file is counted once when it is opened
+    and then kept up to date, so a lookup or a store never scans the table.
+    '''
+
+    def __init__(self, path=CACHE_PATH, memoryEntries=10000, diskEntries=1000000):
+        '''
+        The __init__ method opens (or creates) the cache file. memoryEntries is the size of the in-memory LRU and diskEntries the largest number of entries of the file.
+        Time complexity: O(n) to count the n entries of the file.
+        Space complexity: O(1) Constant.
+        '''
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=60) # Several solver processes may share the file
+        self.connection.execute('CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, moves TEXT NOT NULL, used INTEGER NOT NULL)')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS solutionsUsed ON solutions (used)')
+        self.connection.commit()
+        self.memory = OrderedDict() # Canonical key to move string, the least recently used first
+        self.memoryEntries = memoryEntries
+        self.diskEntries = diskEntries
+        self.hits = self.misses = 0 # Counters of the lookups
+        self.count = self.connection.execute('SELECT COUNT(*) FROM solutions').fetchone()[0] # Entries of the file, counted again only to evict
+        self.touched = {} # Canonical key to the last time of use not written to the file yet
+
+    def lookup(self, key):
+        '''
+        This method returns the move string stored for a canonical key, or None. An entry found in the file is copied to memory.
+        Either way its time of use is recorded, see touch.
+        Time complexity: O(log n) for the index of the file, O(1) Constant from memory.
+        Space complexity: O(d) for the moves.
+        '''
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.touch(key)
+            return self.memory[key]
+        row = self.connection.execute('SELECT moves FROM solutions WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        self.touch(key)
+        self.remember(key, row[0])
+        return row[0]
+
+    def touch(self, key):
+        '''
+        This method records that an entry was used now. The times are written to the file by flush once TOUCH_BATCH entries are waiting.
+        Time complexity: O(1) Constant amortized.
+        Space complexity: O(1) Constant.
+        '''
+        self.touched[key] = time.time_ns()
+        if len(self.touched) >= TOUCH_BATCH:
+            self.flush()
+
+    def flush(self):
+        '''
+        This method writes the times of use recorded by touch to the file, in one transaction.
+        Time complexity: O(k log n) for k entries.
+        Space complexity: O(1) Constant.
+        '''
+        if self.touched:
+            self.connection.executemany('UPDATE solutions SET used = ? WHERE key = ?', ((used, key) for key, used in self.touched.items()))
+            self.connection.commit()
+            self.touched.clear()
+
+    def remember(self, key, moves):
+        '''
+        This method puts an entry in the in-memory LRU, dropping the least recently used one when it is full.
+        Time complexity: O(1) Constant.
+        Space complexity: O(d) for the moves.
+        '''
+        self.memory[key] = moves
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.memoryEntries:
+            self.memory.popitem(last=False)
+
+    def get(self, board):
+        '''
+        This method returns the cached solution of a board given as a 2D list as a PuzzlePath, or None if it is not in the cache.
+        Time complexity: O(s + d) plus the lookup.
+        Space complexity: O(s + d).
+        '''
+        key, transposed = canonicalForm(board)
+        moves = self.lookup(key)
+        if moves is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if transposed:
+            moves = moves.translate(TRANSPOSE_MOVES)
+        shape = getShape(len(board), len(board[0]))
+        return PuzzlePath(shape, shape.pack(board), moves)
+
+    def put(self, board, path):
+        '''
+        This method stores the optimal solution of a board given as a 2D list, path being a PuzzlePath (or any object with a moves string).
+        When the file goes past diskEntries, the least recently used tenth of the entries is removed. The entries are only counted again then,
+        since other processes sharing the file may have added some.
+        Time complexity: O(s + d) plus O(n log n) for an eviction.
+        Space complexity: O(s + d).
+        '''
+        key, transposed = canonicalForm(board)
+        moves = path.moves.translate(TRANSPOSE_MOVES) if transposed else path.moves
+        self.touched.pop(key, None) # Its time is written now
+        if self.connection.execute('INSERT OR IGNORE INTO solutions (key, moves, used) VALUES (?, ?, ?)', (key, moves, time.time_ns())).rowcount:
+            self.count += 1
+        else: # Already stored by another process
+            self.connection.execute('UPDATE solutions SET moves = ?, used = ? WHERE key = ?', (moves, time.time_ns(), key))
+        self.connection.commit()
+        self.remember(key, moves)
+        if self.count > self.diskEntries:
+            self.flush() # The times of use decide what is removed
+            self.count = self.connection.execute('SELECT COUNT(*) FROM solutions').fetchone()[0]
+            if self.count > self.diskEntries:
+                removed = self.connection.execute('DELETE FROM solutions WHERE key IN (SELECT key FROM solutions ORDER BY used LIMIT ?)',
+                                                  (self.count - self.diskEntries + self.diskEntries // 10,)).rowcount
+                self.connection.commit()
+                self.count -= removed
+
+    def solve(self, board, mode='astar', heuristic='manhattan', stats=None, maxNodes=None, timeLimit=None):
+        '''
+        This method returns the solution of a board given as a 2D list from the cache, or solves it with solvePuzzle and stores it.
+        Only the solutions of the modes in OPTIMAL_MODES are stored. It returns None for an unsolvable board and raises a ValueError for a malformed one.
+        Time complexity: O(s + d) for a hit, the search for a miss.
+        Space complexity: O(s + d) for a hit, the search for a miss.
+        '''
+        validateBoard(board)
+        if not isSolvable(board):
+            return None
+        path = self.get(board)
+        if path is None:
+            path = solvePuzzle(board, mode, heuristic, stats, maxNodes, timeLimit)
+            if path is not None and (mode in OPTIMAL_MODES or (mode == 'anytime' and timeLimit is None)):
+                self.put(board, path)
+        return path
+
+    def close(self):
+        '''
+        This method writes the times of use not written yet and closes the cache file.
+        Time complexity: O(k log n) for the k times not written yet.
+        Space complexity: O(1) Constant.
+        '''
+        self.flush()
+        self.connection.close()
+
+
+def main():
+    '''
+    The main function solves a board and its transpose through the cache in the given file (the default file if none is given) and prints where each solution came from.
+    Time complexity: O(b^d) for the first solve, O(s + d) for the second one.
+    Space complexity: O(b^d)
+    '''
+    cache = PuzzleCache(sys.argv[1] if len(sys.argv) > 1 else CACHE_PATH)
+    board = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]
+    for startState in (board, transposeBoard(board)):
+        printBoard(startState)
+        hits = cache.hits
+        begin = time.time()
+        path = cache.solve(startState)
+        print("Number of moves:", len(path) - 1, path.moves)
+        print("From the cache" if cache.hits > hits else "Solved", "in %.4f seconds" % (time.time() - begin))
+        print("*********")
+    cache.close()
+
+
+if __name__ == '__main__':
+    main()
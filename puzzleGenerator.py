@@ -0,0 +1,157 @@
+'''
+This module generates random start states of the sliding puzzles, deterministically from a seed, optionally with a given optimal solution length (depth).
+Without a depth the boards are uniformly random among the solvable boards of the shape.
+With a depth, boards of up to TABLE_CELLS cells are drawn uniformly among the states at that distance in the distance table of distanceTable.py,
+which needs no search at all. Larger boards are built by a random walk of depth moves from the goal state, solved with an optimal search
+and kept only if no shorter solution exists, so they have exactly the requested depth but are not uniform among the states at that depth.
+The boards are written one per line in the format of puzzleBatch.py, after a comment line with the settings, so they can be piped straight into it:
+python puzzleGenerator.py --depth 24 --count 1000 | python puzzleBatch.py
+Usage: python puzzleGenerator.py [--rows 3 --cols 3] [--count 10] [--depth 20] [--seed 0] [--mode idastar] [--heuristic linear] [--output FILE]
+'''
+
+import argparse
+import random
+import sys
+import time
+from array import array
+
+from slidingPuzzle import getShape, idaStarSearch, isSolvable, makeHeuristic, solvePuzzle, unrankPositions
+
+# Largest number of cells of a board drawn from its distance table, see distanceTable.py.
+TABLE_CELLS = 9
+
+# Random walks tried in a row without finding a board of the requested depth before giving up.
+MAX_ATTEMPTS = 1000
+
+# Ranks of the states at each distance of the shapes used so far, so each distance table is only scanned once per depth.
+_ranks = {}
+
+
+def randomBoard(rows, cols, generator):
+    '''
+    This function returns a uniformly random solvable board of the given shape as a 2D list, drawn from the random.Random generator.
+    A random permutation of the tiles is unsolvable half of the time, and swapping two tiles that are not the empty tile flips its solvability.
+    Time complexity: O(s^2) for the solvability test.
+    Space complexity: O(s) Linear.
+    '''
+    tiles = list(range(rows * cols))
+    generator.shuffle(tiles)
+    board = [tiles[i * cols:(i + 1) * cols] for i in range(rows)]
+    if not isSolvable(board):
+        first, second = [cell for cell, value in enumerate(tiles) if value][:2]
+        board[first // cols][first % cols], board[second // cols][second % cols] = tiles[second], tiles[first]
+    return board
+
+
+def ranksAtDepth(shape, depth):
+    '''
+    This function returns the ranks (see distanceTable.rankState) of all the states at the given optimal distance of a shape of up to TABLE_CELLS cells, as an array.
+    The table is searched for the byte of the depth with bytes.find, which runs in C, instead of a loop over every entry.
+    A depth that is not a distance of the table (negative, or the UNREACHABLE value or more) has no states.
+    Time complexity: O(s!) for the first call for a depth, O(1) Constant afterwards.
+    Space complexity: O(k) for the k states at that distance.
+    '''
+    from distanceTable import UNREACHABLE, loadDistanceTable # Imported here because only the boards of small shapes need the table
+    if not 0 <= depth < UNREACHABLE: # The byte of the unsolvable states, or not a byte at all
+        return array('I')
+    key = (shape.rows, shape.cols, depth)
+    if key not in _ranks:
+        table = loadDistanceTable(shape)[:]
+        ranks = array('I')
+        needle = bytes([depth])
+        position = table.find(needle)
+        while position >= 0:
+            ranks.append(position)
+            position = table.find(needle, position + 1)
+        _ranks[key] = ranks
+    return _ranks[key]
+
+
+def walkBoard(shape, depth, generator):
+    '''
+    This function returns the board (as a 2D list) reached by a random walk of depth moves of the empty tile from the goal state,
+    never moving it straight back to the cell it came from.
+    Time complexity: O(d + s)
+    Space complexity: O(s) Linear.
+    '''
+    state, blank, previous = shape.goal, shape.goalBlank, -1
+    for _ in range(depth):
+        cell = generator.choice([cell for cell in shape.neighbours[blank] if cell != previous])
+        state, blank, previous = shape.slide(state, blank, cell), cell, blank
+    return shape.unpack(state)
+
+
+def generateBoards(rows, cols, count, depth=None, seed=0, mode='idastar', heuristic='linear'):
+    '''
+    This function is a generator of count random solvable boards of the given shape as 2D lists, the same ones for the same seed.
+    With a depth every board has that optimal solution length: it is drawn from the distance table for a shape of up to TABLE_CELLS cells,
+    and otherwise built by random walks that are solved with the given mode and heuristic (see solvePuzzle), which must be optimal.
+    With the idastar mode a walk is only searched up to depth-2 moves: the walk is a solution of depth moves and every solution has the parity of the walk,
+    so finding none that short proves the depth is optimal, and the last and largest iteration of IDA* is never run. The heuristic is built once per process.
+    This path is bounded by the searches, not by the generator: most long walks have a shortcut, and each one costs a search to find it.
+    On 4x4 boards at depth 40 it makes about 0.2 boards per second with the linear heuristic (0.4 with astar, 0.3 with pdb), so large sets of deep boards
+    should be generated once and saved, or drawn from a table where the shape has one.
+    It raises a ValueError if no state has that depth, or if MAX_ATTEMPTS random walks in a row give none.
+    Time complexity: O(count * s^2) without a depth or with the table, O(count * b^d) with the walks.
+    Space complexity: O(s!) for the table, O(b^d) for the search of the walks.
+    '''
+    generator = random.Random(seed)
+    shape = getShape(rows, cols)
+    if depth is not None and depth < 0:
+        raise ValueError("No %dx%d board has an optimal solution of %d moves" % (rows, cols, depth))
+    if depth is not None and shape.size <= TABLE_CELLS:
+        ranks = ranksAtDepth(shape, depth)
+        if not ranks:
+            raise ValueError("No %dx%d board has an optimal solution of %d moves" % (rows, cols, depth))
+    elif depth is not None:
+        heuristicObject = makeHeuristic(shape, heuristic)
+    for _ in range(count):
+        if depth is None:
+            yield randomBoard(rows, cols, generator)
+        elif shape.size <= TABLE_CELLS:
+            tiles = unrankPositions(generator.choice(ranks), shape.size, shape.size) # The rank of a state is the rank of its tiles in row-major order
+            yield [tiles[i * cols:(i + 1) * cols] for i in range(rows)]
+        else:
+            for _ in range(MAX_ATTEMPTS):
+                board = walkBoard(shape, depth, generator)
+                if mode == 'idastar': # No solution of depth-2 moves or less, so the walk is optimal
+                    optimal = idaStarSearch(shape, shape.pack(board), heuristicObject, maxBound=depth - 2) is None
+                else:
+                    optimal = len(solvePuzzle(board, mode, heuristic).moves) == depth # The walk may have a shortcut
+                if optimal:
+                    yield board
+                    break
+            else:
+                raise ValueError("No %dx%d board with an optimal solution of %d moves found in %d random walks" % (rows, cols, depth, MAX_ATTEMPTS))
+
+
+def main():
+    '''
+    The main function reads the command line and writes the generated boards, one per line, with the time taken on the standard error.
+    Time complexity: O(count * b^d) at worst, see generateBoards.
+    Space complexity: O(s!) or O(b^d), see generateBoards.
+    '''
+    parser = argparse.ArgumentParser(description='Generate random solvable sliding puzzles, optionally of a given optimal solution length.')
+    parser.add_argument('--rows', type=int, default=3)
+    parser.add_argument('--cols', type=int, default=3)
+    parser.add_argument('--count', type=int, default=10, help='number of boards')
+    parser.add_argument('--depth', type=int, help='optimal solution length of every board, any length if not given')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--mode', default='idastar', choices=['astar', 'idastar', 'bidirectional'], help='search that checks the depth of the boards too large for a table')
+    parser.add_argument('--heuristic', default='linear', choices=['manhattan', 'linear', 'walking', 'pdb'])
+    parser.add_argument('--output', help='file of the boards, the standard output if not given')
+    args = parser.parse_args()
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    begin = time.time()
+    print("# %dx%d boards, depth %s, seed %d" % (args.rows, args.cols, 'any' if args.depth is None else args.depth, args.seed), file=output)
+    for board in generateBoards(args.rows, args.cols, args.count, args.depth, args.seed, args.mode, args.heuristic):
+        print(' '.join(str(value) for row in board for value in row), file=output)
+    if args.output:
+        output.close()
+    elapsed = time.time() - begin
+    print("Generated %d boards in %.2f seconds (%.1f boards per second)" % (args.count, elapsed, args.count / elapsed if elapsed else 0.0), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,369 @@
+'''
+This module adds two heuristics for the sliding puzzles of slidingPuzzle.py that are stronger than the Manhattan distance and need no pattern database files.
+Both have the estimate and update methods of slidingPuzzle.ManhattanHeuristic and are selected by name in makeHeuristic: 'linear' and 'walking'.
+Linear conflict: two tiles in their goal row (or column) but in the wrong order must let one of them step out of the line and back, two more moves.
+Walking distance: the number of vertical moves needed when only the goal row of each tile is kept (which tiles are in which row), plus the same for columns.
+compareHeuristics solves boards with each heuristic and reports the number of expanded nodes.
+Usage: python puzzleHeuristics.py
+'''
+
+import time
+
+from slidingPuzzle import SearchStats, TargetManhattanHeuristic, getShape, printBoard, solvePuzzle
+
+# Heuristics compared by default in compareHeuristics.
+HEURISTICS = ('manhattan', 'linear', 'walking', 'pdb')
+
+# Largest number of abstract states of a walking distance table built in memory. The 15-Puzzle needs 24,964, a 5x3 board 352,560,
+# but the tables grow quickly past that: 5,977,015 for the rows of a 5x4 board and 65,650,495 for the 24-Puzzle.
+MAX_WALKING_STATES = 1000000
+
+# Number of packed states whose walking distance keys are remembered by WalkingDistanceHeuristic before the memory is cleared.
+KEY_CACHE_ENTRIES = 1 << 16
+
+
+def lineConflicts(goals):
+    '''
+    This function returns the linear conflict of one line: goals are the goal positions along the line of its tiles that belong to it, in the order they appear.
+    Every tile not in the longest increasing subsequence has to leave the line and come back, which costs 2 moves more than its Manhattan distance.
+    Time complexity: O(k^2) Quadratic in the number of tiles.
+    Space complexity: O(k) Linear.
+    '''
+    longest = [1] * len(goals) # longest[i] is the length of the longest increasing subsequence ending with goals[i]
+    for i in range(len(goals)):
+        for j in range(i):
+            if goals[j] < goals[i] and longest[j] + 1 > longest[i]:
+                longest[i] = longest[j] + 1
+    return 2 * (len(goals) - max(longest, default=0))
+
+
+class LinearConflictHeuristic:
+    '''
+    This class is the Manhattan distance plus the linear conflicts of every row and every column.
+    The content of a line is encoded as a key with one digit per cell: the goal position along the line plus 1 of a tile that belongs to the line, otherwise 0,
+    and the conflicts of every possible key are computed once in a table. A move only changes one row and two columns (or one column and two rows),
+    so update reads the keys of these three lines only.
+    With a target state the distances are measured to the target instead of the goal state, which is the heuristic of the backward search of
+    slidingPuzzle.bidirectionalSearch (see towards).
+    '''
+
+    def __init__(self, shape, target=None):
+        '''
+        The __init__ method builds the tables for a PuzzleShape, towards the packed target state if one is given and the goal state otherwise.
+        rowValue[tile*size+cell] is the digit of the tile in the key of the row of the cell, shifted to the place of the cell, and colValue the same for columns.
+        rowConflicts[key] and colConflicts[key] are the linear conflicts of a row and of a column with the given key.
+        Time complexity: O((c+1)^c * c^2 + (r+1)^r * r^2) for the conflict tables, plus O(s^3) for the moveDelta table of a target.
+        Space complexity: O((c+1)^c + (r+1)^r + s^2), plus O(s^3) for the moveDelta table of a target.
+        '''
+        self.shape = shape
+        self.size = size = shape.size
+        rows, cols = shape.rows, shape.cols
+        self.bits, self.mask, self.moveDelta = shape.bits, shape.mask, shape.moveDelta
+        self.manhattan = shape.heuristicManhattan
+        targetCell = list(range(-1, size - 1)) # Cell of each tile in the target state, tile t is in cell t-1 of the goal state
+        if target is not None:
+            manhattan = TargetManhattanHeuristic(shape, target)
+            self.manhattan = manhattan.estimate
+            distance = manhattan.distance
+            self.moveDelta = [distance[tile * size + toCell] - distance[tile * size + fromCell] for tile in range(size) for fromCell in range(size) for toCell in range(size)]
+            for cell in range(size):
+                targetCell[(target >> (shape.bits * cell)) & shape.mask] = cell
+        self.rowCells = [[(shape.bits * (i * cols + j), i * cols + j) for j in range(cols)] for i in range(rows)] # Bit offset and index of the cells of each row
+        self.colCells = [[(shape.bits * (i * cols + j), i * cols + j) for i in range(rows)] for j in range(cols)] # Bit offset and index of the cells of each column
+        self.rowValue = [0] * (size * size)
+        self.colValue = [0] * (size * size)
+        for tile in range(1, size):
+            goalRow, goalCol = divmod(targetCell[tile], cols)
+            for cell in range(size):
+                i, j = divmod(cell, cols)
+                if goalRow == i:
+                    self.rowValue[tile * size + cell] = (goalCol + 1) * (cols + 1) ** j
+                if goalCol == j:
+                    self.colValue[tile * size + cell] = (goalRow + 1) * (rows + 1) ** i
+        self.rowConflicts = self.conflictTable(cols)
+        self.colConflicts = self.conflictTable(rows)
+
+    def towards(self, target):
+        '''
+        This method returns the linear conflict heuristic of the same shape towards a packed target state.
+        Time complexity: O(s^3) for the moveDelta table of the target, plus the conflict tables.
+        Space complexity: O(s^3)
+        '''
+        return LinearConflictHeuristic(self.shape, target)
+
+    @staticmethod
+    def conflictTable(length):
+        '''
+        This method returns the list of the linear conflicts of every key of a line of the given length.
+        Time complexity: O((l+1)^l * l^2).
+        Space complexity: O((l+1)^l).
+        '''
+        table = []
+        for key in range((length + 1) ** length):
+            goals = []
+            for _ in range(length): # Digits from the first cell of the line to the last
+                key, digit = divmod(key, length + 1)
+                if digit:
+                    goals.append(digit - 1)
+            table.append(lineConflicts(goals))
+        return table
+
+    def lineKey(self, state, cells, values):
+        '''
+        This method returns the key of the line of a packed state made of the given cells (bit offset and index of each cell).
+        Time complexity: O(l) Linear in the length of the line.
+        Space complexity: O(1) Constant.
+        '''
+        size, mask = self.size, self.mask
+        key = 0
+        for shift, cell in cells:
+            key += values[((state >> shift) & mask) * size + cell]
+        return key
+
+    def estimate(self, state):
+        '''
+        This method returns the Manhattan distance plus the linear conflicts of all the lines of a packed state.
+        Time complexity: O(s) Linear.
+        Space complexity: O(1) Constant.
+        '''
+        h = self.manhattan(state)
+        for cells in self.rowCells:
+            h += self.rowConflicts[self.lineKey(state, cells, self.rowValue)]
+        for cells in self.colCells:
+            h += self.colConflicts[self.lineKey(state, cells, self.colValue)]
+        return h
+
+    def update(self, h, state, child, tile, fromCell, toCell):
+        '''
+        This method returns the heuristic of child. The line the tile moves along keeps the tile, the two lines across lose and gain it.
+        The keys of child are the keys of state with the digit of the tile changed, the empty tile is always 0.
+        Time complexity: O(r + c) for the keys of three lines.
+        Space complexity: O(1) Constant.
+        '''
+        size, cols = self.size, self.shape.cols
+        h += self.moveDelta[(tile * size + fromCell) * size + toCell]
+        before, after = tile * size + fromCell, tile * size + toCell
+        if fromCell // cols == toCell // cols: # Horizontal move: one row, two columns
+            along, alongConflicts, alongValue = self.rowCells[fromCell // cols], self.rowConflicts, self.rowValue
+            left, entered, acrossConflicts, acrossValue = self.colCells[fromCell % cols], self.colCells[toCell % cols], self.colConflicts, self.colValue
+        else: # Vertical move: one column, two rows
+            along, alongConflicts, alongValue = self.colCells[fromCell % cols], self.colConflicts, self.colValue
+            left, entered, acrossConflicts, acrossValue = self.rowCells[fromCell // cols], self.rowCells[toCell // cols], self.rowConflicts, self.rowValue
+        key = self.lineKey(state, along, alongValue)
+        h += alongConflicts[key - alongValue[before] + alongValue[after]] - alongConflicts[key]
+        key = self.lineKey(state, left, acrossValue)
+        h += acrossConflicts[key - acrossValue[before]] - acrossConflicts[key]
+        key = self.lineKey(state, entered, acrossValue)
+        h += acrossConflicts[key + acrossValue[after]] - acrossConflicts[key]
+        return h
+
+
+def buildWalkingTable(lines, width):
+    '''
+    This function builds the walking distance table of lines lines (rows or columns) of width cells by a breadth-first search from the goal.
+    An abstract state only keeps count[line][goal], the number of tiles in each line whose goal is in each line, and the line of the empty tile.
+    It is encoded as an integer key with base width+1: the digit at place line*lines+goal is the count, and the digit at place lines*lines is the line of the empty tile.
+    A move swaps the empty tile with any tile of a neighbouring line, so it moves one count from that line to the line of the empty tile.
+    It returns a dictionary from key to the minimum number of moves across the lines.
+    Time complexity: O(W * lines) where W is the number of abstract states (24,964 for the 15-Puzzle).
+    Space complexity: O(W).
+    '''
+    base = width + 1
+    blankPlace = base ** (lines * lines)
+    goal = sum(width * base ** (line * lines + line) for line in range(lines)) - base ** (lines * lines - 1) + (lines - 1) * blankPlace # The last line has the empty tile
+    distance = {goal: 0}
+    layer = [goal]
+    d = 0
+    while layer:
+        nextLayer = []
+        for key in layer:
+            blank = key // blankPlace
+            for line in (blank - 1, blank + 1):
+                if not 0 <= line < lines:
+                    continue
+                for goalLine in range(lines):
+                    place = base ** (line * lines + goalLine)
+                    if key // place % base: # There is a tile of this goal line to move
+                        child = key - place + base ** (blank * lines + goalLine) + (line - blank) * blankPlace
+                        if child not in distance:
+                            distance[child] = d + 1
+                            nextLayer.append(child)
+        layer = nextLayer
+        d += 1
+    return distance
+
+
+def compositions(total, bounds):
+    '''
+    This function is a generator of the tuples of len(bounds) counts with the given total, each count at most its bound.
+    Time complexity: O(k) for each of the k tuples, times the length of a tuple.
+    Space complexity: O(l) for l bounds.
+    '''
+    if len(bounds) == 1:
+        if total <= bounds[0]:
+            yield (total,)
+        return
+    for count in range(min(total, bounds[0]) + 1):
+        for rest in compositions(total - count, bounds[1:]):
+            yield (count,) + rest
+
+
+def walkingStates(lines, width):
+    '''
+    This function returns the number of abstract states of the walking distance table of lines lines of width cells, without building it.
+    For each line of the empty tile, the count[line][goal] matrices are counted line by line, keyed by how many tiles of each goal line are still to place:
+    every line has width tiles (one less for the line of the empty tile) and every goal line has width tiles (one less for the last one).
+    Time complexity: O(lines * V * C) for V vectors of counts left and C compositions of a line, fast for any board that could be solved.
+    Space complexity: O(V)
+    '''
+    states = 0
+    for blank in range(lines):
+        ways = {tuple([width] * (lines - 1) + [width - 1]): 1} # Tiles of each goal line left to place, and the number of ways to get there
+        for line in range(lines):
+            nextWays = {}
+            for left, count in ways.items():
+                for counts in compositions(width - 1 if line == blank else width, left):
+                    key = tuple(a - b for a, b in zip(left, counts))
+                    nextWays[key] = nextWays.get(key, 0) + count
+            ways = nextWays
+        states += ways.get((0,) * lines, 0)
+    return states
+
+
+# Walking distance tables built so far, by number of lines and width.
+_walkingTables = {}
+
+
+def walkingTable(lines, width):
+    '''
+    This function returns the walking distance table of the given size, building it the first time.
+    It raises a ValueError if the table has more than MAX_WALKING_STATES states, see walkingStates.
+    Time complexity: O(1) Constant after the first call.
+    Space complexity: O(1) Constant after the first call.
+    '''
+    if (lines, width) not in _walkingTables:
+        states = walkingStates(lines, width)
+        if states > MAX_WALKING_STATES:
+            raise ValueError("The walking distance table of %d lines of %d cells has %d states, more than %d: use the pdb heuristic for this board"
+                             % (lines, width, states, MAX_WALKING_STATES))
+        _walkingTables[(lines, width)] = buildWalkingTable(lines, width)
+    return _walkingTables[(lines, width)]
+
+
+class WalkingDistanceHeuristic:
+    '''
+    This class is the walking distance heuristic: the vertical walking distance (rows) plus the horizontal walking distance (columns).
+    Each move is vertical or horizontal, so the sum is admissible, and it counts the tiles that block each other in any direction, not only in their goal line.
+    The keys of the states are computed in O(s), so the keys of the children made by update are remembered (up to KEY_CACHE_ENTRIES of them):
+    a search expands a state it just generated most of the time, and then finds its keys without reading its cells.
+    '''
+
+    def __init__(self, shape):
+        '''
+        The __init__ method gets the tables of a PuzzleShape. rowValue[tile*size+cell] is the part of the vertical key given by the tile on the cell,
+        and colValue the same for the horizontal key. The empty tile gives the place of its line.
+        It raises a ValueError if a table of the shape is too large, see walkingTable.
+        Time complexity: O(s^2) plus the tables the first time.
+        Space complexity: O(s^2).
+        '''
+        self.shape = shape
+        self.size = size = shape.size
+        rows, cols = shape.rows, shape.cols
+        self.bits, self.mask = shape.bits, shape.mask
+        self.rowTable = walkingTable(rows, cols)
+        self.colTable = walkingTable(cols, rows)
+        self.rowValue = [0] * (size * size)
+        self.colValue = [0] * (size * size)
+        for cell in range(size):
+            i, j = divmod(cell, cols)
+            self.rowValue[cell] = i * (cols + 1) ** (rows * rows) # The empty tile
+            self.colValue[cell] = j * (rows + 1) ** (cols * cols)
+            for tile in range(1, size):
+                goalRow, goalCol = divmod(tile - 1, cols)
+                self.rowValue[tile * size + cell] = (cols + 1) ** (i * rows + goalRow)
+                self.colValue[tile * size + cell] = (rows + 1) ** (j * cols + goalCol)
+        self.cache = {} # Packed state to its vertical and horizontal keys
+
+    def keys(self, state):
+        '''
+        This method returns the vertical and horizontal keys of a packed state, from the cache if update made the state.
+        Time complexity: O(1) Constant for a state in the cache, O(s) Linear otherwise.
+        Space complexity: O(1) Constant.
+        '''
+        if state in self.cache:
+            return self.cache[state]
+        rowKey = colKey = 0
+        size, bits, mask = self.size, self.bits, self.mask
+        for cell in range(size):
+            index = ((state >> (bits * cell)) & mask) * size + cell
+            rowKey += self.rowValue[index]
+            colKey += self.colValue[index]
+        return rowKey, colKey
+
+    def estimate(self, state):
+        '''
+        This method returns the walking distance of a packed state.
+        Time complexity: O(s) Linear.
+        Space complexity: O(1) Constant.
+        '''
+        rowKey, colKey = self.keys(state)
+        return self.rowTable[rowKey] + self.colTable[colKey]
+
+    def update(self, h, state, child, tile, fromCell, toCell):
+        '''
+        This method returns the walking distance of child. A vertical move only changes the vertical distance and a horizontal move the horizontal one:
+        the key of child is the key of state with the tile moved from fromCell to toCell and the empty tile moved back. The keys of child are remembered.
+        Time complexity: O(1) Constant when the keys of state are in the cache, O(s) Linear otherwise.
+        Space complexity: O(1) Constant amortized, the cache is cleared when it is full.
+        '''
+        size, cache = self.size, self.cache
+        rowKey, colKey = cache[state] if state in cache else self.keys(state)
+        if fromCell // self.shape.cols != toCell // self.shape.cols: # Vertical move
+            rowChild = rowKey - self.rowValue[tile * size + fromCell] + self.rowValue[tile * size + toCell] - self.rowValue[toCell] + self.rowValue[fromCell]
+            h += self.rowTable[rowChild] - self.rowTable[rowKey]
+            colChild = colKey
+        else:
+            colChild = colKey - self.colValue[tile * size + fromCell] + self.colValue[tile * size + toCell] - self.colValue[toCell] + self.colValue[fromCell]
+            h += self.colTable[colChild] - self.colTable[colKey]
+            rowChild = rowKey
+        if len(cache) >= KEY_CACHE_ENTRIES:
+            cache.clear()
+        cache[child] = (rowChild, colChild)
+        return h
+
+
+def compareHeuristics(board, heuristics=HEURISTICS, mode='idastar'):
+    '''
+    This function solves a board given as a 2D list with each of the named heuristics and returns a list of (name, moves, expanded, generated, seconds),
+    moves being None for an unsolvable board.
+    Time complexity: O(b^d) for each heuristic.
+    Space complexity: O(d) with IDA*, O(b^d) with A*.
+    '''
+    results = []
+    for name in heuristics:
+        stats = SearchStats()
+        begin = time.time()
+        path = solvePuzzle(board, mode, name, stats)
+        results.append((name, None if path is None else len(path) - 1, stats.expanded, stats.generated, time.time() - begin))
+    return results
+
+
+def main():
+    '''
+    The main function compares the heuristics on a few 8-Puzzle and 15-Puzzle boards with IDA* and prints the number of expanded nodes.
+    Time complexity: O(b^d)
+    Space complexity: O(d)
+    '''
+    boards = [
+        [[8, 6, 7], [2, 5, 4], [3, 0, 1]], # One of the two hardest 8-Puzzle boards (31 moves)
+        [[5, 15, 8, 7], [1, 0, 2, 3], [4, 9, 11, 14], [13, 6, 10, 12]],
+    ]
+    for board in boards:
+        printBoard(board)
+        for name, moves, expanded, generated, seconds in compareHeuristics(board):
+            print("%-10s %3d moves %12d expanded %12d generated %8.2f seconds" % (name, moves, expanded, generated, seconds))
+        print("*********")
+
+
+if __name__ == '__main__':
+    main()
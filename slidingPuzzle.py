@@ -0,0 +1,1122 @@
+'''
+This module is the search engine for sliding puzzles of any size: the 8-Puzzle (3x3), the 15-Puzzle (4x4), the 24-Puzzle (5x5), or any N x M board.
+The tiles are numbered from 1 to N*M-1 and the empty tile is represented as 0. The goal state has the tiles in order with the empty tile last, for 3x3:
+1 2 3
+4 5 6
+7 8 0
+States are packed into a single integer with a fixed number of bits per cell in row-major order, so hashing, comparing and moving are integer operations.
+Every table that depends only on the board shape (neighbours, goal positions, Manhattan distances) is computed once per shape by getShape.
+Two search algorithms are available:
+A* (aStarSearch) is fast on small boards but keeps every visited state in memory.
+IDA* (idaStarSearch) is a depth-first iterative-deepening search whose memory is linear in the solution depth, which is needed for 4x4 and 5x5 boards.
+Both take a heuristic object (see ManhattanHeuristic), so stronger heuristics such as the pattern databases in patternDatabase.py can be used.
+Bidirectional A* (bidirectionalSearch) searches forward from the start state and backward from the goal state at the same time until the two searches meet in the middle.
+parallelAStar.py spreads A* over several processes for the hard instances.
+Anytime repairing A* (anytimeSearch) returns a first solution fast with a large heuristic weight, then better ones with smaller weights until the optimal one or a deadline.
+Small boards such as the 8-Puzzle can also be solved with no search at all from the complete distance table of distanceTable.py.
+A solution is a string of moves of the empty tile (R, D, L, U), and a PuzzlePath expands it into boards only when they are read.
+'''
+
+import time
+
+try:
+    import resource # Only on Unix, for the memory high-water mark of SearchStats
+except ImportError:
+    resource = None
+
+# Value returned by the IDA* depth-first search when the goal has been found.
+FOUND = -1
+
+# Larger than any f-value, used when a subtree has no more nodes to explore.
+INFINITY = float('inf')
+
+# The moves of the empty tile: right, down, left and up. A solution is a string of these letters.
+MOVES = 'RDLU'
+
+# Heuristic weights of the successive searches of anytimeSearch, each solution costs at most weight times the optimal cost.
+DEFAULT_WEIGHTS = (3, 2, 1.5, 1.25, 1)
+
+# Weights are used in steps of 1/WEIGHT_SCALE, so the priorities g + weight*h stay integers for the BucketQueue.
+WEIGHT_SCALE = 4
+
+
+class PuzzleShape:
+    '''
+    This class holds the precomputed tables of one board shape. Use getShape to get the shared instance of a shape.
+    '''
+
+    def __init__(self, rows, cols):
+        '''
+        The __init__ method builds the tables for a board with the given number of rows and columns.
+        bits is the number of bits of each cell in a packed state, and mask extracts one cell.
+        goal is the packed goal state and goalBlank is the cell of the empty tile in it.
+        neighbours[blank] are the cells the empty tile can move to from the given cell, in the order right, down, left, up,
+        and moves[blank] are the indexes in MOVES of these moves. offsets[move] is the change of the cell of the empty tile for each move.
+        manhattan[tile*size+cell] is the Manhattan distance of the tile from its goal cell when it is on the given cell (0 for the empty tile).
+        moveDelta[(tile*size+fromCell)*size+toCell] is the change of the Manhattan distance when the tile slides from fromCell to toCell.
+        Time complexity: O(s^3) where s = rows*cols is the number of cells, for the moveDelta table.
+        Space complexity: O(s^3).
+        '''
+        self.rows = rows # Number of rows
+        self.cols = cols # Number of columns
+        self.size = rows * cols # Number of cells
+        self.bits = max(1, (self.size - 1).bit_length()) # Bits needed to store the largest tile
+        self.mask = (1 << self.bits) - 1 # Mask of one cell
+        self.goalBoard = [[(i * cols + j + 1) % self.size for j in range(cols)] for i in range(rows)] # The goal state as 2D list
+        self.goal = self.pack(self.goalBoard) # The goal state packed into an integer
+        self.goalBlank = self.size - 1 # The empty tile is on the last cell in the goal state
+
+        size = self.size
+        self.offsets = (1, cols, -1, -cols) # Same order as MOVES
+        self.neighbours = []
+        self.moves = []
+        for blank in range(size):
+            i, j = divmod(blank, cols)
+            moves = tuple(move for move, (row, col) in enumerate(((0, 1), (1, 0), (0, -1), (-1, 0)))
+                          if 0 <= i + row < rows and 0 <= j + col < cols)
+            self.moves.append(moves)
+            self.neighbours.append(tuple(blank + self.offsets[move] for move in moves))
+
+        self.manhattan = [0] * (size * size)
+        for tile in range(1, size):
+            for cell in range(size):
+                self.manhattan[tile * size + cell] = abs(cell // cols - (tile - 1) // cols) + abs(cell % cols - (tile - 1) % cols)
+
+        self.moveDelta = [0] * (size * size * size)
+        for tile in range(1, size):
+            for fromCell in range(size):
+                for toCell in self.neighbours[fromCell]: # Tiles only slide to neighbouring cells
+                    self.moveDelta[(tile * size + fromCell) * size + toCell] = self.manhattan[tile * size + toCell] - self.manhattan[tile * size + fromCell]
+
+    def pack(self, board):
+        '''
+        This method encodes a 2D list board into a single integer. Cell (i, j) is stored at bit offset bits*(i*cols+j).
+        Time complexity: O(s) Linear in the number of cells.
+        Space complexity: O(1) Constant.
+        '''
+        state = 0
+        for i in range(self.rows):
+            for j in range(self.cols):
+                state |= board[i][j] << (self.bits * (i * self.cols + j)) # Place the tile value into the bits of its cell.
+        return state
+
+    def unpack(self, state):
+        '''
+        This method decodes a packed state back into a 2D list. It is only used at the edges (printing, drawing and returned paths).
+        Time complexity: O(s) Linear.
+        Space complexity: O(s) Linear.
+        '''
+        return [[(state >> (self.bits * (i * self.cols + j))) & self.mask for j in range(self.cols)] for i in range(self.rows)]
+
+    def findBlank(self, state):
+        '''
+        This method returns the cell of the empty tile in a packed state.
+        Time complexity: O(s) Linear.
+        Space complexity: O(1) Constant.
+        '''
+        blank = 0
+        while (state >> (self.bits * blank)) & self.mask != 0:
+            blank += 1
+        return blank
+
+    def slide(self, state, blank, cell):
+        '''
+        This method returns the packed state after the tile on cell slides into the empty cell blank.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        tile = (state >> (self.bits * cell)) & self.mask
+        return state ^ (tile << (self.bits * cell)) ^ (tile << (self.bits * blank))
+
+    def moveString(self, blank, cells):
+        '''
+        This method returns the move string of a list of cells visited one after another by the empty tile, starting from blank.
+        Time complexity: O(d) Linear in the number of moves.
+        Space complexity: O(d) Linear.
+        '''
+        moves = []
+        for cell in cells:
+            moves.append(MOVES[self.offsets.index(cell - blank)])
+            blank = cell
+        return ''.join(moves)
+
+    def heuristicManhattan(self, state):
+        '''
+        This method computes the Manhattan distance of a packed state.
+        It is only needed for the start state, every other state gets its heuristic from its parent through moveDelta.
+        Time complexity: O(s) Linear.
+        Space complexity: O(1) Constant.
+        '''
+        distance = 0
+        for cell in range(self.size):
+            distance += self.manhattan[((state >> (self.bits * cell)) & self.mask) * self.size + cell] # Distance of the tile in this cell from its goal cell.
+        return distance
+
+
+def permutationCount(n, k):
+    '''
+    This function returns the number of ways to place k distinct tiles on n cells, n!/(n-k)!, which is the number of ranks of rankPositions.
+    Time complexity: O(k) Linear.
+    Space complexity: O(1) Constant.
+    '''
+    count = 1
+    for i in range(k):
+        count *= n - i
+    return count
+
+
+def rankPositions(positions, n):
+    '''
+    This function returns the rank (Lehmer code) of a list of k distinct cells out of n cells, a number from 0 to permutationCount(n, k)-1.
+    Each cell is counted among the cells not used by the previous ones, and these digits are combined in the mixed radix n, n-1, ..., n-k+1.
+    When k == n this is the rank of a whole permutation.
+    Time complexity: O(k) Linear.
+    Space complexity: O(1) Constant.
+    '''
+    rank = 0
+    used = 0 # Bit mask of the cells of the previous positions
+    for i, cell in enumerate(positions):
+        rank = rank * (n - i) + cell - (used & ((1 << cell) - 1)).bit_count() # Number of free cells before this one
+        used |= 1 << cell
+    return rank
+
+
+def unrankPositions(rank, k, n):
+    '''
+    This function is the inverse of rankPositions: it returns the list of k distinct cells out of n cells with the given rank.
+    Time complexity: O(k*n).
+    Space complexity: O(n).
+    '''
+    digits = []
+    for i in range(k - 1, -1, -1): # The last digit has the smallest radix n-k+1
+        rank, digit = divmod(rank, n - i)
+        digits.append(digit)
+    free = list(range(n)) # Cells not used yet, in increasing order
+    return [free.pop(digit) for digit in reversed(digits)]
+
+
+def validateBoard(board):
+    '''
+    This function checks that a board is a well-formed 2D list: at least 2 rows and 2 columns, all rows of the same length,
+    and every number from 0 to N*M-1 exactly once. It raises a ValueError that describes the first problem found.
+    Time complexity: O(s log s) for sorting the tiles.
+    Space complexity: O(s) Linear.
+    '''
+    if not isinstance(board, (list, tuple)) or len(board) < 2 or not all(isinstance(row, (list, tuple)) for row in board):
+        raise ValueError("The board must be a list of at least 2 rows")
+    cols = len(board[0])
+    if cols < 2 or any(len(row) != cols for row in board):
+        raise ValueError("All rows of the board must have the same length of at least 2")
+    tiles = [value for row in board for value in row]
+    if not all(type(value) is int for value in tiles) or sorted(tiles) != list(range(len(tiles))):
+        raise ValueError("The board must contain each number from 0 to %d exactly once" % (len(tiles) - 1))
+
+
+def isSolvable(board):
+    '''
+    This function checks with the parity of the inversions whether the goal state can be reached from a board given as a 2D list.
+    An inversion is a pair of tiles (the empty tile is not counted) in the wrong order when the board is read in row-major order.
+    A horizontal move never changes the number of inversions, and a vertical move changes it by cols-1.
+    With an odd number of columns the parity of the inversions never changes, so it must be even like in the goal state.
+    With an even number of columns each vertical move flips it, so the inversions plus the rows between the empty tile and the last row must be even.
+    Time complexity: O(s^2) Quadratic in the number of cells.
+    Space complexity: O(s) Linear.
+    '''
+    tiles = [value for row in board for value in row if value != 0]
+    inversions = 0
+    for i in range(len(tiles)):
+        for j in range(i + 1, len(tiles)):
+            if tiles[i] > tiles[j]:
+                inversions += 1
+    if len(board[0]) % 2 == 1:
+        return inversions % 2 == 0
+    blankRow = next(i for i, row in enumerate(board) if 0 in row)
+    return (inversions + len(board) - 1 - blankRow) % 2 == 0
+
+
+# Tables of every shape used so far, so each shape is only built once.
+_shapes = {}
+
+
+def getShape(rows, cols):
+    '''
+    This function returns the PuzzleShape of a board with the given number of rows and columns, building it the first time it is requested.
+    Time complexity: O(1) Constant after the first call for a shape.
+    Space complexity: O(1) Constant after the first call for a shape.
+    '''
+    if (rows, cols) not in _shapes:
+        _shapes[(rows, cols)] = PuzzleShape(rows, cols)
+    return _shapes[(rows, cols)]
+
+
+class ManhattanHeuristic:
+    '''
+    This class is the Manhattan distance heuristic. Every heuristic used by the search functions has the same two methods:
+    estimate(state) computes the heuristic of a packed state from scratch, it is only called for the start state.
+    update(h, state, child, tile, fromCell, toCell) returns the heuristic of child, the state reached from state (whose heuristic is h)
+    by sliding tile from fromCell to toCell.
+    A heuristic may also have towards(target), which returns the same heuristic measured to a packed target state instead of the goal state,
+    for the backward search of bidirectionalSearch.
+    '''
+
+    def __init__(self, shape):
+        '''
+        The __init__ method keeps the tables of the given PuzzleShape.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        self.shape = shape
+        self.size = shape.size
+        self.moveDelta = shape.moveDelta
+
+    def estimate(self, state):
+        '''
+        This method returns the Manhattan distance of a packed state.
+        Time complexity: O(s) Linear.
+        Space complexity: O(1) Constant.
+        '''
+        return self.shape.heuristicManhattan(state)
+
+    def update(self, h, state, child, tile, fromCell, toCell):
+        '''
+        This method returns the Manhattan distance of child: only the tile that slides changes its distance, by moveDelta.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        return h + self.moveDelta[(tile * self.size + fromCell) * self.size + toCell]
+
+    def towards(self, target):
+        '''
+        This method returns the Manhattan distance to a packed target state.
+        Time complexity: O(s^2) Quadratic in the number of cells.
+        Space complexity: O(s^2).
+        '''
+        return TargetManhattanHeuristic(self.shape, target)
+
+
+class TargetManhattanHeuristic:
+    '''
+    This class is the Manhattan distance to any target state instead of the goal state, with the same methods as ManhattanHeuristic.
+    It is the heuristic of the backward search of bidirectionalSearch, whose target is the start state, when the forward heuristic has no towards method.
+    '''
+
+    def __init__(self, shape, target):
+        '''
+        The __init__ method builds the table distance[tile*size+cell], the Manhattan distance of the tile from its cell in the packed target state.
+        Time complexity: O(s^2) Quadratic in the number of cells.
+        Space complexity: O(s^2).
+        '''
+        self.size = size = shape.size
+        self.bits, self.mask = shape.bits, shape.mask
+        cols = shape.cols
+        targetCell = [0] * size # Cell of each tile in the target state
+        for cell in range(size):
+            targetCell[(target >> (shape.bits * cell)) & shape.mask] = cell
+        self.distance = [0] * (size * size)
+        for tile in range(1, size):
+            for cell in range(size):
+                self.distance[tile * size + cell] = abs(cell // cols - targetCell[tile] // cols) + abs(cell % cols - targetCell[tile] % cols)
+
+    def estimate(self, state):
+        '''
+        This method returns the Manhattan distance of a packed state from the target state.
+        Time complexity: O(s) Linear.
+        Space complexity: O(1) Constant.
+        '''
+        return sum(self.distance[((state >> (self.bits * cell)) & self.mask) * self.size + cell] for cell in range(self.size))
+
+    def update(self, h, state, child, tile, fromCell, toCell):
+        '''
+        This method returns the Manhattan distance of child from the target state: only the tile that slides changes its distance.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        return h + self.distance[tile * self.size + toCell] - self.distance[tile * self.size + fromCell]
+
+
+# Heuristic objects built so far, by shape and name, so the tables of a heuristic are built once per process.
+_heuristics = {}
+
+
+def makeHeuristic(shape, name):
+    '''
+    This function returns the heuristic object with the given name for a PuzzleShape:
+    'manhattan' for the Manhattan distance, 'linear' for the Manhattan distance with linear conflicts, 'walking' for the walking distance
+    (both in puzzleHeuristics.py), or 'pdb' for the additive pattern databases of patternDatabase.py (built and saved on first use).
+    The heuristic objects keep no state between searches, so the same one is returned for every call with the same shape and name.
+    Time complexity: O(1) Constant, except the first time the tables of a shape are built.
+    Space complexity: O(1) Constant, the pattern databases are memory-mapped.
+    '''
+    key = (shape.rows, shape.cols, name)
+    if key not in _heuristics:
+        _heuristics[key] = buildHeuristic(shape, name)
+    return _heuristics[key]
+
+
+def buildHeuristic(shape, name):
+    '''
+    This function builds the heuristic object with the given name for a PuzzleShape, see makeHeuristic.
+    It raises a ValueError for an unknown name.
+    Time complexity: O(1) Constant, plus the tables of the heuristic.
+    Space complexity: O(1) Constant, plus the tables of the heuristic.
+    '''
+    if name == 'manhattan':
+        return ManhattanHeuristic(shape)
+    if name in ('linear', 'walking'):
+        from puzzleHeuristics import LinearConflictHeuristic, WalkingDistanceHeuristic # Imported here because puzzleHeuristics.py imports this module
+        return LinearConflictHeuristic(shape) if name == 'linear' else WalkingDistanceHeuristic(shape)
+    if name == 'pdb':
+        from patternDatabase import loadPatternDatabase # Imported here because patternDatabase.py imports this module
+        return loadPatternDatabase(shape)
+    raise ValueError("Unknown heuristic: " + str(name))
+
+
+class SearchStats:
+    '''
+    This class collects counters of a search. Pass an instance to a search function to fill it, the counters are added up over several searches
+    (the peaks keep their maximum). Without a SearchStats object the searches only keep a few local counters and the heuristic is not timed.
+    '''
+
+    def __init__(self):
+        '''
+        The __init__ method sets every counter to 0.
+        expanded is the number of nodes whose children were generated, generated is the number of children generated,
+        and duplicates is the number of children dropped because their state was already reached by a path at least as cheap.
+        peakOpen is the largest number of nodes in the open list (the deepest path for IDA*), and peakClosed the largest number of states kept in memory.
+        heuristicTime is the time spent computing the heuristic, phases maps the name of each phase of the search to its time, in seconds.
+        depth is the number of moves of the last solution and memory the memory high-water mark of the process in KiB (0 where it is not available).
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        self.expanded = 0 # Nodes expanded
+        self.generated = 0 # Children generated
+        self.duplicates = 0 # Children pruned as duplicates
+        self.peakOpen = 0 # Largest open list
+        self.peakClosed = 0 # Largest number of states in memory
+        self.heuristicTime = 0.0 # Seconds in the heuristic
+        self.phases = {} # Seconds of each phase
+        self.depth = 0 # Moves of the last solution
+        self.memory = 0 # Memory high-water mark in KiB
+
+    def add(self, expanded, generated, duplicates=0, peakOpen=0, peakClosed=0):
+        '''
+        This method adds the counters of one search.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        self.expanded += expanded
+        self.generated += generated
+        self.duplicates += duplicates
+        self.peakOpen = max(self.peakOpen, peakOpen)
+        self.peakClosed = max(self.peakClosed, peakClosed)
+
+    def addPhase(self, name, seconds):
+        '''
+        This method adds the time of a phase and reads the memory high-water mark of the process.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        if resource is not None:
+            self.memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss # KiB on Linux
+
+    def branchingFactor(self):
+        '''
+        This method returns the effective branching factor b*: the branching factor of a uniform tree of the depth of the solution with as many nodes as were generated,
+        1 + b* + b*^2 + ... + b*^depth = generated + 1. It is found by bisection, and is 0 when nothing was generated.
+        Time complexity: O(d) for each of the 50 steps of the bisection.
+        Space complexity: O(1) Constant.
+        '''
+        if not self.generated or not self.depth:
+            return 0.0
+        low, high = 0.0, float(self.generated)
+        for _ in range(50):
+            middle = (low + high) / 2
+            total, power = 1.0, 1.0
+            for _ in range(self.depth):
+                power *= middle
+                total += power
+            if total < self.generated + 1:
+                low = middle
+            else:
+                high = middle
+        return (low + high) / 2
+
+    def asDict(self):
+        '''
+        This method returns the counters as a dictionary, for example to write them as JSON.
+        Time complexity: O(p) Linear in the number of phases.
+        Space complexity: O(p) Linear.
+        '''
+        return {'expanded': self.expanded, 'generated': self.generated, 'duplicates': self.duplicates,
+                'peakOpen': self.peakOpen, 'peakClosed': self.peakClosed, 'heuristicTime': round(self.heuristicTime, 6),
+                'branchingFactor': round(self.branchingFactor(), 4), 'phases': {name: round(seconds, 6) for name, seconds in self.phases.items()},
+                'memory': self.memory}
+
+
+class TimedHeuristic:
+    '''
+    This class wraps a heuristic object and adds the time of every call to the heuristicTime of a SearchStats object.
+    The searches only use it when they are given a SearchStats object.
+    '''
+
+    def __init__(self, heuristic, stats):
+        '''
+        The __init__ method keeps the wrapped heuristic and the SearchStats object.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        self.heuristic = heuristic
+        self.stats = stats
+
+    def estimate(self, state):
+        '''
+        This method returns the estimate of the wrapped heuristic and counts its time.
+        Time complexity: O(1) plus the wrapped estimate.
+        Space complexity: O(1) Constant.
+        '''
+        begin = time.perf_counter()
+        h = self.heuristic.estimate(state)
+        self.stats.heuristicTime += time.perf_counter() - begin
+        return h
+
+    def update(self, h, state, child, tile, fromCell, toCell):
+        '''
+        This method returns the update of the wrapped heuristic and counts its time.
+        Time complexity: O(1) plus the wrapped update.
+        Space complexity: O(1) Constant.
+        '''
+        begin = time.perf_counter()
+        h = self.heuristic.update(h, state, child, tile, fromCell, toCell)
+        self.stats.heuristicTime += time.perf_counter() - begin
+        return h
+
+
+class Node:
+    '''
+    This class represents a node in the open list of the A* search.
+    It has __slots__ instead of a __dict__ and no parent pointer: the move that reached each state is kept in the seen dictionary of aStarSearch,
+    so a node can be freed as soon as it is expanded.
+    '''
+    __slots__ = ('state', 'blank', 'g', 'h')
+
+    def __init__(self, state, blank, g, h):
+        '''
+        The __init__ method is the constructor for the Node class.
+        The state parameter is the packed state, blank is the cell of the empty tile, g is the cost to reach the state
+        and h is the estimated cost to reach the goal state.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        self.state = state # Current state
+        self.blank = blank # Cell of the empty tile
+        self.g = g # Cost to reach current state
+        self.h = h # Estimated cost to reach the goal state
+
+
+class PuzzlePath:
+    '''
+    This class is a solution path stored as its start state and its move string. The boards are only built when they are read,
+    so a path takes one character per move instead of one 2D list per state.
+    It behaves like the list of 2D lists from the start state to the goal state: len, iteration and indexing give the boards.
+    '''
+
+    def __init__(self, shape, start, moves):
+        '''
+        The __init__ method takes the PuzzleShape, the packed start state and the string of moves of the empty tile.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        self.shape = shape
+        self.start = start
+        self.moves = moves
+
+    def __len__(self):
+        '''
+        The len method returns the number of boards of the path, one more than the number of moves.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        return len(self.moves) + 1
+
+    def states(self):
+        '''
+        This method yields the packed states of the path one at a time by replaying the moves on the start state.
+        Time complexity: O(d + s) for d moves.
+        Space complexity: O(1) Constant.
+        '''
+        shape = self.shape
+        state, blank = self.start, shape.findBlank(self.start)
+        yield state
+        for move in self.moves:
+            cell = blank + shape.offsets[MOVES.index(move)]
+            state = shape.slide(state, blank, cell)
+            blank = cell
+            yield state
+
+    def __iter__(self):
+        '''
+        The iter method yields the boards of the path as 2D lists, one at a time.
+        Time complexity: O(d*s) for all the boards.
+        Space complexity: O(s) for one board.
+        '''
+        for state in self.states():
+            yield self.shape.unpack(state)
+
+    def __getitem__(self, index):
+        '''
+        The getitem method returns the board at the given index as a 2D list, or a list of boards for a slice.
+        Time complexity: O(d + s) to replay the moves up to the index.
+        Space complexity: O(s) Linear, O(d*s) for a slice.
+        '''
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PuzzlePath index out of range")
+        for i, state in enumerate(self.states()):
+            if i == index:
+                return self.shape.unpack(state)
+
+    def tiles(self):
+        '''
+        This method returns the tile that slides at each move of the path.
+        Time complexity: O(d + s) for d moves.
+        Space complexity: O(d) Linear.
+        '''
+        shape = self.shape
+        tiles = []
+        state, blank = self.start, shape.findBlank(self.start)
+        for move in self.moves:
+            cell = blank + shape.offsets[MOVES.index(move)]
+            tiles.append((state >> (shape.bits * cell)) & shape.mask)
+            state = shape.slide(state, blank, cell)
+            blank = cell
+        return tiles
+
+
+class BucketQueue:
+    '''
+    This class represents the open list (fringe) of the A* search as buckets indexed by f-value.
+    Since f-values are small integers, buckets[f][g] holds the nodes with that f and g, so push and pop never compare nodes.
+    Among the nodes with the lowest f, the ones with the highest g (the deepest ones, closest to the goal) are popped first.
+    '''
+
+    def __init__(self):
+        '''
+        The __init__ method creates an empty queue.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        self.buckets = [] # buckets[f] is a list indexed by g, each entry is a list of nodes
+        self.minF = 0 # No bucket below minF contains a node
+        self.size = 0 # Number of nodes in the queue
+
+    def __len__(self):
+        '''
+        The len method returns the number of nodes in the queue.
+        Time complexity: O(1) Constant.
+        Space complexity: O(1) Constant.
+        '''
+        return self.size
+
+    def push(self, f, g, node):
+        '''
+        The push method adds a node to the bucket of its f and g values, creating the missing buckets.
+        Time complexity: O(1) Constant amortized.
+        Space complexity: O(1) Constant amortized.
+        '''
+        while len(self.buckets) <= f: # Create the f buckets up to this f
+            self.buckets.append([])
+        bucket = self.buckets[f]
+        while len(bucket) <= g: # Create the g lists up to this g
+            bucket.append([])
+        bucket[g].append(node)
+        if f < self.minF: # Keep minF pointing at the lowest bucket that may be non-empty
+            self.minF = f
+        self.size += 1
+
+    def lowestF(self):
+        '''
+        The lowestF method returns the lowest f of the nodes in the queue (INFINITY if it is empty) without removing them.
+        Entries that are stale in the search still count, so the value is a lower bound of the f of the nodes left to expand.
+        Time complexity: O(1) Constant amortized.
+        Space complexity: O(1) Constant.
+        '''
+        if not self.size:
+            return INFINITY
+        while not any(self.buckets[self.minF]): # Skip the empty buckets, the queue is not empty so one bucket above has a node
+            self.minF += 1
+        return self.minF
+
+    def pop(self):
+        '''
+        The pop method removes and returns the node with the lowest f, breaking ties in favour of the highest g.
+        Empty g lists at the end of a bucket are dropped on the way, so each list is skipped at most once.
+        Time complexity: O(1) Constant amortized.
+        Space complexity: O(1) Constant.
+        '''
+        bucket = self.buckets[self.minF]
+        while not bucket or not bucket[-1]: # Skip to the first non-empty bucket and its deepest g list
+            if bucket:
+                bucket.pop()
+            else:
+                self.minF += 1
+                bucket = self.buckets[self.minF]
+        self.size -= 1
+        return bucket[-1].pop()
+
+
+def traceMoves(shape, seen, start, state, blank):
+    '''
+    This function returns the move string from the start state to a state reached by a search, where seen maps each state to g<<2|move
+    with move the index in MOVES of the last move of the path to it. blank is the cell of the empty tile in state.
+    The moves are undone one by one from state back to the start state.
+    Time complexity: O(d) Linear in the number of moves.
+    Space complexity: O(d) Linear.
+    '''
+    moves = []
+    while state != start:
+        move = seen[state] & 3
+        moves.append(MOVES[move])
+        cell = blank - shape.offsets[move] # The cell the empty tile came from
+        state = shape.slide(state, blank, cell)
+        blank = cell
+    return ''.join(reversed(moves))
+
+
+def aStarSearch(shape, start, heuristic=None, stats=None, maxNodes=None):
+    '''
+    This function implements the A* search algorithm.
+    It takes a PuzzleShape, a packed start state and a heuristic object (the Manhattan distance if it is None) and returns the move string from the start state to the goal state, or None if there is no solution.
+    If a SearchStats object is given, the counters of the search are added to it, and the time of the 'search' and 'trace' phases.
+    maxNodes is the largest number of states A* may keep in memory (no limit if it is None). When the search goes past it, A* drops its open list and seen dictionary
+    and IDA* takes over, with a memory linear in the depth. The lowest f of the open list is a lower bound of the solution cost, so it is the first bound of IDA*
+    and the iterations A* already covered are skipped. The fallback needs a solvable start state, like idaStarSearch.
+    The function uses a BucketQueue to keep track of the fringe and a dictionary seen that maps each generated state to g<<2|move,
+    the lowest cost found so far to reach it and the index in MOVES of the last move of that path.
+    A state is only pushed again when a cheaper path to it is found, and entries that were superseded by a cheaper one are skipped when popped.
+    The path is traced back from the goal by undoing the stored moves, so the nodes need no parent pointer.
+    Time complexity: O(b^d), where b is the branching factor and d is the depth of the solution.
+    Space complexity: O(b^d). The algorithm keeps track of all visited states, one small integer each. O(maxNodes) with a budget.
+    '''
+    if heuristic is None:
+        heuristic = ManhattanHeuristic(shape)
+    if stats is not None:
+        heuristic = TimedHeuristic(heuristic, stats)
+    begin = time.perf_counter()
+    bits, mask, goal = shape.bits, shape.mask, shape.goal
+    neighbours, moves, update = shape.neighbours, shape.moves, heuristic.update
+    limit = INFINITY if maxNodes is None else maxNodes
+    root = Node(start, shape.findBlank(start), 0, heuristic.estimate(start))
+    queue = BucketQueue()
+    queue.push(root.h, 0, root)
+    seen = {start: 0} # g<<2|move of the cheapest path found so far to each generated state
+    expanded = generated = duplicates = peakOpen = 0 # Counters for the stats
+    goalNode = None
+    while len(queue):
+        node = queue.pop() # The node with the lowest f-score (and the highest g among those)
+        if node.g > seen[node.state] >> 2: # A cheaper path to this state was found after this entry was pushed, so it is stale.
+            continue
+        if node.state == goal: # A solution has been found
+            goalNode = node
+            break
+        expanded += 1
+        state, blank, g = node.state, node.blank, node.g + 1
+        for cell, move in zip(neighbours[blank], moves[blank]): # The cells the empty tile can move to
+            generated += 1
+            tile = (state >> (bits * cell)) & mask # The tile that slides into the empty cell
+            child = state ^ (tile << (bits * cell)) ^ (tile << (bits * blank)) # Swap the tile and the empty cell
+            if g < (seen.get(child, (g + 1) << 2) >> 2): # Only push the child if this is the cheapest path found to its state.
+                seen[child] = g << 2 | move
+                h = update(node.h, state, child, tile, cell, blank)
+                queue.push(g + h, g, Node(child, cell, g, h))
+            else:
+                duplicates += 1
+        if queue.size > peakOpen:
+            peakOpen = queue.size
+        if len(seen) > limit: # Over the budget: free the memory and go on with IDA*
+            bound = min(queue.lowestF(), node.g + node.h) # The node just expanded is not in the queue anymore
+            if stats is not None:
+                stats.add(expanded, generated, duplicates, peakOpen, len(seen))
+                stats.addPhase('search', time.perf_counter() - begin)
+            queue = seen = None
+            return idaStarSearch(shape, start, heuristic.heuristic if stats is not None else heuristic, stats, bound)
+    if stats is not None:
+        stats.add(expanded, generated, duplicates, peakOpen, len(seen))
+        stats.addPhase('search', time.perf_counter() - begin)
+    if goalNode is None:
+        return None
+    begin = time.perf_counter()
+    path = traceMoves(shape, seen, start, goal, goalNode.blank) # Trace the solution back by undoing the moves
+    if stats is not None:
+        stats.addPhase('trace', time.perf_counter() - begin)
+    return path
+
+
+def idaStarSearch(shape, start, heuristic=None, stats=None, bound=0, maxBound=None):
+    '''
+    This function implements the IDA* (iterative deepening A*) search algorithm.
+    It takes a PuzzleShape, a packed start state and a heuristic object (the Manhattan distance if it is None) and returns the move string from the start state to the goal state.
+    If a SearchStats object is given, the counters of all the iterations are added to it (duplicates are the moves back to the previous cell,
+    peakOpen is the deepest path), with the time of each iteration as the phases 'iteration 1', 'iteration 2', ...
+    Each iteration is a depth-first search that cuts off the nodes whose f-value is above a bound; the next bound is the smallest f-value that was cut off.
+    The first bound is the heuristic of the start state, or the bound parameter if it is larger and known to be at most the solution cost.
+    If maxBound is given the search stops with None once the bound would go past it, which proves that no solution has at most maxBound moves.
+    The search works on a single state which is changed in place by a move and changed back by the same XOR after the subtree is explored,
+    and it never moves the empty tile back to the cell it just left. Only the cells of the empty tile along the current path are stored.
+    The start state must be solvable (solvePuzzle checks it with isSolvable), otherwise the bound grows forever.
+    Time complexity: O(b^d), where b is the branching factor and d is the depth of the solution.
+    Space complexity: O(d) Linear in the depth of the solution.
+    '''
+    if heuristic is None:
+        heuristic = ManhattanHeuristic(shape)
+    if stats is not None:
+        heuristic = TimedHeuristic(heuristic, stats)
+    bits, mask, goal = shape.bits, shape.mask, shape.goal
+    neighbours, update = shape.neighbours, heuristic.update
+    state = start # The single state changed in place by the search
+    path = [] # Cells of the empty tile after each move of the current path
+    h = heuristic.estimate(start)
+    bound = max(h, bound) # The first bound
+    expanded = generated = duplicates = deepest = 0 # Counters for the stats
+
+    def search(blank, previous, g, h):
+        '''
+        This function searches the subtree below the current state, where the empty tile is on blank, came from previous, and g moves were made.
+        It returns FOUND when the goal is reached, otherwise the smallest f-value above the bound in the subtree.
+        '''
+        nonlocal state, expanded, generated, duplicates, deepest
+        f = g + h
+        if f > bound: # Cut off: this node is deeper than the current bound allows
+            return f
+        if state == goal:
+            return FOUND
+        expanded += 1
+        if g > deepest:
+            deepest = g
+        minimum = INFINITY
+        for cell in neighbours[blank]:
+            if cell == previous: # Moving the empty tile back would undo the last move
+                duplicates += 1
+                continue
+            generated += 1
+            tile = (state >> (bits * cell)) & mask # The tile that slides into the empty cell
+            change = (tile << (bits * cell)) ^ (tile << (bits * blank))
+            childH = update(h, state, state ^ change, tile, cell, blank)
+            state ^= change # Move
+            path.append(cell)
+            t = search(cell, blank, g + 1, childH)
+            if t == FOUND:
+                return FOUND
+            path.pop()
+            state ^= change # Unmove
+            if t < minimum:
+                minimum = t
+        return minimum
+
+    blank = shape.findBlank(start)
+    iteration = 0
+    while True:
+        begin = time.perf_counter()
+        t = search(blank, -1, 0, h)
+        if stats is not None:
+            iteration += 1
+            stats.addPhase('iteration %d' % iteration, time.perf_counter() - begin)
+        if t == FOUND:
+            break
+        bound = t # Next iteration with the smallest f-value that was cut off
+        if maxBound is not None and bound > maxBound:
+            if stats is not None:
+                stats.add(expanded, generated, duplicates, deepest + 1)
+            return None
+    if stats is not None:
+        stats.add(expanded, generated, duplicates, deepest + 1)
+    return shape.moveString(blank, path)
+
+
+def lowestIndex(counts):
+    '''
+    This function returns the lowest index of a non-zero count in a list of counts, or INFINITY if every count is 0.
+    Time complexity: O(n) Linear in the length of the list.
+    Space complexity: O(1) Constant.
+    '''
+    for index, count in enumerate(counts):
+        if count:
+            return index
+    return INFINITY
+
+
+def bidirectionalSearch(shape, start, heuristic=None, stats=None):
+    '''
+    This function implements bidirectional A* in the form of the MM algorithm ("meet in the middle"): a forward search from the start state
+    with the given heuristic (the Manhattan distance if it is None) and a backward search from the goal state with the same heuristic towards the start state.
+    Only the Manhattan distance and the linear conflicts can be measured to another state than the goal (their towards method), the backward search
+    of the walking distance and the pattern databases uses TargetManhattanHeuristic, so it expands many more nodes than A* with these heuristics.
+    The priority 2g+1 also keeps each search from pruning with a strong heuristic, so MM expands more nodes than A* even with 'linear' in both directions.
+    A node is queued by its priority max(f, 2g+1) instead of f, so neither search goes past the middle of an optimal path before the other one gets there,
+    and each step expands the node of lowest priority of both open lists.
+    Every generated child is looked up in the seen dictionary of the other search, and a match gives a path through that state; the cost of the best one is kept as best.
+    The lowest priority, the lowest f of each open list, and the lowest g of both plus 1 are lower bounds of the cost of the solutions not found yet.
+    All the solutions of a sliding puzzle have the same parity, so the search stops as soon as best is at most one more than the largest of these bounds,
+    and the path is optimal.
+    It returns the move string from the start state to the goal state, or None if there is no solution.
+    If a SearchStats object is given, the counters of both searches are added to it, with the time of the 'search' phase.
+    Time complexity: O(b^d) in the worst case, it never expands a node deeper than d/2 with an f below d.
+    Space complexity: O(b^d) in the worst case, for the seen dictionaries of both searches.
+    '''
+    if heuristic is None:
+        heuristic = ManhattanHeuristic(shape)
+    if start == shape.goal:
+        return ''
+    begin = time.perf_counter()
+    backwardHeuristic = heuristic.towards(start) if hasattr(heuristic, 'towards') else TargetManhattanHeuristic(shape, start)
+    if stats is not None:
+        heuristic, backwardHeuristic = TimedHeuristic(heuristic, stats), TimedHeuristic(backwardHeuristic, stats)
+    bits, mask = shape.bits, shape.mask
+    neighbours, moves = shape.neighbours, shape.moves
+    searches = [] # The forward and the backward search: open list, seen dictionary (g<<2|move), heuristic update, and counts of the f and g values in the open list
+    for root, rootHeuristic in ((start, heuristic), (shape.goal, backwardHeuristic)):
+        h = rootHeuristic.estimate(root)
+        queue = BucketQueue()
+        queue.push(max(h, 1), 0, Node(root, shape.findBlank(root), 0, h))
+        fCount = [0] * (h + 1)
+        fCount[h] = 1
+        searches.append((queue, {root: 0}, rootHeuristic.update, fCount, [1]))
+    (forwardQueue, forwardSeen, _, forwardF, forwardG), (backwardQueue, backwardSeen, _, backwardF, backwardG) = searches
+    best = INFINITY # Cost of the best path found so far
+    meet = None # State where the best path goes from one search to the other
+    expanded = generated = duplicates = peakOpen = 0 # Counters for the stats
+
+    while len(forwardQueue) and len(backwardQueue):
+        forwardPriority, backwardPriority = forwardQueue.lowestF(), backwardQueue.lowestF()
+        bound = max(min(forwardPriority, backwardPriority), lowestIndex(forwardF), lowestIndex(backwardF),
+                    lowestIndex(forwardG) + lowestIndex(backwardG) + 1)
+        if best <= bound + 1: # No other solution can be cheaper, the next one would cost best-2
+            break
+        queue, seen, update, fCount, gCount = searches[0 if forwardPriority <= backwardPriority else 1]
+        other = backwardSeen if seen is forwardSeen else forwardSeen
+        node = queue.pop()
+        fCount[node.g + node.h] -= 1
+        gCount[node.g] -= 1
+        if node.g > seen[node.state] >> 2: # A cheaper path to this state was found after this entry was pushed, so it is stale.
+            continue
+        expanded += 1
+        state, blank, g = node.state, node.blank, node.g + 1
+        for cell, move in zip(neighbours[blank], moves[blank]):
+            generated += 1
+            tile = (state >> (bits * cell)) & mask
+            child = state ^ (tile << (bits * cell)) ^ (tile << (bits * blank))
+            if g < (seen.get(child, (g + 1) << 2) >> 2):
+                seen[child] = g << 2 | move
+                if child in other and g + (other[child] >> 2) < best: # The two searches meet in this state
+                    best = g + (other[child] >> 2)
+                    meet = child
+                h = update(node.h, state, child, tile, cell, blank)
+                queue.push(max(g + h, 2 * g + 1), g, Node(child, cell, g, h))
+                while len(fCount) <= g + h:
+                    fCount.append(0)
+                fCount[g + h] += 1
+                if len(gCount) <= g:
+                    gCount.append(0)
+                gCount[g] += 1
+            else:
+                duplicates += 1
+        if forwardQueue.size + backwardQueue.size > peakOpen:
+            peakOpen = forwardQueue.size + backwardQueue.size
+    if stats is not None:
+        stats.add(expanded, generated, duplicates, peakOpen, len(forwardSeen) + len(backwardSeen))
+        stats.addPhase('search', time.perf_counter() - begin)
+    if meet is None:
+        return None
+    # The forward moves up to the meeting state, then the backward moves from the goal to it undone in reverse order.
+    blank = shape.findBlank(meet)
+    towardsMeet = traceMoves(shape, backwardSeen, shape.goal, meet, blank)
+    return traceMoves(shape, forwardSeen, start, meet, blank) + ''.join(MOVES[MOVES.index(move) ^ 2] for move in reversed(towardsMeet)) # ^ 2 is the opposite move
+
+
+def anytimeSearch(shape, start, heuristic=None, stats=None, weights=DEFAULT_WEIGHTS, deadline=None):
+    '''
+    This function implements anytime repairing A* (ARA*). It is a generator that yields (moves, bound) each time it finds a better solution or a smaller bound:
+    the move string from the start state to the goal state and a bound on its cost, at most bound times the optimal cost.
+    Each search is a weighted A* with the priority g + weight*h, which goes straight for the goal and expands far fewer nodes than A* when the weight is above 1.
+    The searches reuse each other's work: the states whose g dropped after they were expanded wait in incons for the next weight,
+    and only the states of the open list and incons are searched again. The bound is the smaller of the weight and the solution cost divided by
+    the lowest g + h of these states, a lower bound of the optimal cost. The last weight should be 1, where the solution is optimal and the bound is 1.
+    deadline is a time.time() value: once a solution was found, the search stops after the deadline.
+    The start state must be solvable. If a SearchStats object is given, the counters are added to it, with the time of the search of each weight as a phase.
+    Time complexity: O(b^d) for the last weight, the first solutions are found much faster.
+    Space complexity: O(b^d). The algorithm keeps track of all visited states.
+    '''
+    if heuristic is None:
+        heuristic = ManhattanHeuristic(shape)
+    if stats is not None:
+        heuristic = TimedHeuristic(heuristic, stats)
+    bits, mask, goal = shape.bits, shape.mask, shape.goal
+    neighbours, moves, update = shape.neighbours, shape.moves, heuristic.update
+    seen = {start: 0} # g<<2|move of the cheapest path found so far to each generated state
+    waiting = {start: Node(start, shape.findBlank(start), 0, heuristic.estimate(start))} # The open list and incons: the states to expand, and their latest node
+    expanded = generated = duplicates = peakOpen = 0 # Counters for the stats
+    best = bestBound = INFINITY # Cost and bound of the last solution
+
+    try: # The counters are added even when the caller stops reading the solutions early
+        for weight in weights:
+            begin = time.perf_counter()
+            scaled = round(weight * WEIGHT_SCALE)
+            queue = BucketQueue() # The open list with the priorities of this weight, (g + weight*h) * WEIGHT_SCALE
+            for node in waiting.values():
+                queue.push(node.g * WEIGHT_SCALE + scaled * node.h, node.g, node)
+            opened, incons, closed = waiting, {}, set() # States in the open list, states whose g dropped after they were closed, states expanded by this search
+            timedOut = False
+            while len(queue) and queue.lowestF() < ((seen[goal] >> 2) * WEIGHT_SCALE if goal in seen else INFINITY): # Stop when no priority is below the goal's
+                node = queue.pop()
+                if opened.get(node.state) is not node: # Replaced by a cheaper node, or already expanded
+                    continue
+                del opened[node.state]
+                closed.add(node.state)
+                expanded += 1
+                if deadline is not None and best < INFINITY and expanded % 1024 == 0 and time.time() > deadline:
+                    timedOut = True
+                    break
+                state, blank, g = node.state, node.blank, node.g + 1
+                for cell, move in zip(neighbours[blank], moves[blank]):
+                    generated += 1
+                    tile = (state >> (bits * cell)) & mask
+                    child = state ^ (tile << (bits * cell)) ^ (tile << (bits * blank))
+                    if g < (seen.get(child, (g + 1) << 2) >> 2):
+                        seen[child] = g << 2 | move
+                        h = update(node.h, state, child, tile, cell, blank)
+                        childNode = Node(child, cell, g, h)
+                        if child in closed: # Expanded by this search already: expanded again by the next one
+                            incons[child] = childNode
+                        else:
+                            opened[child] = childNode
+                            queue.push(g * WEIGHT_SCALE + scaled * h, g, childNode)
+                    else:
+                        duplicates += 1
+                if len(opened) > peakOpen:
+                    peakOpen = len(opened)
+            if stats is not None:
+                stats.addPhase('weight %g' % weight, time.perf_counter() - begin)
+            waiting = {**opened, **incons}
+            if goal in seen:
+                cost = seen[goal] >> 2
+                lowest = min((node.g + node.h for node in waiting.values()), default=cost) # A lower bound of the optimal cost
+                bound = min(weight, cost / lowest) if lowest else 1
+                if cost < best or bound < bestBound: # A better solution, or a proof that the last one is closer to optimal
+                    best, bestBound = cost, bound
+                    yield traceMoves(shape, seen, start, goal, shape.goalBlank), bound
+            if timedOut or (deadline is not None and best < INFINITY and time.time() > deadline):
+                break
+    finally:
+        if stats is not None:
+            stats.add(expanded, generated, duplicates, peakOpen, len(seen))
+
+
+def solvePuzzle(startState, mode='astar', heuristic='manhattan', stats=None, maxNodes=None, timeLimit=None):
+    '''
+    This function solves the puzzle from the given start state, given as a 2D list of any N x M size.
+    The mode parameter selects the search algorithm: 'astar' for A*, 'idastar' for IDA*, 'bidirectional' for bidirectional A*,
+    'parallel' for A* spread over all the cores (see parallelAStar.py), 'anytime' for anytime repairing A*,
+    or 'table' for a walk down the complete distance table of distanceTable.py (only for boards of up to 9 cells,
+    larger boards raise a ValueError unless their table file was built with externalSearch.buildTableFile).
+    The heuristic parameter is the name of the heuristic, see makeHeuristic. If a SearchStats object is given, the search adds its counters to it,
+    with the time of the 'prepare' phase (checking the board and loading the heuristic) and the depth of the solution.
+    The mode 'bidirectional' is slower than A* with every heuristic stronger than the Manhattan distance: the backward search uses the Manhattan distance
+    with 'walking' and 'pdb', and even with 'linear' in both directions it expands about three times as many nodes as A* on a 40-move 15-Puzzle.
+    maxNodes bounds the number of states A* keeps in memory, past it the search goes on with IDA* (see aStarSearch).
+    With the mode 'anytime' the best solution found by anytimeSearch within timeLimit seconds is returned (the optimal one if timeLimit is None).
+    It returns the path from the start state to the goal state as a PuzzlePath, which reads like a list of 2D lists, or None if a solution is not found.
+    A malformed board raises a ValueError (see validateBoard), and an unsolvable board returns None right away without searching.
+    Time complexity: O(b^d). The time complexity is the same as the selected search.
+    Space complexity: O(b^d) for A* and bidirectional A*, O(d) for IDA* and the returned path.
+    '''
+    begin = time.perf_counter()
+    validateBoard(startState)
+    if not isSolvable(startState): # Half of the boards can never reach the goal state, no need to search them
+        return None
+    shape = getShape(len(startState), len(startState[0])) # The tables of this board shape
+    start = shape.pack(startState)
+    if mode in ('astar', 'idastar', 'bidirectional', 'anytime'):
+        heuristicObject = makeHeuristic(shape, heuristic)
+    if stats is not None:
+        stats.addPhase('prepare', time.perf_counter() - begin)
+    if mode == 'astar':
+        path = aStarSearch(shape, start, heuristicObject, stats, maxNodes)
+    elif mode == 'idastar':
+        path = idaStarSearch(shape, start, heuristicObject, stats)
+    elif mode == 'bidirectional':
+        path = bidirectionalSearch(shape, start, heuristicObject, stats)
+    elif mode == 'anytime':
+        deadline = None if timeLimit is None else time.time() + timeLimit
+        path = None
+        for path, bound in anytimeSearch(shape, start, heuristicObject, stats, deadline=deadline):
+            pass # Keep the last and best solution
+    elif mode == 'parallel':
+        from parallelAStar import parallelAStarSearch # Imported here because parallelAStar.py imports this module
+        path = parallelAStarSearch(shape, start, heuristic, stats=stats)
+    elif mode == 'table':
+        from distanceTable import loadDistanceTable, tableSearch # Imported here because distanceTable.py imports this module
+        begin = time.perf_counter()
+        path = tableSearch(shape, start, loadDistanceTable(shape))
+        if stats is not None:
+            stats.addPhase('search', time.perf_counter() - begin)
+    else:
+        raise ValueError("Unknown search mode: " + str(mode))
+    if path is None:
+        return None
+    if stats is not None:
+        stats.depth = len(path)
+    return PuzzlePath(shape, start, path) # The boards are only unpacked into 2D lists when the path is read.
+
+
+def solvePuzzleAnytime(startState, heuristic='manhattan', timeLimit=None, weights=DEFAULT_WEIGHTS, stats=None):
+    '''
+    This function is a generator that streams better and better solutions of the start state given as a 2D list, see anytimeSearch.
+    It yields (path, bound) with path a PuzzlePath and bound the factor by which its cost may be above the optimal cost, and stops after timeLimit seconds
+    once a solution has been found. An unsolvable board yields nothing, a malformed board raises a ValueError.
+    Time complexity: O(b^d) for the last weight.
+    Space complexity: O(b^d).
+    '''
+    validateBoard(startState)
+    if not isSolvable(startState):
+        return
+    shape = getShape(len(startState), len(startState[0]))
+    start = shape.pack(startState)
+    deadline = None if timeLimit is None else time.time() + timeLimit
+    for moves, bound in anytimeSearch(shape, start, makeHeuristic(shape, heuristic), stats, weights, deadline):
+        if stats is not None:
+            stats.depth = len(moves)
+        yield PuzzlePath(shape, start, moves), bound
+
+
+def printBoard(state):
+    '''
+    This function prints a puzzle board given as a 2D list, aligning the columns for tiles with two digits.
+    Time complexity: O(s) Linear.
+    Space complexity: O(1) Constant.
+    '''
+    width = len(str(len(state) * len(state[0]) - 1)) # Number of digits of the largest tile
+    for row in state:
+        print(' '.join(str(value).rjust(width) for value in row))
+
+
+def main():
+    '''
+    The main function solves a 15-Puzzle (4x4) instance with IDA* and prints the solution.
+    Time complexity: O(b^d)
+    Space complexity: O(d)
+    '''
+    startState = [[5, 15, 8, 7], [1, 0, 2, 3], [4, 9, 11, 14], [13, 6, 10, 12]] # Set the initial state of the puzzle
+    path = solvePuzzle(startState, mode='idastar') # Solve the puzzle and get the solution path
+    print("Solution found!")
+    print("Number of moves:", len(path) - 1)
+    print("Moves of the empty tile:", path.moves)
+    for state in path:
+        printBoard(state)
+        print("*********")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,72 +1,44 @@
 from typing import List
 
+from dancingLinks import sudokuMatrix
+from sudokuSolver import SudokuState, boardToCells, cellsToBoard
+
 
 class Solution:
     # define a function to solve Sudoku problem that takes in 2D list of strings and returns None
-    def solveSudoku(self, board: List[List[str]]) -> None:
-        # create sets of numbers 1 through 9 for each row, column and boxes
-        rows = [set(str(i) for i in range(1, 10)) for _ in range(9)]
-        cols = [set(str(i) for i in range(1, 10)) for _ in range(9)]
-        boxes = [set(str(i) for i in range(1, 10)) for _ in range(9)]
+    # backend='dlx' solves it as an exact cover problem with Dancing Links instead of backtracking (see dancingLinks.py)
+    def solveSudoku(self, board: List[List[str]], backend='backtrack') -> None:
+        if backend not in ('backtrack', 'dlx'):
+            raise ValueError("Unknown Sudoku backend: " + str(backend))
+        if backend == 'dlx':
+            # the rows of the exact cover matrix are the placements cell*9 + digit-1, the givens are already selected
+            matrix = sudokuMatrix(boardToCells(board))
+            solutions = matrix.search()
+            if solutions:
+                # the search only returns the placements of the empty cells, the givens stay where they are
+                for placement in solutions[0]:
+                    cell, d = divmod(placement, 9)
+                    board[cell // 9][cell % 9] = str(d + 1)
+            else:
+                print("No solution found.")
+            print("Number of link updates:", matrix.updates)
+            return
+        # convert the board to a flat list of 81 ints (0 for an empty cell), the search only works on this list
+        # the state keeps the 9-bit mask of the candidates of every empty cell (its domain), digit d is the bit 1 << (d-1),
+        # and records every change on a trail, so a wrong guess is undone by going back to a mark of the trail
+        state = SudokuState(boardToCells(board))
         steps = [0]  # initialize step counter
 
-        # iterate through the board
-        for i in range(9):
-            for j in range(9):
-                # if cell is not empty then remove its value from the corresponding row column and box sets
-                if board[i][j] != '.':
-                    num = int(board[i][j])
-                    rows[i].remove(str(num))
-                    cols[j].remove(str(num))
-                    # calculate index of the set in boxes.
-                    boxes[(i//3)*3+j//3].remove(str(num))
-                    # (i//3)*3 rounds down the row index i to the nearest multiple of 3,
-                    # and adds j//3 to calculate the column offset within that row
-
-    # define a recursive function to backtrack and solve the Sudoku puzzle
-        def backtrack(board, i=0, j=0):
-            steps[0] += 1  # increment step counter
-
-            # if we reach the end of the board, return True
-            if i == 9:
-                return True
-          # compute the indices of the next cell to fill
-            # checks if we are at the end of a row  (i.e., column index is 8)
-            next_i = i+1 if j == 8 else i
-            # If we are at the end of the row, it moves to the next row by incrementing i by 1.
-            # Otherwise, next_i remains the same as i.
-            # This ensures that if j is at the end of a row (i.e., it is 8), the value of next_j will be 0, which corresponds to the first column of the next row.
-            next_j = (j+1) % 9
-            # If j is not at the end of the row, next_j will be the next column in the same row.
-
-            # if the current cell is not empty, move on to the next cell
-            if board[i][j] != '.':
-                return backtrack(board, next_i, next_j)
-
-        # try all possible values for the current cell that satisfy the constraints
-            for num in rows[i] & cols[j] & boxes[(i//3)*3+j//3]:
-                # fill the current cell with the value num
-                board[i][j] = str(num)
-                # remove num from the corresponding row, column, and box sets
-                rows[i].remove(str(num))
-                cols[j].remove(str(num))
-                boxes[(i//3)*3+j//3].remove(str(num))
-                # recursively call backtrack to fill the next cell
-                if backtrack(board, next_i, next_j):
-                    return True
-                # if we can't find a solution, backtrack by adding the removed value back to the sets
-                rows[i].add(str(num))
-                cols[j].add(str(num))
-                boxes[(i//3)*3+j//3].add(str(num))
-                # reset the current cell to empty
-                board[i][j] = '.'
-            # if we've tried all possible values and haven't found a solution, return False
-            return False
-    # call the backtrack function on the input board to solve the Sudoku puzzle
-        backtrack(board)
+        # propagate the givens, then search: the state always fills the empty cell with the fewest candidates next (and among those the one with the most empty peers),
+        # places each of its digits in turn together with every single it leads to, and undoes every change made since the mark of a guess that fails
+        # the solution is then copied back into the rows of the board
+        if state.propagate() and state.search(steps):
+            for i, row in enumerate(cellsToBoard(state.cells)):
+                board[i][:] = row
+        else:
+            print("No solution found.")
         print("Number of steps:", steps[0])
 
-
 board = [["5", "3", ".", ".", "7", ".", ".", ".", "."],
          ["6", ".", ".", "1", "9", "5", ".", ".", "."],
          [".", "9", "8", ".", ".", ".", ".", "6", "."],
@@ -84,62 +56,30 @@ for row in board:
 
 """
 Solution:
-We can solve this problem by using the backtracking algorithm. We will fill the Sudoku board row by row, and for each empty cell, we will try all the possible digits that can be placed in that cell. If we find a digit that satisfies the Sudoku rules, we will move on to the next empty cell. If we cannot find a digit that satisfies the rules, we will backtrack and try a different digit for the previous empty cell.
+We can solve this problem by using the backtracking algorithm. For each empty cell, we try the digits that can still be placed in that cell. If a digit satisfies the Sudoku rules, we move on to the next empty cell. If no digit does, we backtrack and try a different digit for the previous cell.
 
-We can represent the Sudoku board as a 2D list of characters. We will define a helper function that takes the current row and column and returns True if we can place a digit in that cell that satisfies the Sudoku rules, and False otherwise. This function will check the current row, current column, and current 3x3 sub-box to see if the digit we are trying to place already exists in any of these locations.
+To solve the Sudoku problem efficiently, we use the backtracking algorithm with constraint propagation techniques. The algorithm recursively tries digits in the empty cells until a valid solution is found or all possibilities are exhausted. Constraint propagation reduces the search space by eliminating impossible values for cells based on the constraints of the puzzle.
 
-Then, we will define the main function that will use the backtracking algorithm to fill the Sudoku board. The main function will iterate over each cell in the board, and if the cell is empty, it will try to place a digit in that cell. If the digit placement is successful, it will move on to the next cell. If the digit placement is not successful, it will backtrack and try a different digit for the previous cell
+The time complexity of the backtracking algorithm is exponential, with a worst-case time complexity of O(9^(n^2)) for a completely empty puzzle. In practice, the propagation solves most puzzles with very few guesses, often none at all.
 
-To solve the Sudoku problem efficiently, we can use the backtracking algorithm with constraint propagation techniques. This algorithm recursively tries digits in the empty cells until a valid solution is found or all possibilities are exhausted. Constraint propagation techniques are used to reduce the search space by eliminating impossible values for cells based on the constraints of the puzzle.
+The solveSudoku function takes a partially-filled Sudoku board as input and fills in the remaining empty cells in place. With backend='dlx' it solves the puzzle as an exact cover problem with Dancing Links instead (see dancingLinks.py), and any other backend than 'backtrack' or 'dlx' raises a ValueError.
 
-The time complexity of the backtracking algorithm is exponential, but we can reduce the search space by using constraint propagation techniques. One such technique is called "elimination," where we eliminate possible values for cells based on the constraints of the puzzle.
-The algorithm first creates sets for the rows, columns, and boxes, containing all possible digits for each. It then eliminates digits based on the existing values in the board. The backtrack function recursively tries digits for each empty cell until a valid solution is found or all possibilities are exhausted. It first checks if the current cell is already filled, and if so, moves on to the next cell. Otherwise, it tries all possible digits for the current cell that satisfy the constraints of the puzzle. If a digit leads to a valid solution, the algorithm returns True, and the puzzle is solved. Otherwise, the algorithm backtracks and tries a different digit until all possibilities are exhausted.
+The State of the Search:
 
-Using the constraint propagation techniques reduces the search space and allows the algorithm to find the solution faster. The time complexity of the algorithm depends on the number of empty cells in the puzzle, with a worst-case time complexity of O(9^(n^2)) for a completely empty puzzle. However, in practice, the algorithm can solve most Sudoku puzzles quickly, even those with only a few empty cells.
-The solveSudoku function takes a partially-filled Sudoku board as input and attempts to fill in the remaining empty cells with valid values. The function uses a combination of constraint propagation and backtracking search to achieve this.
+The board is converted into a flat list of 81 ints, 0 for an empty cell, and wrapped in a SudokuState (see sudokuSolver.py). The state keeps the domain of every empty cell: the 9-bit mask of the digits it can still take, where digit d is the bit 1 << (d-1). It also keeps the mask of the digits missing from each row, column and box, and the empty cells sorted by their number of candidates. A digit given twice in a row, column or box raises a ValueError.
 
-Constraint Propagation:
+Every change to the state is recorded on a trail. state.mark() returns the current end of the trail, and state.undo(mark) takes back every change made since, so a wrong guess costs only what it changed.
 
-The algorithm starts by initializing three sets, rows, cols, and boxes, each containing the digits 1 to 9. These sets represent the possible digits that can be placed in each row, column, and box of the Sudoku board.
+Constraint Propagation:
 
-Next, the algorithm loops over each cell of the input board, and if the cell is not empty (i.e., contains a digit), it removes that digit from the corresponding row, column, and box sets. This step is a form of constraint propagation since it narrows down the possible values that can be placed in the empty cells based on the values that have already been placed in the board.
+state.assign(cell, bit) places a digit and removes it from the domains of the 20 peers of the cell. state.propagate() then fills every cell that is left with a single candidate (a naked single), and places every digit that is left with a single cell in a row, column or box (a hidden single). Both return False as soon as a cell or a digit has no place left. The givens are propagated once before the search starts.
 
 Backtracking Search:
 
-After the constraint propagation step, the algorithm starts the backtracking search by calling the backtrack function. This function takes the partially-filled board as input and a set of indices i and j that represent the current cell being filled.
-
-The backtrack function uses a recursive depth-first search to try out different values in the current cell and move on to the next cell. For each empty cell, it tries out all possible values that are valid based on the remaining values in the corresponding row, column, and box sets.
-
-If a valid value is found for the current cell, the function updates the corresponding row, column, and box sets to reflect the new value, and then moves on to the next empty cell. If no valid value is found for the current cell, the function backtracks to the previous cell and tries a different value.
-
-If the algorithm successfully fills in all empty cells, it returns True, indicating that a valid solution has been found. Otherwise, it returns False, indicating that no solution was found.
+The backtracking is state.search(steps) of SudokuState, which prints nothing and counts its calls in steps. It asks state.pick() for the next cell: the empty cell with the fewest candidates, and among those the one with the most empty peers. pick() returns -1 when every cell is filled, which means the puzzle is solved. Otherwise the candidates of the cell are tried lowest digit first. Each one is assigned and propagated, and the search goes on recursively. If that fails, the state is undone back to the mark taken before the guess, and the next candidate is tried. If no candidate works, the search returns False to the previous cell.
 
 Printing the Result:
 
-Finally, after the solveSudoku function completes, the resulting board is printed out using a simple for loop that prints each row of the board on a separate line.
-
-Here's what each line of the code does:
-
-from typing import List: This line imports the List data type from the typing module. It is used later to define the input parameter type for the solveSudoku function.
-
-class Solution:: This line defines a class named Solution.
-
-def solveSudoku(self, board: List[List[str]]) -> None:: This line defines a method named solveSudoku that takes in a 2D list of strings (board) and returns None. The self parameter refers to the instance of the class.
-
-5-7. These lines initialize 3 sets of digits (1-9) to represent the possible values for each row, column, and box. They are stored in rows, cols, and boxes, respectively.
-
-9-12. These lines iterate through the entire board and remove any existing numbers from the corresponding row, column, and box sets.
-
-14-31. This is the main recursive function that solves the Sudoku puzzle using backtracking. It takes in the current board state and the current i and j indices. If i is equal to 9, it means the function has reached the end of the board and returns True.
-
-The function first calculates the next indices (next_i and next_j) depending on the current indices. If the current cell already has a number, it moves to the next cell.
-
-Otherwise, it loops through the intersection of the possible values for the current cell's row, column, and box sets. For each possible value, it updates the board, removes the value from the corresponding sets, and recursively calls the function with the updated board and indices.
-
-If the function returns True, it means a solution has been found, so the function returns True to the previous call. Otherwise, it backtracks by restoring the previous state of the board and the sets and moves on to the next possible value.
-
-32-36. If the function reaches this point, it means there is no solution, so it returns False.
-
-38-53. This code initializes the input board and solves it using the solveSudoku method of the Solution class. Then, it prints the board line by line to display the solved Sudoku puzzle.
+If a solution is found, it is copied back into the rows of the board; otherwise "No solution found." is printed, together with the number of steps. The board is then printed row by row.
 
 """
@@ -0,0 +1,167 @@
+'''
+This module solves many Sudoku puzzles at once, spread over a pool of worker processes, for files of millions of puzzles.
+The puzzles are read from a file (or the standard input), one per line in the common 81-character format: the digits in row-major order,
+'.' or '0' for an empty cell. Only the first field of a line is read, so files of "puzzle,solution" pairs work as well.
+Blank lines and lines starting with # are skipped.
+The lines are sent to the workers in chunks and the solutions are written to the standard output in the same format, in the order of the input,
+as soon as they are ready. A puzzle that has no solution or cannot be read gets a comment line instead, "# line 3: ...", so the output has one line per puzzle.
+The puzzles are solved silently with the propagation and most-constrained-cell search of sudokuSolver.SudokuState, or with Dancing Links (see dancingLinks.py).
+The number of puzzles per second and a histogram of the time of each puzzle are written to the standard error at the end.
+Usage: python sudokuBatch.py [FILE] [--backend backtrack] [--workers 8] [--chunk 256] [--output FILE]
+'''
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from batchPool import readChunks, solveChunks
+from sudokuSolver import SudokuState
+
+# Upper bound in seconds of the first bucket of the latency histogram, each next bucket is twice as wide.
+HISTOGRAM_START = 1e-5
+
+# Number of buckets of the latency histogram, the last one holds every slower puzzle.
+HISTOGRAM_BUCKETS = 20
+
+# Digit of each character of the one-line format, 0 for an empty cell.
+DIGITS = {'.': 0, '0': 0, **{str(digit): digit for digit in range(1, 10)}}
+
+
+def parsePuzzle(line):
+    '''
+    This function parses the first field of a line in the 81-character format into a flat list of 81 ints, 0 for an empty cell.
+    It raises a ValueError if the field is not 81 digits or dots.
+    Time complexity: O(n^2) Linear in the number of cells.
+    Space complexity: O(n^2)
+    '''
+    field = line.replace(',', ' ').split()[0]
+    if len(field) != 81:
+        raise ValueError("Expected 81 cells, found %d" % len(field))
+    try:
+        return [DIGITS[char] for char in field]
+    except KeyError as error:
+        raise ValueError("Unexpected character %s" % error) from None
+
+
+def solvePuzzleCells(cells, backend='backtrack'):
+    '''
+    This function returns the solution of a flat board as a flat list of 81 ints, or None if it has none, with the given backend.
+    It raises a ValueError if a digit is given twice in a row, column or box.
+    Time complexity: O(9^n) Exponential at worst.
+    Space complexity: O(n^2)
+    '''
+    if backend == 'dlx':
+        from dancingLinks import solveCells # Imported here because the workers of the other backend never need it
+        solutions = solveCells(cells)
+        return solutions[0] if solutions else None
+    state = SudokuState(cells)
+    return state.cells if state.propagate() and state.search() else None
+
+
+def solveChunk(chunk, backend='backtrack'):
+    '''
+    This function solves a list of (line number, line) pairs in a worker process and returns the list of their results,
+    (line number, output line, seconds), the output line being the solution or a comment with the reason there is none.
+    Time complexity: O(c * 9^n) for c lines, O(c * n^2) for most of them.
+    Space complexity: O(c) for the results.
+    '''
+    results = []
+    for number, line in chunk:
+        begin = time.perf_counter()
+        try:
+            solution = solvePuzzleCells(parsePuzzle(line), backend)
+            output = ''.join(map(str, solution)) if solution else "# line %d: no solution" % number
+        except ValueError as error:
+            output = "# line %d: %s" % (number, error)
+        results.append((number, output, time.perf_counter() - begin))
+    return results
+
+
+def solveBatch(lines, backend='backtrack', workers=None, chunkSize=256):
+    '''
+    This function solves the puzzles of an iterable of lines across a pool of worker processes and yields their results (see solveChunk) in input order.
+    Only a few chunks per worker are submitted ahead of the results, so the input is read as it is consumed and huge files never sit in memory.
+    Time complexity: O(p * 9^n / w) at worst for p puzzles and w workers.
+    Space complexity: O(w * c) for the chunks in flight.
+    '''
+    if backend not in ('backtrack', 'dlx'):
+        raise ValueError("Unknown Sudoku backend: " + str(backend))
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as executor:
+        yield from solveChunks(executor, solveChunk, readChunks(lines, chunkSize), workers, backend)
+
+
+def latencyBucket(seconds):
+    '''
+    This function returns the bucket of the latency histogram of a time: 0 up to HISTOGRAM_START, then one bucket per doubling.
+    Time complexity: O(1) Constant.
+    Space complexity: O(1) Constant.
+    '''
+    bucket = 0
+    bound = HISTOGRAM_START
+    while seconds > bound and bucket < HISTOGRAM_BUCKETS - 1:
+        bucket += 1
+        bound *= 2
+    return bucket
+
+
+def printHistogram(histogram, file=sys.stderr):
+    '''
+    This function prints the non-empty buckets of a latency histogram with their upper bound, count, share and a bar.
+    Time complexity: O(HISTOGRAM_BUCKETS)
+    Space complexity: O(1) Constant.
+    '''
+    total = sum(histogram)
+    largest = max(histogram)
+    for bucket, count in enumerate(histogram):
+        if count:
+            bound = "> %9.3f ms" % (HISTOGRAM_START * 2 ** (bucket - 1) * 1000) if bucket == HISTOGRAM_BUCKETS - 1 \
+                else "<= %8.3f ms" % (HISTOGRAM_START * 2 ** bucket * 1000)
+            print("%s %10d %6.2f%% %s" % (bound, count, 100 * count / total, '#' * max(1, 40 * count // largest)), file=file)
+
+
+def main():
+    '''
+    The main function reads the command line, solves the puzzles of the input file and writes one solution per line,
+    then the throughput and the latency histogram on the standard error.
+    Time complexity: O(p * 9^n / w)
+    Space complexity: O(w * c)
+    '''
+    parser = argparse.ArgumentParser(description='Solve many Sudoku puzzles in parallel.')
+    parser.add_argument('file', nargs='?', help='file with one puzzle of 81 characters per line, the standard input if not given')
+    parser.add_argument('--backend', default='backtrack', choices=['backtrack', 'dlx'], help='backtracking with constraint propagation, or Dancing Links')
+    parser.add_argument('--workers', type=int, help='number of worker processes, the number of CPUs if not given')
+    parser.add_argument('--chunk', type=int, default=256, help='number of puzzles sent to a worker at a time')
+    parser.add_argument('--output', help='file of the solutions, the standard output if not given')
+    args = parser.parse_args()
+
+    lines = open(args.file) if args.file else sys.stdin
+    output = open(args.output, 'w') if args.output else sys.stdout
+    begin = time.time()
+    solved = failed = 0
+    histogram = [0] * HISTOGRAM_BUCKETS
+    slowest = 0.0
+    for number, line, seconds in solveBatch(lines, args.backend, args.workers, args.chunk):
+        output.write(line + '\n')
+        if line.startswith('#'):
+            failed += 1
+        else:
+            solved += 1
+        histogram[latencyBucket(seconds)] += 1
+        slowest = max(slowest, seconds)
+    if args.file:
+        lines.close()
+    if args.output:
+        output.close()
+    elapsed = time.time() - begin
+    total = solved + failed
+    print("Solved %d, failed %d in %.2f seconds (%.1f puzzles per second)" % (solved, failed, elapsed, total / elapsed if elapsed else 0.0), file=sys.stderr)
+    if total:
+        print("Time per puzzle in a worker (slowest %.3f ms):" % (slowest * 1000), file=sys.stderr)
+        printHistogram(histogram)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,182 +3,351 @@ This project presents a solution to the Sudoku Solver problem.
 The program is designed to fill empty cells in complex Sudoku puzzles.
 By strictly adhering to the fundamental rules of Sudoku, the project ensures that 
 Each digit from 1 to 9 is precisely and uniquely placed in every row, column, and 3x3 sub-box of the grid.
-The program uses backtracking, forward check and arc consistency.
+The program uses backtracking on the most constrained cell, with forward checking and the propagation of naked and hidden singles.
 @ Sena Kılınç 20191701033
 '''
 from typing import List
-from collections import deque
+
+# Candidates are kept as 9-bit masks: digit d (1 to 9) is the bit 1 << (d-1), and a mask with every bit set means every digit is still possible.
+ALL_DIGITS = 0x1FF
+
+# Number of digits in each of the 512 masks (the popcount), so the size of a domain is one list lookup.
+BIT_COUNT = [bin(mask).count('1') for mask in range(512)]
+
+# Digit of each single-bit mask. The candidates of a mask are visited lowest bit first: bit = mask & -mask, digit = DIGIT_OF_BIT[bit], mask ^= bit.
+DIGIT_OF_BIT = [0] * 257
+for digit in range(1, 10):
+    DIGIT_OF_BIT[1 << (digit - 1)] = digit
+
+# Row, column and box of each of the 81 cells of the flat board, cell = row*9 + column.
+ROW_OF = [cell // 9 for cell in range(81)]
+COL_OF = [cell % 9 for cell in range(81)]
+BOX_OF = [(cell // 27) * 3 + (cell % 9) // 3 for cell in range(81)]
+
+# The 20 peers of each cell: the other cells of its row, column and box.
+PEERS = [sorted({other for other in range(81) if other != cell and
+                 (ROW_OF[other] == ROW_OF[cell] or COL_OF[other] == COL_OF[cell] or BOX_OF[other] == BOX_OF[cell])}) for cell in range(81)]
+
+# The 27 units (9 rows, 9 columns and 9 boxes) as lists of cells, and the 3 units of each cell: its row, 9 + its column and 18 + its box.
+UNITS = [[cell for cell in range(81) if ROW_OF[cell] == i] for i in range(9)] + \
+        [[cell for cell in range(81) if COL_OF[cell] == i] for i in range(9)] + \
+        [[cell for cell in range(81) if BOX_OF[cell] == i] for i in range(9)]
+UNITS_OF = [(ROW_OF[cell], 9 + COL_OF[cell], 18 + BOX_OF[cell]) for cell in range(81)]
+
+# Number of degrees (empty peers, 0 to 20) per number of candidates in the keys of SudokuState.
+DEGREES = 21
+
+# Old domain of the trail entries that record an assignment instead of a change of domain.
+ASSIGNED = -1
+
+
+def boardToCells(board: List[List[str]]) -> List[int]:
+    '''
+    This function converts a board of strings ('.' for an empty cell) into the flat list of 81 small ints used by the solvers, 0 for an empty cell.
+    Time Complexity: O(n^2) Quadratic, one step per cell.
+    Space Complexity: O(n^2) Quadratic.
+    '''
+    return [0 if value == '.' else int(value) for row in board for value in row]
+
+
+def cellsToBoard(cells: List[int]) -> List[List[str]]:
+    '''
+    This function converts a flat list of 81 ints back into a board of strings, '.' for an empty cell.
+    Time Complexity: O(n^2) Quadratic.
+    Space Complexity: O(n^2) Quadratic.
+    '''
+    return [[str(digit) if digit else '.' for digit in cells[i * 9:(i + 1) * 9]] for i in range(9)]
+
+
+class SudokuState:
+    '''
+    This class is the state of a search on a flat board: the cells, the domain of every cell (the 9-bit mask of the digits it can still take),
+    the mask of the digits missing from each of the 27 units, and the empty cells sorted for the most-constrained-cell heuristic.
+    Every change is recorded on a trail, as (cell, old domain) or (cell, ASSIGNED), so undo(mark) restores the state as it was at mark()
+    in time proportional to what changed since.
+    Each empty cell has a key, its number of candidates times DEGREES plus 20 minus its number of empty peers, so the lowest key is the cell
+    with the fewest candidates and, among those, the most empty peers. The cells are kept in one bucket per key and a bit mask tells
+    which buckets are not empty, so the next cell is found with one bit trick.
+    assign only removes the digit from the domains of the peers and queues the work it makes: the cells left with one candidate (naked singles)
+    and the units that lost a candidate digit, which may have one cell left for it (hidden singles). propagate then applies both rules until nothing changes.
+    '''
+
+    def __init__(self, cells: List[int]):
+        '''
+        The __init__ method builds the domains, the keys and the buckets of a flat board, and queues the singles of the givens for propagate.
+        It raises a ValueError if a digit is given twice in a row, column or box.
+        Time Complexity: O(n^2) Quadratic, for the cells and their peers.
+        Space Complexity: O(n^2) Quadratic.
+        '''
+        self.cells = cells
+        self.missing = [ALL_DIGITS] * 27 # Digits not placed yet in each unit
+        for cell, digit in enumerate(cells):
+            if digit:
+                bit = 1 << (digit - 1)
+                if any(not self.missing[unit] & bit for unit in UNITS_OF[cell]):
+                    raise ValueError("The digit %d is given twice in the row, column or box of cell (%d, %d)" % (digit, ROW_OF[cell], COL_OF[cell]))
+                for unit in UNITS_OF[cell]:
+                    self.missing[unit] &= ~bit
+        self.domains = [0] * 81 # Candidates of each empty cell
+        self.degrees = [0] * 81 # Empty peers of each empty cell
+        self.trail = [] # (cell, old domain) or (cell, ASSIGNED) for every change, in order
+        self.singles = [] # Cells whose domain was left with one digit
+        self.hidden = [] # (unit, bit) for every digit that lost a candidate cell in a unit
+        self.buckets = [set() for _ in range(10 * DEGREES)] # Empty cells of each key
+        self.nonEmpty = 0 # Bit k is set when the bucket of key k is not empty
+        self.keys = [0] * 81 # Key of each empty cell
+        for cell in range(81):
+            if not cells[cell]:
+                row, col, box = UNITS_OF[cell]
+                self.domains[cell] = self.missing[row] & self.missing[col] & self.missing[box]
+                self.degrees[cell] = sum(1 for peer in PEERS[cell] if not cells[peer])
+                self.insert(cell)
+                if BIT_COUNT[self.domains[cell]] <= 1: # No candidate is found by propagate as well
+                    self.singles.append(cell)
+        for unit in range(27): # Every missing digit of every unit may already have a single place
+            digits = self.missing[unit]
+            while digits:
+                bit = digits & -digits
+                digits ^= bit
+                self.hidden.append((unit, bit))
+
+    def insert(self, cell):
+        '''
+        This method puts an empty cell in the bucket of its key.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        '''
+        key = BIT_COUNT[self.domains[cell]] * DEGREES + 20 - self.degrees[cell]
+        self.keys[cell] = key
+        self.buckets[key].add(cell)
+        self.nonEmpty |= 1 << key
+
+    def remove(self, cell):
+        '''
+        This method takes a cell out of its bucket.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        '''
+        key = self.keys[cell]
+        self.buckets[key].discard(cell)
+        if not self.buckets[key]:
+            self.nonEmpty &= ~(1 << key)
+
+    def mark(self):
+        '''
+        This method returns the current position of the trail, to undo everything done after it.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        '''
+        return len(self.trail)
+
+    def eliminate(self, cell, bit):
+        '''
+        This method removes the digit of a single-bit mask from the domain of an empty cell, and queues the singles it may create.
+        It returns False if the domain becomes empty.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        '''
+        domain = self.domains[cell]
+        if not domain & bit:
+            return True
+        self.trail.append((cell, domain))
+        domain ^= bit
+        self.domains[cell] = domain
+        self.remove(cell)
+        self.insert(cell)
+        if BIT_COUNT[domain] <= 1:
+            if not domain:
+                return False
+            self.singles.append(cell) # Naked single
+        for unit in UNITS_OF[cell]:
+            self.hidden.append((unit, bit)) # The digit may have a single place left in the units of the cell
+        return True
+
+    def assign(self, cell, bit):
+        '''
+        This method places the digit of a single-bit mask in an empty cell and removes it from the domains of the empty peers.
+        It returns False if a peer is left without a candidate. The singles it creates are only applied by propagate.
+        Time Complexity: O(1), for the 20 peers.
+        Space Complexity: O(1)
+        '''
+        self.trail.append((cell, ASSIGNED))
+        self.remove(cell)
+        self.cells[cell] = DIGIT_OF_BIT[bit]
+        for unit in UNITS_OF[cell]:
+            self.missing[unit] &= ~bit
+        for peer in PEERS[cell]: # Every empty peer loses an empty peer first, so undo can give it back to all of them even if an elimination fails
+            if not self.cells[peer]:
+                self.remove(peer)
+                self.degrees[peer] -= 1
+                self.insert(peer)
+        for peer in PEERS[cell]:
+            if not self.cells[peer] and not self.eliminate(peer, bit):
+                self.singles.clear() # The work queued so far is dropped with the assignment
+                self.hidden.clear()
+                return False
+        return True
+
+    def propagate(self):
+        '''
+        This method applies the naked-single rule (a cell with one candidate takes it) and the hidden-single rule (a digit with one candidate cell
+        in a unit goes there) to the queued work, and to the work they make, until nothing is left. It returns False on a contradiction:
+        a cell without candidates, or a digit missing from a unit with no cell left for it. The queues are empty afterwards either way.
+        Time Complexity: O(n^2) at most per call, proportional to the changes made.
+        Space Complexity: O(n^2) for the queues.
+        '''
+        cells, domains, singles, hidden = self.cells, self.domains, self.singles, self.hidden
+        while singles or hidden:
+            if singles:
+                cell = singles.pop()
+                if cells[cell]: # Filled since it was queued
+                    continue
+                if not domains[cell] or not self.assign(cell, domains[cell]):
+                    break
+            else:
+                unit, bit = hidden.pop()
+                if not self.missing[unit] & bit: # Placed since it was queued
+                    continue
+                place = -1
+                for cell in UNITS[unit]:
+                    if not cells[cell] and domains[cell] & bit:
+                        if place >= 0: # At least two places left
+                            break
+                        place = cell
+                else:
+                    if place < 0 or not self.assign(place, bit):
+                        break
+        else:
+            return True
+        singles.clear()
+        hidden.clear()
+        return False
+
+    def undo(self, mark):
+        '''
+        This method undoes every change recorded on the trail after the given mark, latest first.
+        Time Complexity: O(k) for the k changes undone.
+        Space Complexity: O(1)
+        '''
+        trail = self.trail
+        while len(trail) > mark:
+            cell, domain = trail.pop()
+            if domain == ASSIGNED:
+                bit = 1 << (self.cells[cell] - 1)
+                self.cells[cell] = 0
+                for unit in UNITS_OF[cell]:
+                    self.missing[unit] |= bit
+                for peer in PEERS[cell]:
+                    if not self.cells[peer]:
+                        self.remove(peer)
+                        self.degrees[peer] += 1
+                        self.insert(peer)
+                self.insert(cell)
+            else:
+                self.remove(cell)
+                self.domains[cell] = domain
+                self.insert(cell)
+
+    def pick(self):
+        '''
+        This method returns the empty cell with the fewest candidates (with the most empty peers among those), or -1 when every cell is filled.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        '''
+        if not self.nonEmpty:
+            return -1
+        key = (self.nonEmpty & -self.nonEmpty).bit_length() - 1 # Lowest key with a cell
+        return next(iter(self.buckets[key]))
+
+    def search(self, steps=None, report=None):
+        '''
+        This method fills the empty cells by backtracking on the most constrained cell (see pick), once the givens are propagated.
+        Each candidate of the cell is tried lowest digit first, assigned and propagated, and a failed guess is undone back to its mark.
+        It returns True with the solution in cells, or False if there is none, and prints nothing: every call is counted in steps[0] if steps is given,
+        and report() is called after every guess that propagates without a contradiction, for the callers that show the search.
+        Time Complexity: O(9^(n^2)) Exponential at worst.
+        Space Complexity: O(n^2) for the recursion and the trail.
+        '''
+        if steps is not None:
+            steps[0] += 1
+        cell = self.pick()
+        if cell == -1: # Every cell is filled
+            return True
+        candidates = self.domains[cell]
+        while candidates:
+            bit = candidates & -candidates # Lowest candidate digit
+            candidates ^= bit
+            mark = self.mark()
+            if self.assign(cell, bit) and self.propagate():
+                if report is not None:
+                    report()
+                if self.search(steps, report):
+                    return True
+            self.undo(mark)
+        return False
+
 
 class Solution:
-    def solveSudoku(self, board: List[List[str]]) -> None:
+    def solveSudoku(self, board: List[List[str]], backend='backtrack') -> None:
         '''
-        This method solves the Sudoku puzzle using backtracking algorithm.
-        This method also make sures that the same number doesn't appear twice in the same row, column, or box.   
+        This method solves the Sudoku puzzle using backtracking algorithm with constraint propagation.
+        This method also make sures that the same number doesn't appear twice in the same row, column, or box.
+        The board is converted to a flat list of ints once, the search runs on it, and the solution is copied back into the board at the end.
+        The givens are propagated first, which solves most newspaper puzzles without any guess. A ValueError is raised if a digit is given twice in a row, column or box.
+        With backend='dlx' the puzzle is solved as an exact cover problem with Dancing Links instead (see dancingLinks.py), whose time does not depend on how the puzzle was made.
         Time Complexity: O(9^(n^2)) Exponential. The number of possible combinations for each cell is 9, and there are a total of n^2 cells on the Sudoku board. 
         Space Complexity: O(n^2) Quadratic.
         '''
-        rows = [] # Initialize an empty list for rows
-        cols = [] # Initialize an empty list for columns
-        boxes = [] # Initialize an empty list for boxes
-        steps = [0] # Initialize a list with a single element, 0, for steps
-
-        for i in range(9): # Populate the rows, cols, and boxes lists
-            rowSet = set() # Create an empty set for each row
-            colSet = set() # Create an empty set for each column
-            boxSet = set() # Create an empty set for each box
-            
-            for j in range(1, 10):# Populate each set with numbers 1 to 9 as strings
-                rowSet.add(str(j)) # Add the number to the row set
-                colSet.add(str(j)) # Add the number to the column set
-                boxSet.add(str(j)) # Add the number to the box set
-            # Append the populated sets to the respective lists
-            rows.append(rowSet) # Append the row set to the rows list
-            cols.append(colSet) # Append the column set to the cols list
-            boxes.append(boxSet) # Append the box set to the boxes list
-        # These two for loops iterate over each cell in the 9x9 Sudoku board.
-        for i in range(9):
-            for j in range(9):
-                # This if statement checks whether the current cell is already filled in or not. If it's not empty (i.e., it contains a number), the code inside the if block is executed.                
-                if board[i][j] != '.':
-                    num = int(board[i][j]) # This line converts the string representation of the number in the current cell to an integer.
-                    # These three lines remove the number that was just placed in the current cell from the corresponding sets of possible values for the row, column, and 3x3 box that contain the cell.                 
-                    rows[i].remove(str(num))
-                    cols[j].remove(str(num))
-                    boxes[(i//3)*3+j//3].remove(str(num)) # calculate index of the set in boxes and remove the number that was just placed
-        
+        if backend not in ('backtrack', 'dlx'):
+            raise ValueError("Unknown Sudoku backend: " + str(backend))
+        cells = boardToCells(board) # Flat board of ints, 0 for an empty cell
+
         print("Initial puzzle:")
         self.printBoard(board) # Print the initial puzzle board
         print()
-        # Start the Sudoku-solving recursion
-        if self.backtrack(board, rows, cols, boxes, steps): # If solution is found
+        if backend == 'dlx':
+            from dancingLinks import solveCells # Imported here because dancingLinks.py imports this module
+            solutions = solveCells(cells)
+            solved = bool(solutions)
+            if solved:
+                cells = solutions[0]
+        else:
+            state = SudokuState(cells) # The flat board with the domains and the order of the empty cells
+            steps = [0] # Initialize a list with a single element, 0, for steps
+            # Start the Sudoku-solving recursion once the givens are propagated
+            solved = self.propagate(state) and self.backtrack(state, steps)
+        if solved: # If solution is found
+            for i, row in enumerate(cellsToBoard(cells)): # Copy the solution back into the rows of the board
+                board[i][:] = row
             print("Solution of Sudoku:") 
             self.printBoard(board)
         else: # If no solution is found
             print("No solution found.")
 
-    def backtrack(self, board, rows, cols, boxes, steps, i=0, j=0):
+    def backtrack(self, state, steps):
         '''
-        This function implements the backtracking algorithm to solve the Sudoku puzzle recursively. 
-        It takes two optional parameters i and j that represent the current row and column being filled in the board. It updates the self.board and self.steps instance variables for every step.
+        This function implements the backtracking algorithm to solve the Sudoku puzzle recursively, and counts every call in steps.
+        The next cell is always the most constrained one: the empty cell with the fewest candidates, and among those the one with the most empty peers (see SudokuState).
+        Each candidate of the cell is tried lowest digit first and propagated; a failed guess is undone from the trail of the state.
+        The search itself is SudokuState.search, this function prints the board after every step of it.
         Time Complexity: O(9^(n)) Exponential. The number of possible combinations for each cell is 9, and there are a total of n cells on the Sudoku board. 
         Space Complexity: O(n^2) Quadratic.
         '''
-        steps[0] += 1 # Increase to keep track of the number of steps taken to solve the puzzle
-
-        if i == 9: # If the value of i is equal to 9, that means we have reached the end of the puzzle and return True.
-            return True
-
-        nextRow = i+1 if j == 8 else i # If j is 8, nextRow will be i+1 to move to the next row, otherwise it will be the same as i.
-        nextColumn = (j+1) % 9  # nextColumn is calculation ensures that j stays within the bounds of the puzzle
-        # If the value at self.board[i][j] is not '.', that means it is already filled and we move to the next cell by calling backtrack(nextRow, nextColumn) recursively.
-        if board[i][j] != '.':
-            return self.backtrack(board, rows, cols, boxes, steps, nextRow, nextColumn)
-        
-        # This loop iterates over the intersection of self.rows[i], self.cols[j], and self.boxes[(i//3)*3+j//3], which contains all the possible numbers that can be placed in the cell (i,j).
-        for num in rows[i] & cols[j] & boxes[(i//3)*3+j//3]:
-            self.forwardChecking(i, j, num, rows, cols, boxes) # Apply forward checking by removing the number from sets
-            board[i][j] = str(num)  # Assign the number to the current cell
-
+        def report():
             print("Step", steps[0])
-            self.printBoard(board) # print on the board
-
-            if self.arcConsistency(board, rows, cols, boxes):# Apply arc consistency by updating sets
-              if self.backtrack(board, rows, cols, boxes, steps, nextRow, nextColumn): # This calls backtrack recursively on the next cell and returns True if a solution is found
-                  return True
-
-            # If no solution is found, this code adds the previously removed number back to the row, column, and box, and clears the cell (i,j) for the next iteration.
-            rows[i].add(str(num)) # Adding back to row
-            cols[j].add(str(num)) # Adding back to column
-            boxes[(i//3)*3+j//3].add(str(num)) # Adding back to box
-            board[i][j] = '.' # clears the cell 
-         # Returns False if no solution is found.
-        return False
-    
-    def forwardChecking(self, i, j, num, rows, cols, boxes):
-        """
-        This function performs forward checking after assigning a number num to a cell at position (i, j) in the Sudoku board.
-        Time Complexity: O(1)
-        Space Complexity: O(1)
-        """
-        # Remove the selected number from the sets of corresponding row, column, and box
-        rows[i].discard(str(num))
-        cols[j].discard(str(num))
-        boxes[(i // 3) * 3 + j // 3].discard(str(num))
+            self.printBoard(cellsToBoard(state.cells)) # print on the board
 
-    def arcConsistency(self, board, rows, cols, boxes):
+        return state.search(steps, report)
+    
+    def propagate(self, state):
         """
-        This function implements the arc consistency algorithm.
-        It ensures that all variables (empty cells) in the Sudoku board satisfy the constraints of the game.
-        Time Complexity: O(n^2)
+        This function propagates the constraints of the game with the naked-single and hidden-single rules, see SudokuState.propagate.
+        Only the peers and units touched by the last changes are looked at. It returns False if the constraints cannot be satisfied anymore.
+        Time Complexity: O(n^2) at most, proportional to the changes made.
         Space Complexity: O(n^2)
         """
-        # Perform arc consistency propagation
-        queue = deque()
-
-        # Add all the empty variables (represented as (i, j) tuples) to the queue
-        for i in range(9):
-            for j in range(9):
-                if board[i][j] == ".":
-                    queue.append((i, j))
-
-        visited = set()  # Keep track of visited variables
-
-        while queue:
-            i, j = queue.popleft()  # Get the next variable from the queue
-            visited.add((i, j))  # Mark variable as visited
-
-            num = board[i][j]  # Current number assigned to the variable (i, j)
-
-            # Propagate constraints to affected variables in the same row
-            for column in range(9):
-                if column != j and board[i][column] == ".":
-                    # Remove the current number from the domain of the affected variable
-                    if not self.removeFromDomain(i, column, rows, num): # bactrack
-                        return False
-                    if (i, column) not in visited:# Avoid processing visited variables
-                        queue.append((i, column))
-                        visited.add((i, column))# Mark variable as visited
-
-            # Propagate constraints to affected variables in the same column
-            for row in range(9):
-                if row != i and board[row][j] == ".":
-                    # Remove the current number from the domain of the affected variable  
-                    if not self.removeFromDomain(row, j, cols, num):# bactrack
-                        return False
-                    if (row, j) not in visited:# Avoid processing visited variables
-                        queue.append((row, j))
-                        visited.add((row, j))# Mark variable as visited
-
-            # Propagate constraints to affected variables in the same box
-            boxRow = (i // 3) * 3  # Starting row index of the current box
-            boxCol = (j // 3) * 3  # Starting column index of the current box
-
-            # Iterate over the rows within the same box
-            for row in range(boxRow, boxRow + 3):
-                # Iterate over the columns within the same box
-                for column in range(boxCol, boxCol + 3):
-                    if (row != i or column != j) and board[row][column] == ".":
-                        # Remove the current number from the domain of the affected variable
-                        if not self.removeFromDomain(row, column, boxes, num): # bactrack
-                            return False
-                        if (row, column) not in visited: # Avoid processing visited variables
-                            queue.append((row, column))
-                            visited.add((row, column))# Mark variable as visited
-        return True # if constraint propagation is valid
-
-    def removeFromDomain(self, i, j, domain, num):
-        """
-        This function removes a number num from the domain of a variable at position (i, j) in the Sudoku board
-        Time Complexity: O(1)
-        Space Complexity: O(1)
-        """
-        # Remove the selected number from the domain of the variable at position (i, j)
-        if num in domain[i]:
-            domain[i].remove(num) # Remove the number from the domain of the specified cell
-            if len(domain[i]) == 0:
-                return False # If the domain becomes empty, return False to indicate a conflict
-        return True # Return True to indicate successful removal or non-empty domain
-    
+        return state.propagate()
+
     def printBoard(self, board: List[List[str]]) -> None:
         '''
         The function iterates through each cell in the board once to print its value.
@@ -1,82 +1,61 @@
 from typing import List
 
+from sudokuSolver import ALL_DIGITS, BOX_OF, COL_OF, DIGIT_OF_BIT, ROW_OF, boardToCells, cellsToBoard
+
 
 class Solution:
     # The Solution class represents a Sudoku solver
 
     def __init__(self, board: List[List[str]]):
         self.board = board
-        self.rows = []
-        self.cols = []
-        self.boxes = []
+        self.cells = boardToCells(board)  # flat list of 81 ints, 0 for an empty cell
+        self.rows = [ALL_DIGITS] * 9  # 9-bit masks of the digits still missing from each row
+        self.cols = [ALL_DIGITS] * 9
+        self.boxes = [ALL_DIGITS] * 9
         self.steps = [0]
 
-        for i in range(9):
-            row_set = set()
-            col_set = set()
-            box_set = set()
-
-            for j in range(1, 10):
-                row_set.add(str(j))
-                col_set.add(str(j))
-                box_set.add(str(j))
+        for cell, digit in enumerate(self.cells):
+            if digit:
+                bit = 1 << (digit - 1)
+                self.rows[ROW_OF[cell]] &= ~bit
+                self.cols[COL_OF[cell]] &= ~bit
+                self.boxes[BOX_OF[cell]] &= ~bit
 
-            self.rows.append(row_set)
-            self.cols.append(col_set)
-            self.boxes.append(box_set)
-
-    def backtrack(self, i=0, j=0):
+    def backtrack(self, cell=0):
         self.steps[0] += 1
 
-        if i == 9:
+        while cell < 81 and self.cells[cell]:
+            cell += 1
+        if cell == 81:
+            for i, row in enumerate(cellsToBoard(self.cells)):  # copy the solution back into the board
+                self.board[i][:] = row
             return True
 
-        nextRow = i + 1 if j == 8 else i
-        nextColumn = (j + 1) % 9
-
-        if self.board[i][j] != '.':
-            return self.backtrack(nextRow, nextColumn)
+        row, col, box = ROW_OF[cell], COL_OF[cell], BOX_OF[cell]
+        candidates = self.rows[row] & self.cols[col] & self.boxes[box]
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            self.cells[cell] = DIGIT_OF_BIT[bit]
+            self.rows[row] &= ~bit
+            self.cols[col] &= ~bit
+            self.boxes[box] &= ~bit
 
-        for num in self.rows[i] & self.cols[j] & self.boxes[(i // 3) * 3 + j // 3]:
-            if self.available(i, j, num):
-                self.board[i][j] = str(num)
-                self.rows[i].remove(str(num))
-                self.cols[j].remove(str(num))
-                self.boxes[(i // 3) * 3 + j // 3].remove(str(num))
-                
-                print("Step", self.steps[0])
-                self.printBoard()
+            print("Step", self.steps[0])
+            self.printBoard()
 
-                if self.backtrack(nextRow, nextColumn):
-                    return True
+            if self.backtrack(cell + 1):
+                return True
 
-                self.rows[i].add(str(num))
-                self.cols[j].add(str(num))
-                self.boxes[(i // 3) * 3 + j // 3].add(str(num))
-                self.board[i][j] = '.'
+            self.rows[row] |= bit
+            self.cols[col] |= bit
+            self.boxes[box] |= bit
+            self.cells[cell] = 0
 
         return False
 
-    def available(self, row, col, num):
-        for c in range(9):
-            if self.board[row][c] == num:
-                return False
-
-        for r in range(9):
-            if self.board[r][col] == num:
-                return False
-
-        start_row = (row // 3) * 3
-        start_col = (col // 3) * 3
-        for r in range(start_row, start_row + 3):
-            for c in range(start_col, start_col + 3):
-                if self.board[r][c] == num:
-                    return False
-
-        return True
-
     def printBoard(self):
-        for row in self.board:
+        for row in cellsToBoard(self.cells):
             print(row)
         print()
 